@@ -1,56 +1,169 @@
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional, Union
 import pandas as pd
-from .validation import validate_block_model_data
-from .importers import import_block_model_from_csv
-from .exporters import export_block_model_to_csv
+from .validation import validate_block_model_data, subset_validation_report, BlockModelValidationReport
+from .selection import select_blocks, classify_blocks
+from .importers import import_block_model_from_csv, import_block_model_from_parquet_dataset, Bounds
+from .exporters import export_block_model_to_csv, export_block_model_to_parquet_dataset
+from omf_io.utils.pandas_utils import optimize_memory
 
 class BlockModelIO:
     """
     Handles the creation and consumption of block model objects.
     """
 
-    def __init__(self, block_data: pd.DataFrame, model_type: Literal['regular', 'tensor']):
+    def __init__(self, block_data: pd.DataFrame, model_type: Literal['regular', 'tensor'], optimize: bool = False):
         """
         Initialize the BlockModelIO instance.
 
         Args:
             block_data (pandas.DataFrame): The block model data.
             model_type (Literal['regular', 'tensor']): The type of block model.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
         """
-        validate_block_model_data(block_data, model_type)
+        self.validation_report: BlockModelValidationReport = validate_block_model_data(block_data, model_type)
         self.block_data = block_data
         self.model_type = model_type
+        if optimize:
+            self.optimize_memory()
 
     @classmethod
-    def from_csv(cls, csv_file: Path, model_type: Literal['regular', 'tensor']):
+    def from_csv(cls, csv_file: Path, model_type: Literal['regular', 'tensor'], optimize: bool = False, **kwargs):
         """
         Create a BlockModelIO instance from a CSV file.
 
+        The file is read in chunks with compact dtypes inferred from a sample of rows.
+
         Args:
             csv_file (Path): The input CSV file path.
             model_type (Literal['regular', 'tensor']): The type of block model.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
+            **kwargs: Additional arguments for the import function, e.g. `chunksize` or `category_threshold`.
 
         Returns:
             BlockModelIO: An instance of the class.
         """
-        block_data = import_block_model_from_csv(csv_file)
-        return cls(block_data, model_type)
+        block_data = import_block_model_from_csv(csv_file, **kwargs)
+        return cls(block_data, model_type, optimize=optimize)
 
     @classmethod
-    def from_parquet(cls, parquet_file: Path, model_type: Literal['regular', 'tensor']):
+    def from_parquet(cls, parquet_file: Path, model_type: Literal['regular', 'tensor'], optimize: bool = False):
         """
         Create a BlockModelIO instance from a Parquet file.
 
         Args:
             parquet_file (Path): The input Parquet file path.
             model_type (Literal['regular', 'tensor']): The type of block model.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
 
         Returns:
             BlockModelIO: An instance of the class.
         """
         block_data = pd.read_parquet(parquet_file)
-        return cls(block_data, model_type)
+        return cls(block_data, model_type, optimize=optimize)
+
+    @classmethod
+    def from_parquet_dataset(cls, input_dir: Path, model_type: Literal['regular', 'tensor'],
+                             bounds: Optional[Bounds] = None, columns: Optional[list[str]] = None,
+                             max_workers: Optional[int] = None, optimize: bool = False):
+        """
+        Create a BlockModelIO instance from a spatially partitioned Parquet dataset.
+
+        Args:
+            input_dir (Path): The dataset directory.
+            model_type (Literal['regular', 'tensor']): The type of block model.
+            bounds (tuple, optional): The query region as (xmin, xmax, ymin, ymax, zmin, zmax).
+                Only overlapping partitions are read.
+            columns (list[str], optional): The attribute columns to read.
+            max_workers (int, optional): The maximum number of reader threads.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
+
+        Returns:
+            BlockModelIO: An instance of the class.
+        """
+        block_data = import_block_model_from_parquet_dataset(input_dir, bounds=bounds, columns=columns,
+                                                             max_workers=max_workers)
+        return cls(block_data, model_type, optimize=optimize)
+
+    def validate(self, block_size: Optional[tuple[float, float, float]] = None, tolerance: float = 1e-6,
+                 errors: Literal['raise', 'collect'] = 'collect') -> BlockModelValidationReport:
+        """
+        Validate the block model geometry.
+
+        Args:
+            block_size (tuple[float, float, float], optional): The regular (or base tensor) block size.
+                Inferred from the coordinates if None.
+            tolerance (float): The tolerance for grid conformance, as a fraction of the block size.
+            errors (Literal['raise', 'collect']): Whether to raise on invalid geometry, or only report it.
+
+        Returns:
+            BlockModelValidationReport: The validation report, with offending blocks as row positions.
+        """
+        self.validation_report = validate_block_model_data(self.block_data, self.model_type, block_size=block_size,
+                                                           tolerance=tolerance, errors=errors)
+        return self.validation_report
+
+    def select(self, bounds: Optional[Bounds] = None, polygon=None, below=None) -> "BlockModelIO":
+        """
+        Select blocks by bounding box, XY polygon and/or an overlying surface.
+
+        The criteria are combined, so a block must satisfy all of those provided.  The selection of a valid
+        model is not validated again, so it may be empty.
+
+        Args:
+            bounds (tuple, optional): The region (xmin, xmax, ymin, ymax, zmin, zmax), compared to block centroids.
+            polygon (optional): An Nx2 array-like of XY vertices, or a shapely-like Polygon.
+            below (SurfaceIO, optional): A triangulated surface; blocks with centroids below it are selected.
+
+        Returns:
+            BlockModelIO: A new instance holding the selected blocks.
+
+        Raises:
+            ValueError: If the model is not valid and the selected blocks are not valid (or none are selected).
+        """
+        rows = select_blocks(self.block_data, bounds=bounds, polygon=polygon, below=below)
+        if not self.validation_report.is_valid:
+            return self.__class__(self.block_data.iloc[rows], self.model_type)
+        selection = self.__class__.__new__(self.__class__)
+        selection.validation_report = subset_validation_report(self.validation_report, self.block_data, rows)
+        selection.block_data = self.block_data.iloc[rows]
+        selection.model_type = self.model_type
+        return selection
+
+    def classify(self, surface, max_workers: Optional[int] = 1) -> pd.DataFrame:
+        """
+        Classify the blocks as above, below or inside a triangulated surface, by their centroids.
+
+        Args:
+            surface (SurfaceIO): The surface, e.g. topography or a pit shell.
+            max_workers (int, optional): The number of threads intersecting the block columns.
+
+        Returns:
+            pandas.DataFrame: The surface 'elevation' and the 'above', 'below' and 'inside' flags of each block,
+                indexed like the block data.
+        """
+        return classify_blocks(self.block_data, surface, max_workers=max_workers)
+
+    def optimize_memory(self, float_tolerance: Optional[float] = None,
+                        category_threshold: float = 0.5) -> pd.DataFrame:
+        """
+        Reduce the memory footprint of the block attributes in place.
+
+        Integers are downcast, floats are downcast to float32 within the tolerance, and repeated strings and
+        colour tuples are converted to categoricals.
+
+        Args:
+            float_tolerance (float, optional): The maximum absolute error accepted when downcasting floats.
+                If None, floats are only downcast when rounding the float32 values to their decimal precision
+                recovers them exactly.
+            category_threshold (float): The maximum ratio of unique to total values for a categorical.
+
+        Returns:
+            pandas.DataFrame: A report indexed by column with the dtype and bytes before and after.
+        """
+        self.block_data, report = optimize_memory(self.block_data, float_tolerance=float_tolerance,
+                                                  category_threshold=category_threshold)
+        return report
 
     def to_csv(self, output_file: Path):
         """
@@ -68,4 +181,27 @@ class BlockModelIO:
         Args:
             output_file (Path): The output Parquet file path.
         """
-        self.block_data.to_parquet(output_file, index=False)
\ No newline at end of file
+        self.block_data.to_parquet(output_file, index=True)
+
+    def to_parquet_dataset(self, output_dir: Path,
+                           partition_by: Literal['bench', 'tile', 'bench_tile', 'morton'] = 'bench',
+                           bench_height: Optional[float] = None,
+                           tile_size: Optional[Union[float, tuple[float, float]]] = None,
+                           n_partitions: int = 16, row_group_size: int = 100_000) -> Path:
+        """
+        Export the block model data to a spatially partitioned directory of Parquet files.
+
+        Args:
+            output_dir (Path): The output directory.
+            partition_by: The partition scheme - 'bench' (z), 'tile' (XY), 'bench_tile' or 'morton'.
+            bench_height (float, optional): The bench partition height.  If None, each unique z is a bench.
+            tile_size (float | tuple[float, float], optional): The XY tile size for the tile schemes.
+            n_partitions (int): The number of partitions for the 'morton' scheme.
+            row_group_size (int): The maximum number of rows in a Parquet row group.
+
+        Returns:
+            Path: The output directory.
+        """
+        return export_block_model_to_parquet_dataset(self.block_data, output_dir, partition_by=partition_by,
+                                                     bench_height=bench_height, tile_size=tile_size,
+                                                     n_partitions=n_partitions, row_group_size=row_group_size)
\ No newline at end of file
@@ -1,5 +1,14 @@
-import pandas as pd
+import json
 from pathlib import Path
+from typing import Literal, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from omf_io.utils.spatial_encoding import morton_encode
+
+DATASET_METADATA_FILE = '_omf_io_dataset.json'
+
 
 def export_block_model_to_csv(block_data: pd.DataFrame, output_file: Path):
     """Export block model data to a CSV file.
@@ -8,5 +17,104 @@ def export_block_model_to_csv(block_data: pd.DataFrame, output_file: Path):
         block_data (pandas.DataFrame): The block model data.
         output_file (Path): The output CSV file path.
     """
-    # Placeholder implementation
-    block_data.to_csv(output_file, index=False)
\ No newline at end of file
+    block_data.to_csv(output_file, index=isinstance(block_data.index, pd.MultiIndex))
+
+
+def export_block_model_to_parquet_dataset(block_data: pd.DataFrame, output_dir: Path,
+                                          partition_by: Literal['bench', 'tile', 'bench_tile', 'morton'] = 'bench',
+                                          bench_height: Optional[float] = None,
+                                          tile_size: Optional[Union[float, tuple[float, float]]] = None,
+                                          n_partitions: int = 16,
+                                          row_group_size: int = 100_000,
+                                          compression: str = 'snappy') -> Path:
+    """Export block model data to a spatially partitioned directory of Parquet files.
+
+    Each partition is written to its own Parquet file with row-group statistics, and a JSON sidecar
+    records the partition scheme, the index names and the centroid bounds of every partition so that
+    readers can skip partitions that do not overlap a query region.
+
+    Args:
+        block_data (pandas.DataFrame): The block model data, indexed by (x, y, z) centroids.
+        output_dir (Path): The output directory.  Existing partition files in the directory are replaced.
+        partition_by: The partition scheme.  'bench' partitions by z, 'tile' by XY tile, 'bench_tile' by both,
+            and 'morton' splits the blocks into `n_partitions` contiguous ranges of a 3D Morton (Z-order) key.
+        bench_height (float, optional): The height of a bench partition.  If None, each unique z is a bench.
+        tile_size (float | tuple[float, float], optional): The XY tile size.  Required for the tile schemes.
+        n_partitions (int): The number of partitions for the 'morton' scheme.
+        row_group_size (int): The maximum number of rows in a Parquet row group.
+        compression (str): The Parquet compression codec.
+
+    Returns:
+        Path: The output directory.
+    """
+    if 'x' not in block_data.index.names or 'y' not in block_data.index.names or 'z' not in block_data.index.names:
+        raise ValueError("Block model data must have a MultiIndex including the levels ['x', 'y', 'z'].")
+
+    x = block_data.index.get_level_values('x').to_numpy()
+    y = block_data.index.get_level_values('y').to_numpy()
+    z = block_data.index.get_level_values('z').to_numpy()
+    keys = _partition_keys(x, y, z, partition_by, bench_height, tile_size, n_partitions)
+
+    # sort once, then slice each partition from the contiguous runs of equal keys
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    unique_keys, starts = np.unique(sorted_keys, return_index=True)
+    stops = np.append(starts[1:], len(sorted_keys))
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale_file in output_dir.glob('part-*.parquet'):
+        stale_file.unlink()
+
+    partitions = []
+    for i, (key, start, stop) in enumerate(zip(unique_keys, starts, stops)):
+        rows = order[start:stop]
+        file_name = f"part-{i:05d}.parquet"
+        block_data.iloc[rows].to_parquet(output_dir / file_name, index=True, compression=compression,
+                                         row_group_size=row_group_size, write_statistics=True)
+        partitions.append({'file': file_name, 'key': int(key), 'rows': int(stop - start),
+                           'bounds': [float(x[rows].min()), float(x[rows].max()),
+                                      float(y[rows].min()), float(y[rows].max()),
+                                      float(z[rows].min()), float(z[rows].max())]})
+
+    metadata = {'version': 1, 'partition_by': partition_by, 'index': list(block_data.index.names),
+                'columns': list(block_data.columns), 'rows': len(block_data), 'partitions': partitions}
+    with open(output_dir / DATASET_METADATA_FILE, 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+    return output_dir
+
+
+def _partition_keys(x: np.ndarray, y: np.ndarray, z: np.ndarray, partition_by: str,
+                    bench_height: Optional[float], tile_size: Optional[Union[float, tuple[float, float]]],
+                    n_partitions: int) -> np.ndarray:
+    """Calculate an integer partition key for every block."""
+    if len(x) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if partition_by == 'morton':
+        # ordinal ranks are grid indices for both regular and tensor models
+        ranks = [np.unique(v, return_inverse=True)[1] for v in (x, y, z)]
+        codes = morton_encode(*ranks)
+        position = np.empty(len(codes), dtype=np.int64)
+        position[np.argsort(codes, kind='stable')] = np.arange(len(codes))
+        return position * n_partitions // len(codes)
+
+    bench = np.zeros(len(z), dtype=np.int64)
+    if partition_by in ('bench', 'bench_tile'):
+        if bench_height is None:
+            bench = np.unique(z, return_inverse=True)[1].astype(np.int64)
+        else:
+            bench = np.floor((z - z.min()) / bench_height).astype(np.int64)
+    if partition_by == 'bench':
+        return bench
+
+    if partition_by not in ('tile', 'bench_tile'):
+        raise ValueError(f"Unsupported partition scheme: {partition_by}")
+    if tile_size is None:
+        raise ValueError(f"tile_size is required for the '{partition_by}' partition scheme.")
+    tx, ty = (tile_size, tile_size) if np.isscalar(tile_size) else tile_size
+    ix = np.floor((x - x.min()) / tx).astype(np.int64)
+    iy = np.floor((y - y.min()) / ty).astype(np.int64)
+    tile = ix * (iy.max() + 1) + iy
+    return bench * (tile.max() + 1) + tile
@@ -1,14 +1,195 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from pandas.api.types import union_categoricals
+
+from omf_io.blockmodel.exporters import DATASET_METADATA_FILE
+
+Bounds = tuple[float, float, float, float, float, float]
 
-def import_block_model_from_csv(csv_file: Path) -> pd.DataFrame:
+
+def import_block_model_from_csv(csv_file: Path, index_columns: Optional[list[str]] = None,
+                                chunksize: int = 1_000_000, sample_size: int = 100_000,
+                                category_threshold: float = 0.5, **kwargs) -> pd.DataFrame:
     """Import block model data from a CSV file.
 
+    The file is read in chunks.  Column dtypes are inferred from a sample of rows, and each chunk is compacted
+    before the next is read: integers are stored as int32 where they fit, floats as float32 where every value
+    converts back to the same float64 (so the downcast is lossless), and low-cardinality strings as
+    categoricals.  A column is promoted to a wider dtype if a later chunk does not fit.  The index is built
+    once at the end, so peak memory stays close to the size of the result.
+
     Args:
         csv_file (Path): The input CSV file path.
+        index_columns (list[str], optional): The columns that form the index.  Defaults to x, y, z, with
+            dx, dy, dz appended when present (tensor models).
+        chunksize (int): The number of rows read per chunk.
+        sample_size (int): The number of rows used to infer the dtypes.
+        category_threshold (float): String columns with a unique-to-total ratio at or below this value in the
+            sample are read as categoricals.
+        **kwargs: Additional keyword arguments for `pandas.read_csv`.
 
     Returns:
         pandas.DataFrame: The block model data.
     """
-    # Placeholder implementation
-    return pd.read_csv(csv_file)
\ No newline at end of file
+    sample = pd.read_csv(csv_file, nrows=sample_size, **kwargs)
+    if index_columns is None:
+        index_columns = ['x', 'y', 'z'] + (['dx', 'dy', 'dz'] if {'dx', 'dy', 'dz'}.issubset(sample.columns) else [])
+    missing = [col for col in index_columns if col not in sample.columns]
+    if missing:
+        raise ValueError(f"CSV file must contain the index columns {index_columns}. Missing: {missing}")
+
+    targets = {col: _initial_target(sample[col], category_threshold) for col in sample.columns
+               if col not in index_columns}
+    category_columns = {col: 'category' for col, target in targets.items() if target == 'category'}
+    del sample
+
+    index_pieces: dict[str, list] = {col: [] for col in index_columns}
+    pieces: dict[str, list] = {col: [] for col in targets}
+    for chunk in pd.read_csv(csv_file, chunksize=chunksize, dtype=category_columns, **kwargs):
+        for col in index_columns:
+            index_pieces[col].append(chunk[col].to_numpy(dtype=np.float64, copy=True))
+        for col in targets:
+            piece, targets[col] = _compact_column(chunk[col], targets[col])
+            pieces[col].append(piece)
+        del chunk
+
+    # factorize one level at a time, so only one full-length float64 coordinate array exists at once
+    levels, codes = [], []
+    for col in index_columns:
+        level_codes, level_values = pd.factorize(np.concatenate(index_pieces.pop(col)), sort=True)
+        levels.append(level_values)
+        codes.append(level_codes)
+    index = pd.MultiIndex(levels=levels, codes=codes, names=index_columns, verify_integrity=False)
+    del levels, codes
+    columns = {col: _combine_pieces(pieces.pop(col), target) for col, target in targets.items()}
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+_PROMOTION_ORDER = ['int32', 'int64', 'float32', 'float64', 'object']
+
+
+def _initial_target(sample: pd.Series, category_threshold: float) -> str:
+    """Infer the storage dtype of a column from a sample."""
+    if pd.api.types.is_bool_dtype(sample):
+        return 'bool'
+    if pd.api.types.is_integer_dtype(sample):
+        in_range = sample.empty or (sample.min() >= np.iinfo(np.int32).min and sample.max() <= np.iinfo(np.int32).max)
+        return 'int32' if in_range else 'int64'
+    if pd.api.types.is_float_dtype(sample):
+        return 'float32' if _float32_exact(sample.to_numpy(dtype=np.float64)) else 'float64'
+    if sample.dtype == object and len(sample) and sample.nunique() / len(sample) <= category_threshold:
+        return 'category'
+    return 'object'
+
+
+def _float32_exact(values: np.ndarray) -> bool:
+    """True if every float64 value converts to float32 and back unchanged."""
+    return bool(np.array_equal(values.astype(np.float32).astype(np.float64), values, equal_nan=True))
+
+
+def _compact_column(series: pd.Series, target: str) -> tuple[Any, str]:
+    """Compact a chunk of a column to its target dtype, promoting the target if the chunk does not fit."""
+    if target == 'category':
+        return series.array, target
+    if target == 'bool' and pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(copy=True), target
+
+    if target == 'bool':
+        chunk_target = 'object'
+    elif pd.api.types.is_integer_dtype(series):
+        chunk_target = 'int32' if series.empty or (series.min() >= np.iinfo(np.int32).min and
+                                                   series.max() <= np.iinfo(np.int32).max) else 'int64'
+    elif pd.api.types.is_float_dtype(series):
+        chunk_target = 'float32'
+    else:
+        chunk_target = 'object'
+    target = chunk_target if target == 'bool' else max(target, chunk_target, key=_PROMOTION_ORDER.index)
+    if target in ('float32', 'float64') and pd.api.types.is_integer_dtype(series):
+        # integers promoted to float are kept exact
+        target = 'float64'
+
+    if target == 'float32':
+        values = series.to_numpy(dtype=np.float64)
+        if _float32_exact(values):
+            return values.astype(np.float32), target
+        target = 'float64'
+    # copy, so that the piece does not keep the consolidated block of the whole chunk alive
+    return series.to_numpy(dtype=target, copy=True), target
+
+
+def _combine_pieces(pieces: list, target: str) -> Any:
+    """Combine the compacted chunks of a column into a single array of the target dtype.
+
+    Integer pieces combined with float pieces are promoted to float64, where integers up to 2**53 are exact.
+    """
+    if not pieces:
+        return pd.array([], dtype=target)
+    if target == 'category':
+        return union_categoricals(pieces)
+    if target == 'float32' and any(piece.dtype.kind in 'iu' for piece in pieces):
+        target = 'float64'
+    arrays = []
+    while pieces:
+        arrays.append(pieces.pop(0).astype(target, copy=False))
+    return np.concatenate(arrays) if arrays else np.array([], dtype=target)
+
+
+def import_block_model_from_parquet_dataset(input_dir: Path, bounds: Optional[Bounds] = None,
+                                            columns: Optional[list[str]] = None,
+                                            max_workers: Optional[int] = None) -> pd.DataFrame:
+    """Import block model data from a spatially partitioned Parquet dataset.
+
+    Only the partitions whose centroid bounds overlap the query bounds are opened, and within those
+    partitions the row-group statistics are used to skip row groups outside the query.  Partitions are
+    read in parallel threads.
+
+    Args:
+        input_dir (Path): The dataset directory written by `export_block_model_to_parquet_dataset`.
+        bounds (tuple, optional): The query region as (xmin, xmax, ymin, ymax, zmin, zmax), compared against
+            block centroids.  If None, the full dataset is read.
+        columns (list[str], optional): The attribute columns to read.  If None, all columns are read.
+        max_workers (int, optional): The maximum number of reader threads.
+
+    Returns:
+        pandas.DataFrame: The block model data with the index restored.
+    """
+    input_dir = Path(input_dir)
+    metadata_file = input_dir / DATASET_METADATA_FILE
+    if not metadata_file.exists():
+        raise FileNotFoundError(f"Dataset metadata file not found: {metadata_file}")
+    with open(metadata_file, 'r') as f:
+        metadata = json.load(f)
+
+    index_names = metadata['index']
+    partitions = metadata['partitions']
+    filters = None
+    if bounds is not None:
+        xmin, xmax, ymin, ymax, zmin, zmax = bounds
+        partitions = [p for p in partitions if
+                      p['bounds'][0] <= xmax and p['bounds'][1] >= xmin and
+                      p['bounds'][2] <= ymax and p['bounds'][3] >= ymin and
+                      p['bounds'][4] <= zmax and p['bounds'][5] >= zmin]
+        filters = [('x', '>=', xmin), ('x', '<=', xmax),
+                   ('y', '>=', ymin), ('y', '<=', ymax),
+                   ('z', '>=', zmin), ('z', '<=', zmax)]
+        if not partitions:
+            # read the schema only, so that the (empty) result has the expected columns
+            partitions = metadata['partitions'][:1]
+
+    read_columns = None if columns is None else list(index_names) + [c for c in columns if c not in index_names]
+
+    def read_partition(partition: dict) -> pd.DataFrame:
+        return pd.read_parquet(input_dir / partition['file'], columns=read_columns, filters=filters)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(read_partition, partitions))
+
+    block_data = pd.concat(frames) if frames else pd.DataFrame(columns=read_columns or index_names)
+    if list(block_data.index.names) != index_names:
+        block_data = block_data.reset_index(drop=True).set_index(index_names)
+    return block_data
@@ -0,0 +1,118 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from omf_io.utils.geometry import classify_points, points_in_polygon, surface_elevation
+
+
+def select_blocks(block_data: pd.DataFrame, bounds: Optional[tuple[float, float, float, float, float, float]] = None,
+                  polygon=None, below=None) -> np.ndarray:
+    """Select blocks by bounding box, XY polygon and/or an overlying surface.
+
+    Selection works on the index levels and codes rather than the float coordinates of every block.  Bounds
+    are resolved to a range of grid indices per axis by comparing only the unique level values, and a
+    lexsorted index is cut to the contiguous rows of the x range before the remaining axes are tested.  The
+    polygon and surface tests are evaluated once per unique XY column of blocks and gathered to the blocks.
+
+    Args:
+        block_data (pandas.DataFrame): The block model data, indexed by (x, y, z) centroids.
+        bounds (tuple, optional): The region (xmin, xmax, ymin, ymax, zmin, zmax), compared to block centroids.
+        polygon (optional): An Nx2 array-like of XY vertices, or a shapely-like Polygon.
+        below (optional): A triangulated surface (SurfaceIO); blocks with centroids below it are selected.
+
+    Returns:
+        np.ndarray: The positional row indices of the selected blocks, in ascending order.
+    """
+    index = block_data.index
+    if not isinstance(index, pd.MultiIndex) or not {'x', 'y', 'z'}.issubset(index.names):
+        raise ValueError("Block model data must have a MultiIndex including the levels ['x', 'y', 'z'].")
+    axes = [index.names.index(name) for name in ('x', 'y', 'z')]
+
+    # rows of a lexsorted index with x as the first level can be cut to the x range by binary search
+    start, stop = 0, len(index)
+    selected = None
+    if bounds is not None:
+        level_ranges = [_level_range(index.levels[axis], lo, hi) for axis, lo, hi in
+                        zip(axes, bounds[0::2], bounds[1::2])]
+        if axes[0] == 0 and index.levels[0].is_monotonic_increasing and index.is_monotonic_increasing:
+            first_code, last_code = _code_range(level_ranges[0])
+            codes = index.codes[0]
+            # search in the dtype of the codes, to avoid upcasting the whole array
+            start = np.searchsorted(codes, codes.dtype.type(first_code), side='left')
+            stop = max(start, np.searchsorted(codes, codes.dtype.type(last_code), side='right'))
+        selected = np.ones(stop - start, dtype=bool)
+        for axis, level_mask in zip(axes, level_ranges):
+            selected &= _gather(level_mask, index.codes[axis][start:stop])
+
+    if polygon is not None or below is not None:
+        x_values, x_codes = index.levels[axes[0]].to_numpy(dtype=np.float64), index.codes[axes[0]][start:stop]
+        y_values, y_codes = index.levels[axes[1]].to_numpy(dtype=np.float64), index.codes[axes[1]][start:stop]
+        # evaluate each unique XY column once
+        column_codes, columns = pd.factorize(x_codes.astype(np.int64) * len(y_values) + y_codes)
+        column_x = x_values[columns // len(y_values)]
+        column_y = y_values[columns % len(y_values)]
+        column_selected = np.ones(len(columns), dtype=bool)
+        if polygon is not None:
+            column_selected &= points_in_polygon(column_x, column_y, polygon)
+        block_selected = column_selected[column_codes]
+        if below is not None:
+            vertices, faces = below.vertices, below.faces
+            elevation = np.full(len(columns), np.nan)
+            elevation[column_selected] = surface_elevation(column_x[column_selected], column_y[column_selected],
+                                                           vertices, faces)
+            z = index.levels[axes[2]].to_numpy(dtype=np.float64)[index.codes[axes[2]][start:stop]]
+            with np.errstate(invalid='ignore'):
+                block_selected &= z < elevation[column_codes]
+        selected = block_selected if selected is None else selected & block_selected
+
+    if selected is None:
+        return np.arange(len(index))
+    return start + np.flatnonzero(selected)
+
+
+def classify_blocks(block_data: pd.DataFrame, surface, max_workers: Optional[int] = 1) -> pd.DataFrame:
+    """Classify block centroids as above, below or inside a triangulated surface.
+
+    The surface is intersected once per unique XY column of blocks, found from the index codes.
+
+    Args:
+        block_data (pandas.DataFrame): The block model data, indexed by (x, y, z) centroids.
+        surface: A triangulated surface (SurfaceIO).
+        max_workers (int, optional): The number of threads intersecting the columns.
+
+    Returns:
+        pandas.DataFrame: The surface 'elevation' and the 'above', 'below' and 'inside' flags of each block,
+            indexed like the block data.
+    """
+    index = block_data.index
+    if not isinstance(index, pd.MultiIndex) or not {'x', 'y', 'z'}.issubset(index.names):
+        raise ValueError("Block model data must have a MultiIndex including the levels ['x', 'y', 'z'].")
+    axes = [index.names.index(name) for name in ('x', 'y', 'z')]
+    x_values, x_codes = index.levels[axes[0]].to_numpy(dtype=np.float64), index.codes[axes[0]]
+    y_values, y_codes = index.levels[axes[1]].to_numpy(dtype=np.float64), index.codes[axes[1]]
+    column_codes, columns = pd.factorize(x_codes.astype(np.int64) * len(y_values) + y_codes)
+    z = index.levels[axes[2]].to_numpy(dtype=np.float64)[index.codes[axes[2]]]
+    classification = classify_points(x_values[columns // len(y_values)], y_values[columns % len(y_values)], z,
+                                     surface.vertices, surface.faces, column_codes=column_codes,
+                                     max_workers=max_workers)
+    classification.index = index
+    return classification
+
+
+def _level_range(level: pd.Index, lo: float, hi: float) -> np.ndarray:
+    """Flag the unique level values within [lo, hi]."""
+    values = level.to_numpy(dtype=np.float64)
+    return (values >= lo) & (values <= hi)
+
+
+def _code_range(level_mask: np.ndarray) -> tuple[int, int]:
+    """The first and last codes of a contiguous level mask over sorted level values."""
+    flagged = np.flatnonzero(level_mask)
+    return (int(flagged[0]), int(flagged[-1])) if len(flagged) else (0, -1)
+
+
+def _gather(level_mask: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Gather a per-level mask to the blocks, treating missing (-1) codes as unselected."""
+    return np.append(level_mask, False)[codes]
+
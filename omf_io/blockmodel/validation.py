@@ -1,16 +1,271 @@
-from typing import Literal
+from dataclasses import dataclass, field, replace
+from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
 
-def validate_block_model_data(block_data: pd.DataFrame, model_type: Literal['regular', 'tensor']):
+
+@dataclass
+class BlockModelValidationReport:
+    """The outcome of a geometric validation of block model data.
+
+    Offending blocks are reported as positional row indices into the block data.
+    """
+    model_type: str
+    n_blocks: int
+    block_size: tuple[float, float, float]
+    origin: tuple[float, float, float]
+    shape: tuple[int, int, int]
+    off_grid: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    duplicates: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    overlaps: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    missing_fraction: float = 0.0
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no block is off the grid, duplicated or overlapping."""
+        return not (len(self.off_grid) or len(self.duplicates) or len(self.overlaps))
+
+    def summary(self) -> dict:
+        """A JSON-serialisable summary of the report."""
+        return {'model_type': self.model_type, 'n_blocks': self.n_blocks,
+                'block_size': [float(v) for v in self.block_size], 'origin': [float(v) for v in self.origin],
+                'shape': [int(v) for v in self.shape], 'off_grid': len(self.off_grid),
+                'duplicates': len(self.duplicates), 'overlaps': len(self.overlaps),
+                'missing_fraction': float(self.missing_fraction), 'is_valid': self.is_valid}
+
+
+def validate_block_model_data(block_data: pd.DataFrame, model_type: Literal['regular', 'tensor'],
+                              block_size: Optional[tuple[float, float, float]] = None,
+                              tolerance: float = 1e-6,
+                              errors: Literal['raise', 'collect'] = 'raise') -> BlockModelValidationReport:
     """Validate the block model data.
 
+    Regular models are checked for centroids that do not conform to the grid and for duplicate blocks.
+    Tensor models (indexed by x, y, z, dx, dy, dz) are checked for block extents that do not align to the
+    grid of the smallest block size, for duplicate centroids and for overlapping extents.  The fraction of
+    the grid (or bounding box volume) that has no block is reported for both.
+
+    All checks are vectorized.  Per-axis work is done on the unique index level values, and the per-block
+    passes use integer grid keys and hashing rather than row loops.
+
     Args:
         block_data (pandas.DataFrame): The block model data.
+        model_type (Literal['regular', 'tensor']): The type of block model.
+        block_size (tuple[float, float, float], optional): The regular block size, or the base (smallest)
+            block size for a tensor model.  Inferred from the coordinates if None.
+        tolerance (float): The tolerance for grid conformance, as a fraction of the block size.
+        errors (Literal['raise', 'collect']): Whether to raise on invalid geometry, or only collect the
+            offending blocks in the report.
+
+    Returns:
+        BlockModelValidationReport: The validation report.
 
     Raises:
         ValueError: If the data is invalid.
     """
-    # Placeholder implementation
     if block_data.empty:
-        raise ValueError("Block model data cannot be empty.")
\ No newline at end of file
+        raise ValueError("Block model data cannot be empty.")
+    index = block_data.index
+    required_levels = ['x', 'y', 'z'] + (['dx', 'dy', 'dz'] if model_type == 'tensor' else [])
+    if not isinstance(index, pd.MultiIndex) or not set(required_levels).issubset(index.names):
+        raise ValueError(f"Block model data must have a MultiIndex including the levels {required_levels}.")
+    # a sliced frame keeps the level values of the blocks it no longer holds
+    index = index.remove_unused_levels()
+
+    if model_type == 'regular':
+        report = _validate_regular(index, block_size, tolerance)
+    elif model_type == 'tensor':
+        report = _validate_tensor(index, block_size, tolerance)
+    else:
+        raise ValueError(f"Unsupported model type: {model_type}")
+
+    if errors == 'raise' and not report.is_valid:
+        raise ValueError(f"Invalid block model geometry: {len(report.off_grid)} off-grid, "
+                         f"{len(report.duplicates)} duplicate and {len(report.overlaps)} overlapping blocks.")
+    return report
+
+
+def _infer_block_size(values: np.ndarray) -> float:
+    """Infer a block size as the most common spacing between unique, sorted coordinates.
+
+    The most common spacing, rather than the smallest, is robust to a few off-grid coordinates.
+    """
+    diffs = np.diff(np.sort(values))
+    diffs = diffs[diffs > (values.max() - values.min()) * 1e-9]
+    if not len(diffs):
+        return 1.0
+    spacings, counts = np.unique(np.round(diffs, 9), return_counts=True)
+    return float(spacings[np.argmax(counts)])
+
+
+def _level_values(index: pd.MultiIndex, name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Return the unique values of a level and the codes mapping each block to them."""
+    position = index.names.index(name)
+    return index.levels[position].to_numpy(dtype=np.float64), index.codes[position]
+
+
+def subset_validation_report(report: BlockModelValidationReport, block_data: pd.DataFrame,
+                             rows: np.ndarray) -> BlockModelValidationReport:
+    """The validation report of a subset of the blocks of a valid model, without validating the subset again.
+
+    A subset of a valid model is itself valid, including an empty subset.  The subset keeps the grid of the
+    model, and its missing fraction is measured against the same grid (or bounding box volume).
+
+    Args:
+        report (BlockModelValidationReport): The report of the model, which must be valid.
+        block_data (pandas.DataFrame): The block model data.
+        rows (np.ndarray): The positional row indices of the subset.
+
+    Returns:
+        BlockModelValidationReport: The report of the subset.
+
+    Raises:
+        ValueError: If the model is not valid.
+    """
+    if not report.is_valid:
+        raise ValueError("Only the subsets of a valid block model can skip validation.")
+    if report.model_type == 'tensor':
+        volume = np.prod([block_data.index.get_level_values(name).to_numpy(dtype=np.float64)
+                          for name in ('dx', 'dy', 'dz')], axis=0)
+        share = float(volume[rows].sum() / volume.sum())
+    else:
+        share = len(rows) / report.n_blocks
+    return replace(report, n_blocks=len(rows), missing_fraction=1 - (1 - report.missing_fraction) * share)
+
+
+def _validate_regular(index: pd.MultiIndex, block_size: Optional[tuple[float, float, float]],
+                      tolerance: float) -> BlockModelValidationReport:
+    n_blocks = len(index)
+    off_grid = np.zeros(n_blocks, dtype=bool)
+    grid_indices, sizes, origins, shape = [], [], [], []
+    for axis, name in enumerate(['x', 'y', 'z']):
+        values, codes = _level_values(index, name)
+        size = block_size[axis] if block_size is not None else _infer_block_size(values)
+        origin = values.min() - size / 2
+        # grid conformance is evaluated once per unique coordinate, then gathered for every block
+        fractional = (values - origin) / size - 0.5
+        level_indices = np.rint(fractional).astype(np.int64)
+        level_off_grid = np.abs(fractional - level_indices) > tolerance
+        missing = codes < 0
+        off_grid |= level_off_grid[codes] | missing
+        grid_indices.append(np.where(missing, 0, level_indices[codes]))
+        sizes.append(size)
+        origins.append(origin)
+        shape.append(int(level_indices.max()) + 1)
+
+    nx, ny, nz = shape
+    keys = grid_indices[0] + nx * (grid_indices[1] + ny * grid_indices[2])
+    on_grid = ~off_grid
+    duplicated = np.zeros(n_blocks, dtype=bool)
+    duplicated[on_grid] = pd.Series(keys[on_grid]).duplicated(keep='first').to_numpy()
+    n_unique = int(on_grid.sum() - duplicated.sum())
+
+    return BlockModelValidationReport(model_type='regular', n_blocks=n_blocks, block_size=tuple(sizes),
+                                      origin=tuple(origins), shape=(nx, ny, nz),
+                                      off_grid=np.flatnonzero(off_grid), duplicates=np.flatnonzero(duplicated),
+                                      missing_fraction=1 - n_unique / (nx * ny * nz))
+
+
+def _validate_tensor(index: pd.MultiIndex, block_size: Optional[tuple[float, float, float]],
+                     tolerance: float) -> BlockModelValidationReport:
+    n_blocks = len(index)
+    off_grid = np.zeros(n_blocks, dtype=bool)
+    starts, ends, clusters = [], [], []
+    sizes, origins, shape = [], [], []
+    for axis, (name, size_name) in enumerate([('x', 'dx'), ('y', 'dy'), ('z', 'dz')]):
+        centre_values, centre_codes = _level_values(index, name)
+        size_values, size_codes = _level_values(index, size_name)
+        base = block_size[axis] if block_size is not None else float(size_values[size_values > 0].min())
+        start = centre_values[centre_codes] - size_values[size_codes] / 2
+        end = start + size_values[size_codes]
+        origin = start.min()
+
+        # extents must start on, and span a whole number of, base cells
+        for fractional in ((start - origin) / base, (end - start) / base):
+            off_grid |= np.abs(fractional - np.rint(fractional)) > tolerance
+
+        # cluster the unique axis intervals: a new cluster starts where an interval clears all previous ones
+        interval_codes, interval_ids = pd.factorize(centre_codes.astype(np.int64) * len(size_values) + size_codes)
+        interval_start = np.empty(len(interval_ids))
+        interval_end = np.empty(len(interval_ids))
+        interval_start[interval_codes] = start
+        interval_end[interval_codes] = end
+        order = np.argsort(interval_start, kind='stable')
+        running_end = np.maximum.accumulate(interval_end[order])
+        new_cluster = np.ones(len(order), dtype=bool)
+        new_cluster[1:] = interval_start[order][1:] >= running_end[:-1] - tolerance * base
+        cluster_of_interval = np.empty(len(order), dtype=np.int64)
+        cluster_of_interval[order] = np.cumsum(new_cluster) - 1
+
+        starts.append(start)
+        ends.append(end)
+        clusters.append(cluster_of_interval[interval_codes])
+        sizes.append(base)
+        origins.append(origin)
+        shape.append(int(np.rint((end.max() - origin) / base)))
+
+    duplicated = index.droplevel([n for n in index.names if n not in ('x', 'y', 'z')]).duplicated(keep='first')
+
+    # blocks can only overlap when they share an interval cluster on every axis
+    n_clusters = [int(c.max()) + 1 for c in clusters]
+    cluster_key = clusters[0] + n_clusters[0] * (clusters[1] + n_clusters[1] * clusters[2])
+    candidates = np.flatnonzero(pd.Series(cluster_key).duplicated(keep=False).to_numpy() & ~duplicated)
+    overlapping = np.zeros(n_blocks, dtype=bool)
+    if len(candidates):
+        a, b = _sweep_pairs(pd.factorize(cluster_key[candidates])[0], [start[candidates] for start in starts],
+                            [end[candidates] - tolerance * base for end, base in zip(ends, sizes)])
+        a, b = candidates[a], candidates[b]
+        overlap = np.ones(len(a), dtype=bool)
+        for start, end, base in zip(starts, ends, sizes):
+            overlap &= (start[a] < end[b] - tolerance * base) & (start[b] < end[a] - tolerance * base)
+        overlapping[a[overlap]] = True
+        overlapping[b[overlap]] = True
+
+    volume = (ends[0] - starts[0]) * (ends[1] - starts[1]) * (ends[2] - starts[2])
+    bounding_volume = np.prod([end.max() - start.min() for start, end in zip(starts, ends)])
+    missing_fraction = max(0.0, 1 - float(volume[~duplicated].sum()) / bounding_volume)
+
+    return BlockModelValidationReport(model_type='tensor', n_blocks=n_blocks, block_size=tuple(sizes),
+                                      origin=tuple(origins), shape=tuple(shape),
+                                      off_grid=np.flatnonzero(off_grid), duplicates=np.flatnonzero(duplicated),
+                                      overlaps=np.flatnonzero(overlapping), missing_fraction=missing_fraction)
+
+
+def _sweep_pairs(key: np.ndarray, starts: list[np.ndarray], ends: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """The pairs of blocks with the same key that overlap along one axis, swept along the most selective axis.
+
+    Along each axis the blocks are sorted by key and start, so the blocks that start before the end of a block
+    are a run directly after it, found with a sorted search.  Each key is swept along the axis with the fewest
+    such pairs, and only those pairs are generated.
+
+    Args:
+        key (np.ndarray): The group of each block, as codes from zero.
+        starts (list[np.ndarray]): The start of each block along each axis.
+        ends (list[np.ndarray]): The end of each block along each axis, less the overlap tolerance.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The positions of the two blocks of each pair.
+    """
+    n = len(key)
+    runs = []
+    for start, end in zip(starts, ends):
+        order = np.lexsort((start, key))
+        # rank the starts and ends together, so that (key, value) sorts as a single integer
+        values, ranks = np.unique(np.concatenate([start, end]), return_inverse=True)
+        offset = key.astype(np.int64) * len(values)
+        sorted_start = (offset + ranks[:n])[order]
+        last = np.searchsorted(sorted_start, (offset + ranks[n:])[order], side='left')
+        first = np.arange(1, n + 1)
+        runs.append((order, first, np.maximum(last - first, 0)))
+
+    totals = np.stack([np.bincount(key[order], weights=counts, minlength=key.max() + 1)
+                       for order, _, counts in runs])
+    sweep_axis = np.argmin(totals, axis=0)
+    a, b = [], []
+    for axis, (order, first, counts) in enumerate(runs):
+        counts = np.where(sweep_axis[key[order]] == axis, counts, 0)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        a.append(np.repeat(order, counts))
+        b.append(order[np.repeat(first, counts) + offsets])
+    return np.concatenate(a), np.concatenate(b)
@@ -0,0 +1 @@
+from .drillholes import DrillholeIO
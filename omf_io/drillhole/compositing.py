@@ -0,0 +1,213 @@
+from typing import Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def length_windows(start: np.ndarray, end: np.ndarray, length: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Composite windows of a fixed length down each hole, aligned to the collar.
+
+    The windows of a hole cover the depths from its first to its last sample, in windows aligned to multiples
+    of the length from the collar, so the unsampled top of a hole produces no windows.
+
+    Args:
+        start (np.ndarray): The first sampled depth of each hole, NaN for holes without samples.
+        end (np.ndarray): The last sampled depth of each hole.
+        length (float): The composite length.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The hole, from and to depths of the windows, sorted by hole
+            and depth.
+    """
+    holes = np.flatnonzero(~np.isnan(start))
+    first = np.floor(start[holes] / length).astype(np.int64)
+    counts = np.ceil(end[holes] / length).astype(np.int64) - first
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    window_from = (np.repeat(first, counts) + offsets) * length
+    return np.repeat(holes, counts), window_from, window_from + length
+
+
+def elevation_windows(trace_holes: np.ndarray, trace_depths: np.ndarray, trace_z: np.ndarray, start: np.ndarray,
+                      end: np.ndarray, bench_height: float,
+                      bench_origin: float = 0.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Composite windows between the depths at which the holes cross the bench elevations.
+
+    The crossings are found on the straight segments between consecutive trace vertices of each hole, by
+    counting the bench elevations between the ends of every segment and interpolating their depths, so the
+    holes may cross the benches in either direction.  Only the windows overlapping the sampled depths of each
+    hole are returned, and the windows at the ends of a trace are bounded by the collar and end of the hole.
+
+    Args:
+        trace_holes (np.ndarray): The hole codes of the trace vertices, sorted by hole and depth.
+        trace_depths (np.ndarray): The depths of the trace vertices.
+        trace_z (np.ndarray): The elevations of the trace vertices.
+        start (np.ndarray): The first sampled depth of each hole, NaN for holes without samples.
+        end (np.ndarray): The last sampled depth of each hole.
+        bench_height (float): The height of the benches.
+        bench_origin (float): An elevation of a bench boundary.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The hole, from and to depths of the windows, sorted by hole
+            and depth.
+    """
+    same_hole = trace_holes[1:] == trace_holes[:-1]
+    hole, d0, d1 = trace_holes[:-1][same_hole], trace_depths[:-1][same_hole], trace_depths[1:][same_hole]
+    z0, z1 = trace_z[:-1][same_hole], trace_z[1:][same_hole]
+    # the bench boundaries from the lower (inclusive) to the upper (exclusive) elevation of each segment
+    first = np.ceil((np.minimum(z0, z1) - bench_origin) / bench_height).astype(np.int64)
+    counts = np.ceil((np.maximum(z0, z1) - bench_origin) / bench_height).astype(np.int64) - first
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    level_z = (np.repeat(first, counts) + offsets) * bench_height + bench_origin
+    segment = np.repeat(np.arange(len(counts)), counts)
+    crossing = d0[segment] + (level_z - z0[segment]) / (z1[segment] - z0[segment]) * (d1[segment] - d0[segment])
+
+    # the windows between the ends of the traces and the crossings, that overlap the sampled depths
+    trace_start = np.ones(len(trace_holes), dtype=bool)
+    trace_start[1:] = ~same_hole
+    trace_end = np.roll(trace_start, -1)
+    boundary_holes = np.concatenate([trace_holes[trace_start | trace_end], hole[segment]])
+    boundaries = np.concatenate([trace_depths[trace_start | trace_end], crossing])
+    order = np.lexsort((boundaries, boundary_holes))
+    boundary_holes, boundaries = boundary_holes[order], boundaries[order]
+    window_holes, window_from, window_to = boundary_holes[:-1], boundaries[:-1], boundaries[1:]
+    with np.errstate(invalid='ignore'):
+        window = (boundary_holes[1:] == window_holes) & (window_to > window_from) & \
+            (window_to > start[window_holes]) & (window_from < end[window_holes])
+    return window_holes[window], window_from[window], window_to[window]
+
+
+def composite_intervals(intervals: pd.DataFrame, interval_holes: np.ndarray, window_holes: np.ndarray,
+                        window_from: np.ndarray, window_to: np.ndarray, agg_dict: Optional[dict] = None,
+                        cat_treatment: Literal['majority', 'proportions'] = 'majority',
+                        proportions_as_columns: bool = False, min_coverage: float = 0.5,
+                        exclude: tuple = ()) -> pd.DataFrame:
+    """Composite intervals into windows, weighting the interval values by their overlap with each window.
+
+    The aggregation follows `omf_io.utils.pandas_utils.aggregate`, with the overlap lengths as the weights:
+
+    - the columns of agg_dict are weighted means, weighted by the overlap length times the weight column
+      (or by the overlap length alone if the weight column is None).  By default, every numeric column is a
+      length weighted mean.
+    - other numeric columns are summed, in proportion to the overlap with each interval.
+    - categorical (and other non-numeric) columns take the majority category, by length, or the length weighted
+      proportions of the categories.
+
+    Missing values are excluded from the means, the sums and the categories.  The windows of each hole must be
+    contiguous and sorted, and the first and last window (or any window with an interval) overlapped by each
+    interval are found with sorted (as-of) merges, so the overlaps are computed without looping over the holes
+    or intervals.
+
+    Args:
+        intervals (pandas.DataFrame): The intervals, with 'from' and 'to' columns and the attribute columns.
+        interval_holes (np.ndarray): The hole code of each interval.
+        window_holes (np.ndarray): The hole code of each window.
+        window_from (np.ndarray): The from depth of each window.
+        window_to (np.ndarray): The to depth of each window.
+        agg_dict (dict, optional): The columns to average, mapped to their weight columns (or None).
+        cat_treatment (Literal['majority', 'proportions']): The treatment of categorical columns.
+        proportions_as_columns (bool): Return the category proportions as '<column>_<category>' columns,
+            rather than as a dict per window.
+        min_coverage (float): The minimum sampled proportion of the length of a window to keep it.
+        exclude (tuple): The columns not to composite, such as the hole identifier.
+
+    Returns:
+        pandas.DataFrame: The composites, with the position of their window as 'window', their 'from', 'to' and
+            sampled 'coverage' length, and the composited columns in the order of the interval columns.
+
+    Raises:
+        ValueError: If a column of agg_dict or its weight column is missing or not numeric.
+    """
+    columns = [column for column in intervals.columns if column not in ('from', 'to', *exclude)]
+    is_categorical = {column: not _is_numeric(intervals[column]) for column in columns}
+    if agg_dict is None:
+        agg_dict = {column: None for column in columns if not is_categorical[column]}
+    for column, weight in agg_dict.items():
+        for name in (column, weight):
+            if name is not None and (name not in intervals.columns or not _is_numeric(intervals[name])):
+                raise ValueError(f"The column '{name}' of the aggregation is missing or not numeric.")
+
+    window_from = np.asarray(window_from, dtype=np.float64)
+    window_to = np.asarray(window_to, dtype=np.float64)
+    interval_from = intervals['from'].to_numpy(dtype=np.float64)
+    interval_to = intervals['to'].to_numpy(dtype=np.float64)
+    pieces_interval, pieces_window = _overlapping_windows(interval_holes, interval_from, interval_to,
+                                                          window_holes, window_from)
+    overlap = np.clip(np.minimum(interval_to[pieces_interval], window_to[pieces_window]) -
+                      np.maximum(interval_from[pieces_interval], window_from[pieces_window]), 0, None)
+    n_windows = len(window_from)
+
+    def weighted_sum(values: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """The sum of the weighted values of each window, and the sum of their weights, excluding NaN."""
+        valid = ~np.isnan(values) & ~np.isnan(weights)
+        weights = np.where(valid, weights, 0.0)
+        return (np.bincount(pieces_window, weights=np.where(valid, values, 0.0) * weights, minlength=n_windows),
+                np.bincount(pieces_window, weights=weights, minlength=n_windows))
+
+    coverage = np.bincount(pieces_window, weights=overlap, minlength=n_windows)
+    result = {'window': np.arange(n_windows), 'from': window_from, 'to': window_to, 'coverage': coverage}
+    for column in columns:
+        values = intervals[column]
+        if is_categorical[column]:
+            codes, categories = pd.factorize(values, sort=True)
+            lengths = np.bincount(pieces_window * len(categories) + codes[pieces_interval],
+                                  weights=np.where(codes[pieces_interval] >= 0, overlap, 0.0),
+                                  minlength=n_windows * len(categories)).reshape(n_windows, len(categories)) \
+                if len(categories) else np.zeros((n_windows, 0))
+            total = lengths.sum(axis=1)
+            if cat_treatment == 'majority':
+                majority = np.argmax(lengths, axis=1) if len(categories) else np.zeros(n_windows, dtype=np.intp)
+                result[column] = pd.Categorical.from_codes(np.where(total > 0, majority, -1), categories=categories)
+            elif cat_treatment == 'proportions':
+                proportions = lengths / np.where(total > 0, total, np.nan)[:, None]
+                if proportions_as_columns:
+                    result.update({f"{column}_{category}": proportions[:, i] for i, category in enumerate(categories)})
+                else:
+                    result[column] = [dict(zip(categories, row)) for row in proportions.tolist()]
+            else:
+                raise ValueError(f"Unsupported categorical treatment: {cat_treatment}")
+            continue
+        values = values.to_numpy(dtype=np.float64)
+        if column in agg_dict:
+            weight = agg_dict[column]
+            weights = overlap if weight is None else \
+                overlap * intervals[weight].to_numpy(dtype=np.float64)[pieces_interval]
+            total, weight_total = weighted_sum(values[pieces_interval], weights)
+            result[column] = np.divide(total, weight_total, out=np.full(n_windows, np.nan), where=weight_total > 0)
+        else:
+            # the share of each interval within the window
+            share = overlap / (interval_to - interval_from)[pieces_interval]
+            total, weight_total = weighted_sum(values[pieces_interval], share)
+            result[column] = np.where(weight_total > 0, total, np.nan)
+
+    composites = pd.DataFrame(result)
+    keep = coverage > 0
+    if min_coverage > 0:
+        keep &= coverage >= min_coverage * (window_to - window_from) * (1 - 1e-9)
+    return composites[keep].reset_index(drop=True)
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _overlapping_windows(interval_holes: np.ndarray, interval_from: np.ndarray, interval_to: np.ndarray,
+                         window_holes: np.ndarray, window_from: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """The pairs of intervals and the windows they overlap, from the first and last window of each interval."""
+    windows = pd.DataFrame({'hole': np.asarray(window_holes, dtype=np.int64), 'depth': window_from,
+                            'window': np.arange(len(window_from))}).sort_values('depth', kind='stable')
+
+    def window_at(depths: np.ndarray, allow_exact_matches: bool) -> np.ndarray:
+        queries = pd.DataFrame({'hole': np.asarray(interval_holes, dtype=np.int64), 'depth': depths,
+                                'interval': np.arange(len(depths))}).sort_values('depth', kind='stable')
+        matched = pd.merge_asof(queries, windows, on='depth', by='hole', direction='backward',
+                                allow_exact_matches=allow_exact_matches)
+        window = np.empty(len(depths), dtype=np.int64)
+        window[matched['interval'].to_numpy()] = matched['window'].fillna(-1).to_numpy(dtype=np.int64)
+        return window
+
+    # the window holding the from depth, and the last window starting above the to depth
+    first, last = window_at(interval_from, True), window_at(interval_to, False)
+    first = np.where(first < 0, np.searchsorted(window_holes, interval_holes), first)
+    counts = np.maximum(last - first + 1, 0)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(np.arange(len(counts)), counts), np.repeat(first, counts) + offsets
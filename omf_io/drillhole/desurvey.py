@@ -0,0 +1,197 @@
+from typing import Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+DesurveyMethod = Literal['minimum_curvature', 'tangential']
+
+
+def hole_codes(holes, collar_holes) -> np.ndarray:
+    """The position of each hole in the collar table.
+
+    Args:
+        holes: The hole of each row of a table.
+        collar_holes: The holes of the collar table.
+
+    Returns:
+        np.ndarray: The collar row of each hole.
+
+    Raises:
+        ValueError: If a hole has no collar.
+    """
+    codes = pd.Index(collar_holes).get_indexer(holes)
+    if (codes < 0).any():
+        raise ValueError(f"Holes without a collar: {pd.unique(np.asarray(holes)[codes < 0])[:10].tolist()}")
+    return codes
+
+
+def survey_directions(azimuth: np.ndarray, dip: np.ndarray) -> np.ndarray:
+    """The unit direction vectors down the hole.
+
+    Args:
+        azimuth (np.ndarray): The azimuths in degrees, clockwise from north (+y).
+        dip (np.ndarray): The dips in degrees from horizontal, negative downwards.
+
+    Returns:
+        np.ndarray: The Nx3 (east, north, up) direction vectors.
+    """
+    azimuth, dip = np.radians(azimuth), np.radians(dip)
+    return np.column_stack([np.cos(dip) * np.sin(azimuth), np.cos(dip) * np.cos(azimuth), np.sin(dip)])
+
+
+def desurvey_stations(collar: pd.DataFrame, survey: Optional[pd.DataFrame] = None, hole_column: str = 'hole_id',
+                      method: DesurveyMethod = 'minimum_curvature') -> pd.DataFrame:
+    """Compute the positions of the survey stations of all holes at once.
+
+    A station is added at the collar of each hole, with the orientation of the first survey below it (holes
+    without surveys are vertical).  The course between consecutive stations of a hole is displaced along the
+    direction of the upper station (tangential), or along a circular arc between the two directions (minimum
+    curvature).  The station positions are the collars plus a cumulative sum of the course displacements,
+    restarted at each hole, so there is no loop over the holes.
+
+    Args:
+        collar (pandas.DataFrame): One row per hole, with the hole, x, y and z columns.
+        survey (pandas.DataFrame, optional): One row per survey station, with the hole, depth, azimuth and dip
+            columns.
+        hole_column (str): The column identifying the hole.
+        method (DesurveyMethod): 'minimum_curvature' or 'tangential'.
+
+    Returns:
+        pandas.DataFrame: The stations, sorted by hole (in collar order) and depth, with the collar row of the
+            hole as 'hole', and the 'depth', 'x', 'y', 'z' and direction 'dx', 'dy', 'dz' columns.
+
+    Raises:
+        ValueError: If the method is not supported.
+    """
+    if method not in ('minimum_curvature', 'tangential'):
+        raise ValueError(f"Unsupported desurvey method: {method}")
+    n_holes = len(collar)
+    if survey is None or len(survey) == 0:
+        holes, depths = np.empty(0, dtype=np.intp), np.empty(0)
+        azimuth, dip = np.empty(0), np.empty(0)
+    else:
+        holes = hole_codes(survey[hole_column], collar[hole_column])
+        depths = survey['depth'].to_numpy(dtype=np.float64)
+        azimuth, dip = survey['azimuth'].to_numpy(dtype=np.float64), survey['dip'].to_numpy(dtype=np.float64)
+        order = np.lexsort((depths, holes))
+        holes, depths, azimuth, dip = holes[order], depths[order], azimuth[order], dip[order]
+
+    # a station at the collar of each hole, with the orientation of the shallowest survey (or vertical)
+    first = np.full(n_holes, -1)
+    surveyed_holes, first_rows = np.unique(holes, return_index=True)
+    first[surveyed_holes] = first_rows
+    surveyed = first >= 0
+    collar_azimuth, collar_dip = np.zeros(n_holes), np.full(n_holes, -90.0)
+    collar_azimuth[surveyed], collar_dip[surveyed] = azimuth[first[surveyed]], dip[first[surveyed]]
+    add = ~surveyed.copy()
+    add[surveyed] = depths[first[surveyed]] > 0
+    holes = np.concatenate([np.flatnonzero(add), holes])
+    depths = np.concatenate([np.zeros(add.sum()), depths])
+    azimuth = np.concatenate([collar_azimuth[add], azimuth])
+    dip = np.concatenate([collar_dip[add], dip])
+    order = np.lexsort((depths, holes))
+    holes, depths, azimuth, dip = holes[order], depths[order], azimuth[order], dip[order]
+
+    directions = survey_directions(azimuth, dip)
+    # the course from each station to the next station of the same hole (none below the last station)
+    next_direction, course_length = _next_station(holes, depths, directions)
+    displacement = _course_displacement(directions, next_direction, course_length, method)
+
+    # the cumulative sum of the courses above each station, restarted at the collar of each hole
+    above = np.cumsum(displacement, axis=0) - displacement
+    hole_start = np.searchsorted(holes, holes)
+    positions = collar[['x', 'y', 'z']].to_numpy(dtype=np.float64)[holes] + above - above[hole_start]
+    return pd.DataFrame({'hole': holes, 'depth': depths,
+                         'x': positions[:, 0], 'y': positions[:, 1], 'z': positions[:, 2],
+                         'dx': directions[:, 0], 'dy': directions[:, 1], 'dz': directions[:, 2]})
+
+
+def locate_depths(stations: pd.DataFrame, holes: np.ndarray, depths: np.ndarray,
+                  method: DesurveyMethod = 'minimum_curvature') -> np.ndarray:
+    """Compute the positions of depths down the holes, from the desurveyed stations.
+
+    Each depth is matched to the station above it with a sorted (as-of) merge, and displaced from that station
+    along the course to the next station.  Below the last station the hole continues straight.
+
+    Args:
+        stations (pandas.DataFrame): The stations from `desurvey_stations`.
+        holes (np.ndarray): The collar row of the hole of each depth.
+        depths (np.ndarray): The depths down the holes.
+        method (DesurveyMethod): The method the stations were desurveyed with.
+
+    Returns:
+        np.ndarray: The Nx3 positions.
+
+    Raises:
+        ValueError: If a depth is negative.
+    """
+    depths = np.asarray(depths, dtype=np.float64)
+    if (depths < 0).any():
+        raise ValueError("Depths must not be negative.")
+    queries = pd.DataFrame({'hole': np.asarray(holes, dtype=np.int64), 'depth': depths,
+                            'query': np.arange(len(depths))}).sort_values('depth', kind='stable')
+    station_table = pd.DataFrame({'hole': stations['hole'].to_numpy(dtype=np.int64),
+                                  'depth': stations['depth'].to_numpy(dtype=np.float64),
+                                  'station': np.arange(len(stations))}).sort_values('depth', kind='stable')
+    matched = pd.merge_asof(queries, station_table, on='depth', by='hole', direction='backward')
+    station = np.empty(len(depths), dtype=np.int64)
+    station[matched['query'].to_numpy()] = matched['station'].to_numpy()
+
+    station_holes = stations['hole'].to_numpy()
+    station_depths = stations['depth'].to_numpy(dtype=np.float64)
+    directions = stations[['dx', 'dy', 'dz']].to_numpy(dtype=np.float64)
+    next_direction, course_length = _next_station(station_holes, station_depths, directions)
+
+    along = depths - station_depths[station]
+    start, end = directions[station], next_direction[station]
+    if method == 'tangential':
+        offset = along[:, None] * start
+    else:
+        # the part of the course down to the depth is itself a circular arc, with a proportion of the dogleg
+        fraction = np.divide(along, course_length[station], out=np.zeros_like(along),
+                             where=np.isfinite(course_length[station]) & (course_length[station] > 0))
+        dogleg = _dogleg(start, end)
+        direction = _slerp(start, end, dogleg, fraction)
+        offset = (along * _ratio_factor(dogleg * fraction) / 2)[:, None] * (start + direction)
+    return stations[['x', 'y', 'z']].to_numpy(dtype=np.float64)[station] + offset
+
+
+def _next_station(holes: np.ndarray, depths: np.ndarray, directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """The direction of the next station of the same hole, and the length of the course to it (inf if none)."""
+    last = np.ones(len(holes), dtype=bool)
+    last[:-1] = holes[1:] != holes[:-1]
+    next_direction = directions.copy()
+    next_direction[:-1][~last[:-1]] = directions[1:][~last[:-1]]
+    course_length = np.full(len(holes), np.inf)
+    course_length[:-1][~last[:-1]] = np.diff(depths)[~last[:-1]]
+    return next_direction, course_length
+
+
+def _course_displacement(start: np.ndarray, end: np.ndarray, length: np.ndarray,
+                         method: DesurveyMethod) -> np.ndarray:
+    """The displacement along each course, zero below the last station of each hole."""
+    length = np.where(np.isfinite(length), length, 0.0)
+    if method == 'tangential':
+        return length[:, None] * start
+    return (length * _ratio_factor(_dogleg(start, end)) / 2)[:, None] * (start + end)
+
+
+def _dogleg(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """The angle between pairs of unit vectors, accurate for small angles."""
+    return 2 * np.arctan2(np.linalg.norm(end - start, axis=1), np.linalg.norm(end + start, axis=1))
+
+
+def _ratio_factor(dogleg: np.ndarray) -> np.ndarray:
+    """The minimum curvature ratio factor, 2/β tan(β/2), which tends to one for straight courses."""
+    small = dogleg < 1e-7
+    safe = np.where(small, 1.0, dogleg)
+    return np.where(small, 1.0 + dogleg ** 2 / 12, 2 / safe * np.tan(safe / 2))
+
+
+def _slerp(start: np.ndarray, end: np.ndarray, dogleg: np.ndarray, fraction: np.ndarray) -> np.ndarray:
+    """The unit vectors a fraction of the way along the arcs between pairs of unit vectors."""
+    small = dogleg < 1e-7
+    sin_dogleg = np.where(small, 1.0, np.sin(dogleg))
+    weight_start = np.where(small, 1 - fraction, np.sin((1 - fraction) * dogleg) / sin_dogleg)
+    weight_end = np.where(small, fraction, np.sin(fraction * dogleg) / sin_dogleg)
+    return weight_start[:, None] * start + weight_end[:, None] * end
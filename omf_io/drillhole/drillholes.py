@@ -0,0 +1,253 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from .validation import validate_drillhole_tables
+from .importers import import_drillholes_from_csv
+from .desurvey import DesurveyMethod, hole_codes, desurvey_stations, locate_depths
+from .compositing import length_windows, elevation_windows, composite_intervals
+
+if TYPE_CHECKING:
+    from omf_io.lineset import LineSetIO  # For type hinting only
+    from omf_io.pointset import PointSetIO  # For type hinting only
+
+
+class DrillholeIO:
+    """
+    Handles drillhole databases of collar, survey and interval (e.g. assay) tables.
+
+    The holes are desurveyed all at once, with array operations over the stations of every hole, and the
+    results are available as point sets of interval midpoints and line sets of hole traces.  The intervals are
+    composited to fixed lengths or bench heights in the same way, across all holes at once.
+
+    Surveys have a 'depth' down the hole, an 'azimuth' in degrees clockwise from north, and a 'dip' in degrees
+    from horizontal, negative downwards.  Intervals have 'from' and 'to' depths.
+    """
+
+    def __init__(self, collar: pd.DataFrame, survey: Optional[pd.DataFrame] = None,
+                 intervals: Optional[pd.DataFrame] = None, hole_column: str = 'hole_id'):
+        """
+        Initialize the DrillholeIO instance.
+
+        Args:
+            collar (pandas.DataFrame): One row per hole, with the hole, x, y and z columns, and optionally the
+                'max_depth' of the hole.
+            survey (pandas.DataFrame, optional): One row per survey station, with the hole, depth, azimuth and dip
+                columns.  Holes without surveys are vertical.
+            intervals (pandas.DataFrame, optional): One row per interval, with the hole, from and to columns and
+                the interval attributes.
+            hole_column (str): The column identifying the hole in each table.
+        """
+        validate_drillhole_tables(collar, survey, intervals, hole_column=hole_column)
+        self.collar: pd.DataFrame = collar.reset_index(drop=True)
+        self.survey: Optional[pd.DataFrame] = survey
+        self.intervals: Optional[pd.DataFrame] = intervals
+        self.hole_column: str = hole_column
+
+    @classmethod
+    def from_csv(cls, collar_file: Path, survey_file: Optional[Path] = None, interval_file: Optional[Path] = None,
+                 hole_column: str = 'hole_id', **kwargs) -> "DrillholeIO":
+        """
+        Create a DrillholeIO instance from collar, survey and interval CSV files.
+
+        Args:
+            collar_file (Path): The collar CSV file.
+            survey_file (Path, optional): The survey CSV file.
+            interval_file (Path, optional): The interval CSV file.
+            hole_column (str): The column identifying the hole in each file.
+            **kwargs: Additional arguments for `pandas.read_csv`.
+
+        Returns:
+            DrillholeIO: An instance of the class.
+        """
+        tables = import_drillholes_from_csv(collar_file, survey_file, interval_file, hole_column=hole_column,
+                                            **kwargs)
+        return cls(**tables, hole_column=hole_column)
+
+    @property
+    def n_holes(self) -> int:
+        return len(self.collar)
+
+    def end_depths(self) -> np.ndarray:
+        """
+        The depth of the end of each hole, in collar order.
+
+        Returns:
+            np.ndarray: The largest of the 'max_depth' of the collar, and the deepest survey and interval depths.
+        """
+        end = np.zeros(self.n_holes)
+        if 'max_depth' in self.collar.columns:
+            end = np.fmax(end, self.collar['max_depth'].to_numpy(dtype=np.float64))
+        for table, column in ((self.survey, 'depth'), (self.intervals, 'to')):
+            if table is not None and len(table):
+                np.maximum.at(end, hole_codes(table[self.hole_column], self.collar[self.hole_column]),
+                              table[column].to_numpy(dtype=np.float64))
+        return end
+
+    def _trace_depths(self, stations: pd.DataFrame, step: Optional[float] = None) -> tuple[np.ndarray, np.ndarray]:
+        """The hole codes and depths of the stations, the ends of the holes and every step down the holes."""
+        end = self.end_depths()
+        holes = stations['hole'].to_numpy()
+        depths = stations['depth'].to_numpy()
+        keep = depths <= end[holes]
+        holes, depths = [holes[keep], np.arange(self.n_holes)], [depths[keep], end]
+        if step is not None:
+            counts = np.floor(end / step).astype(np.int64)
+            first = np.repeat(np.cumsum(counts) - counts, counts)
+            holes.append(np.repeat(np.arange(self.n_holes), counts))
+            depths.append((np.arange(counts.sum()) - first + 1) * step)
+        holes, depths = np.concatenate(holes), np.concatenate(depths)
+        order = np.lexsort((depths, holes))
+        holes, depths = holes[order], depths[order]
+        distinct = np.ones(len(holes), dtype=bool)
+        distinct[1:] = (holes[1:] != holes[:-1]) | (depths[1:] != depths[:-1])
+        return holes[distinct], depths[distinct]
+
+    def desurvey(self, method: DesurveyMethod = 'minimum_curvature') -> pd.DataFrame:
+        """
+        Compute the positions of the survey stations, including a station at each collar.
+
+        Args:
+            method (DesurveyMethod): 'minimum_curvature' or 'tangential'.
+
+        Returns:
+            pandas.DataFrame: The hole, 'depth', 'x', 'y' and 'z' of each station, sorted by hole and depth.
+        """
+        stations = desurvey_stations(self.collar, self.survey, hole_column=self.hole_column, method=method)
+        holes = self.collar[self.hole_column].to_numpy()[stations['hole'].to_numpy()]
+        return pd.concat([pd.DataFrame({self.hole_column: holes}), stations[['depth', 'x', 'y', 'z']]], axis=1)
+
+    def locate(self, holes, depths, method: DesurveyMethod = 'minimum_curvature') -> np.ndarray:
+        """
+        Compute the positions of depths down the holes.
+
+        Args:
+            holes: The hole of each depth.
+            depths: The depths down the holes.
+            method (DesurveyMethod): 'minimum_curvature' or 'tangential'.
+
+        Returns:
+            np.ndarray: The Nx3 positions.
+        """
+        stations = desurvey_stations(self.collar, self.survey, hole_column=self.hole_column, method=method)
+        return locate_depths(stations, hole_codes(holes, self.collar[self.hole_column]), depths, method=method)
+
+    def to_pointset(self, method: DesurveyMethod = 'minimum_curvature') -> "PointSetIO":
+        """
+        Convert the intervals to a point set of their midpoints.
+
+        Args:
+            method (DesurveyMethod): 'minimum_curvature' or 'tangential'.
+
+        Returns:
+            PointSetIO: The interval midpoints, with the interval columns (including the hole, from and to) as
+                attributes.
+
+        Raises:
+            ValueError: If there are no intervals.
+        """
+        from omf_io.pointset import PointSetIO
+
+        if self.intervals is None:
+            raise ValueError("There are no intervals to convert.")
+        midpoints = self.locate(self.intervals[self.hole_column],
+                                (self.intervals['from'].to_numpy() + self.intervals['to'].to_numpy()) / 2,
+                                method=method)
+        data = self.intervals.reset_index(drop=True)
+        data.index = pd.MultiIndex.from_arrays(midpoints.T, names=['x', 'y', 'z'])
+        return PointSetIO(data)
+
+    def to_lineset(self, method: DesurveyMethod = 'minimum_curvature', step: Optional[float] = None) -> "LineSetIO":
+        """
+        Convert the holes to a line set of their traces, from the collar to the end of each hole.
+
+        The traces have a vertex at each survey station and at the end of the hole.  Minimum curvature traces
+        are arcs between the stations, which are followed more closely with vertices every `step` down the hole.
+
+        Args:
+            method (DesurveyMethod): 'minimum_curvature' or 'tangential'.
+            step (float, optional): The spacing of additional vertices down the holes.
+
+        Returns:
+            LineSetIO: The traces, with the 'depth' of each vertex as a vertex attribute and the hole of each
+                segment as a segment attribute.
+
+        Raises:
+            ValueError: If the step is not positive.
+        """
+        from omf_io.lineset import LineSetIO
+        from omf_io.lineset.importers import import_lineset_from_table
+
+        if step is not None and step <= 0:
+            raise ValueError("The step must be positive.")
+        stations = desurvey_stations(self.collar, self.survey, hole_column=self.hole_column, method=method)
+        holes, depths = self._trace_depths(stations, step)
+        vertices = locate_depths(stations, holes, depths, method=method)
+        table = pd.DataFrame({self.hole_column: pd.Categorical.from_codes(holes, self.collar[self.hole_column]),
+                              'x': vertices[:, 0], 'y': vertices[:, 1], 'z': vertices[:, 2], 'depth': depths})
+        return LineSetIO(**import_lineset_from_table(table, line_column=self.hole_column))
+
+    def composite(self, length: Optional[float] = None, bench_height: Optional[float] = None,
+                  bench_origin: float = 0.0, agg_dict: Optional[dict] = None,
+                  cat_treatment: Literal['majority', 'proportions'] = 'majority',
+                  proportions_as_columns: bool = False, min_coverage: float = 0.5,
+                  method: DesurveyMethod = 'minimum_curvature', step: float = 1.0) -> "DrillholeIO":
+        """
+        Composite the intervals to a fixed length down the holes, or to bench heights.
+
+        The composites of all holes are computed at once.  Each composite is the length weighted aggregation
+        of the intervals it overlaps (see `omf_io.utils.pandas_utils.aggregate`): by default the numeric
+        columns are length weighted means and the categorical columns take the majority category.  Missing
+        values are excluded, and composites sampled over less than min_coverage of their length are dropped.
+
+        Bench composites are bounded by the depths at which the desurveyed holes cross the bench elevations,
+        found on the traces with vertices every `step` down the holes.
+
+        Args:
+            length (float, optional): The composite length down the holes, from the collar.
+            bench_height (float, optional): The bench height, for composites between bench elevations.
+            bench_origin (float): An elevation of a bench boundary.
+            agg_dict (dict, optional): The columns to average, mapped to their weight columns (or None for the
+                length alone), e.g. {'cu': 'density', 'density': None}.  Other numeric columns are summed, in
+                proportion to the overlap of each interval.
+            cat_treatment (Literal['majority', 'proportions']): The treatment of categorical columns.
+            proportions_as_columns (bool): Return the category proportions as '<column>_<category>' columns.
+            min_coverage (float): The minimum sampled proportion of the length of a composite.
+            method (DesurveyMethod): The desurvey method, for bench composites.
+            step (float): The spacing of the trace vertices, for bench composites.
+
+        Returns:
+            DrillholeIO: A new instance with the composites as the intervals, including the sampled 'coverage'
+                length of each composite.
+
+        Raises:
+            ValueError: If there are no intervals, or not exactly one of length and bench_height is given.
+        """
+        if self.intervals is None:
+            raise ValueError("There are no intervals to composite.")
+        if (length is None) == (bench_height is None):
+            raise ValueError("Provide either a composite length or a bench height.")
+        if (length or bench_height) <= 0:
+            raise ValueError("The composite length or bench height must be positive.")
+
+        codes = hole_codes(self.intervals[self.hole_column], self.collar[self.hole_column])
+        start, end = np.full(self.n_holes, np.nan), np.full(self.n_holes, np.nan)
+        np.fmin.at(start, codes, self.intervals['from'].to_numpy(dtype=np.float64))
+        np.fmax.at(end, codes, self.intervals['to'].to_numpy(dtype=np.float64))
+        if length is not None:
+            windows = length_windows(start, end, length)
+        else:
+            stations = desurvey_stations(self.collar, self.survey, hole_column=self.hole_column, method=method)
+            trace_holes, trace_depths = self._trace_depths(stations, step)
+            trace_z = locate_depths(stations, trace_holes, trace_depths, method=method)[:, 2]
+            windows = elevation_windows(trace_holes, trace_depths, trace_z, start, end, bench_height,
+                                        bench_origin=bench_origin)
+
+        composites = composite_intervals(self.intervals, codes, *windows, agg_dict=agg_dict,
+                                         cat_treatment=cat_treatment, proportions_as_columns=proportions_as_columns,
+                                         min_coverage=min_coverage, exclude=(self.hole_column,))
+        holes = self.collar[self.hole_column].to_numpy()[windows[0][composites.pop('window').to_numpy()]]
+        composites.insert(0, self.hole_column, holes)
+        return self.__class__(self.collar, self.survey, composites, hole_column=self.hole_column)
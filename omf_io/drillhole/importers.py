@@ -0,0 +1,26 @@
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+
+def import_drillholes_from_csv(collar_file: Path, survey_file: Optional[Path] = None,
+                               interval_file: Optional[Path] = None, hole_column: str = 'hole_id',
+                               **kwargs) -> dict:
+    """Import the collar, survey and interval tables of a drillhole database from CSV files.
+
+    The hole identifiers are read as strings, so that identifiers such as '0012' match across the tables.
+
+    Args:
+        collar_file (Path): The collar CSV file, with the hole, x, y and z columns.
+        survey_file (Path, optional): The survey CSV file, with the hole, depth, azimuth and dip columns.
+        interval_file (Path, optional): The interval (e.g. assay) CSV file, with the hole, from and to columns.
+        hole_column (str): The column identifying the hole.
+        **kwargs: Additional arguments for `pandas.read_csv`.
+
+    Returns:
+        dict: A dictionary with the 'collar', 'survey' and 'intervals' DataFrames (None if no file is given).
+    """
+    kwargs['dtype'] = {hole_column: str, **kwargs.get('dtype', {})}
+    tables = {'collar': collar_file, 'survey': survey_file, 'intervals': interval_file}
+    return {name: None if path is None else pd.read_csv(path, **kwargs) for name, path in tables.items()}
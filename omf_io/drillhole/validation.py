@@ -0,0 +1,58 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _check_columns(table: pd.DataFrame, columns: list[str], name: str):
+    missing = [column for column in columns if column not in table.columns]
+    if missing:
+        raise ValueError(f"The {name} table is missing the columns {missing}.")
+
+
+def validate_drillhole_tables(collar: pd.DataFrame, survey: Optional[pd.DataFrame] = None,
+                              intervals: Optional[pd.DataFrame] = None, hole_column: str = 'hole_id'):
+    """Validate the collar, survey and interval tables of a drillhole database.
+
+    Args:
+        collar (pandas.DataFrame): One row per hole, with the hole, x, y and z columns.
+        survey (pandas.DataFrame, optional): One row per survey station, with the hole, depth, azimuth and dip
+            columns.
+        intervals (pandas.DataFrame, optional): One row per interval, with the hole, from and to columns.
+        hole_column (str): The column identifying the hole.
+
+    Raises:
+        ValueError: If a column is missing, a collar is repeated, a survey or interval refers to a hole without
+            a collar, a survey value is missing, or the depths, dips or interval lengths are invalid.
+    """
+    _check_columns(collar, [hole_column, 'x', 'y', 'z'], 'collar')
+    if collar[hole_column].duplicated().any():
+        duplicates = collar.loc[collar[hole_column].duplicated(), hole_column].unique().tolist()
+        raise ValueError(f"The collar table has repeated holes: {duplicates[:10]}")
+
+    if survey is not None:
+        _check_columns(survey, [hole_column, 'depth', 'azimuth', 'dip'], 'survey')
+        _check_holes(survey[hole_column], collar[hole_column], 'survey')
+        missing = [column for column in ('depth', 'azimuth', 'dip') if survey[column].isna().any()]
+        if missing:
+            raise ValueError(f"The survey table has missing values in the columns {missing}.")
+        if (survey['depth'] < 0).any():
+            raise ValueError("Survey depths must not be negative.")
+        if (survey['dip'].abs() > 90).any():
+            raise ValueError("Survey dips must be between -90 and 90 degrees.")
+        if survey.duplicated([hole_column, 'depth']).any():
+            raise ValueError("The survey table has repeated depths within a hole.")
+
+    if intervals is not None:
+        _check_columns(intervals, [hole_column, 'from', 'to'], 'interval')
+        _check_holes(intervals[hole_column], collar[hole_column], 'interval')
+        if (intervals['from'] < 0).any():
+            raise ValueError("Interval depths must not be negative.")
+        if not (intervals['to'].to_numpy() > intervals['from'].to_numpy()).all():
+            raise ValueError("Intervals must have a 'to' depth greater than their 'from' depth.")
+
+
+def _check_holes(holes: pd.Series, collar_holes: pd.Series, name: str):
+    unknown = ~np.asarray(holes.isin(collar_holes))
+    if unknown.any():
+        raise ValueError(f"The {name} table has holes without a collar: {holes[unknown].unique()[:10].tolist()}")
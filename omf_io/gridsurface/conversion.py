@@ -0,0 +1,138 @@
+import numpy as np
+from affine import Affine
+
+
+def grid_to_mesh(values: np.ndarray, transform: Affine,
+                 batch_size: int = 1_000_000) -> tuple[np.ndarray, np.ndarray]:
+    """Triangulate a grid, with a vertex at each valid cell centre and two triangles per square of centres.
+
+    The triangles are generated by index arithmetic alone.  The vertex of a cell is numbered by a running
+    count of the valid cells, and each square is split along the same diagonal into two triangles, each kept
+    only if its three cells are valid, so nodata cells leave holes in the mesh.  The triangles are wound
+    counter-clockwise in plan, so their normals point up.
+
+    Args:
+        values (np.ndarray): The (rows, columns) elevations, with NaN for nodata.
+        transform (affine.Affine): The affine transform of the grid, which may be rotated.
+        batch_size (int): The maximum number of squares triangulated at once.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The Nx3 float64 vertices, in row-major cell order, and the Mx3 faces.
+    """
+    values = np.asarray(values)
+    n_rows, n_cols = values.shape
+    valid = ~np.isnan(values)
+    rows, cols = np.nonzero(valid)
+    x, y = transform * (cols + 0.5, rows + 0.5)
+    vertices = np.column_stack([x, y, values[rows, cols]]).astype(np.float64, copy=False)
+
+    index_dtype = np.int32 if len(vertices) <= np.iinfo(np.int32).max else np.int64
+    node_ids = (np.cumsum(valid, dtype=index_dtype) - 1).reshape(n_rows, n_cols)
+    # a transform that mirrors the grid (such as a north-up raster) reverses the winding in plan
+    mirrored = transform.a * transform.e - transform.b * transform.d < 0
+    rows_per_batch = max(1, batch_size // max(1, n_cols - 1))
+    faces = []
+    for start in range(0, n_rows - 1, rows_per_batch):
+        stop = min(start + rows_per_batch, n_rows - 1)
+        corners = [(slice(start, stop), slice(0, -1)), (slice(start, stop), slice(1, None)),
+                   (slice(start + 1, stop + 1), slice(0, -1)), (slice(start + 1, stop + 1), slice(1, None))]
+        ids = [node_ids[corner] for corner in corners]
+        masks = [valid[corner] for corner in corners]
+        # (top left, bottom left, top right) and (top right, bottom left, bottom right) in grid order
+        triangles = [(0, 2, 1), (1, 2, 3)] if mirrored else [(0, 1, 2), (1, 3, 2)]
+        batch = np.stack([np.stack([ids[i] for i in triangle], axis=-1) for triangle in triangles], axis=2)
+        keep = np.stack([masks[a] & masks[b] & masks[c] for a, b, c in triangles], axis=2)
+        faces.append(batch[keep])
+    faces = np.concatenate(faces) if faces else np.empty((0, 3), dtype=index_dtype)
+    return vertices, faces
+
+
+def rasterize_mesh(vertices: np.ndarray, faces: np.ndarray, transform: Affine, shape: tuple[int, int],
+                   batch_size: int = 1_000_000) -> np.ndarray:
+    """Rasterize a triangulated surface onto the cell centres of an axis-aligned grid.
+
+    The cell centres under the bounding box of each triangle are enumerated by index arithmetic, in batches
+    of about batch_size centres across consecutive triangles, and the elevation of each centre inside a
+    triangle is interpolated from its barycentric coordinates.  The cost is linear in the number of
+    triangles plus the number of centres they cover.  Where triangles overlap in plan, the highest elevation
+    is kept.
+
+    Args:
+        vertices (np.ndarray): The Nx3 surface vertices.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        transform (affine.Affine): The affine transform of the grid.
+        shape (tuple[int, int]): The number of (rows, columns) of the grid.
+        batch_size (int): The approximate number of cell centres tested at once.
+
+    Returns:
+        np.ndarray: The (rows, columns) float64 elevations, NaN where no triangle covers a centre.
+
+    Raises:
+        ValueError: If the grid is rotated.
+    """
+    if transform.b or transform.d:
+        raise ValueError("Only axis-aligned grids can be rasterized onto.")
+    n_rows, n_cols = shape
+    result = np.full(n_rows * n_cols, np.nan)
+    vertices = np.asarray(vertices, dtype=np.float64)
+    # the vertices in fractional (column, row) index space, where the cell centres are the integers
+    cols = (vertices[:, 0] - transform.c) / transform.a - 0.5
+    rows = (vertices[:, 1] - transform.f) / transform.e - 0.5
+
+    # batches of triangles, each then expanded to its centres in windows of about batch_size centres
+    for start in range(0, len(faces), batch_size):
+        face = np.asarray(faces[start:start + batch_size], dtype=np.int64)
+        c0, c1, c2 = cols[face[:, 0]], cols[face[:, 1]], cols[face[:, 2]]
+        r0, r1, r2 = rows[face[:, 0]], rows[face[:, 1]], rows[face[:, 2]]
+        col_min = np.maximum(np.ceil(np.minimum(np.minimum(c0, c1), c2)), 0).astype(np.int64)
+        col_max = np.minimum(np.floor(np.maximum(np.maximum(c0, c1), c2)), n_cols - 1).astype(np.int64)
+        row_min = np.maximum(np.ceil(np.minimum(np.minimum(r0, r1), r2)), 0).astype(np.int64)
+        row_max = np.minimum(np.floor(np.maximum(np.maximum(r0, r1), r2)), n_rows - 1).astype(np.int64)
+        width = np.maximum(col_max - col_min + 1, 0)
+        counts = width * np.maximum(row_max - row_min + 1, 0)
+        # only the triangles over at least one centre
+        (covering,) = np.nonzero(counts)
+        if not len(covering):
+            continue
+        width, counts, col_min, row_min = width[covering], counts[covering], col_min[covering], row_min[covering]
+        face, c0, r0 = face[covering], c0[covering], r0[covering]
+
+        # the barycentric coordinates (w1, w2) and the elevation as linear functions of the offsets of a centre
+        # from the first corner of the bounding box of the triangle
+        dc1, dc2 = c1[covering] - c0, c2[covering] - c0
+        dr1, dr2 = r1[covering] - r0, r2[covering] - r0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            inverse = 1 / (dc1 * dr2 - dc2 * dr1)
+        z0 = vertices[face[:, 0], 2]
+        dz1, dz2 = vertices[face[:, 1], 2] - z0, vertices[face[:, 2], 2] - z0
+        w1_col, w1_row, w2_col, w2_row = dr2 * inverse, -dc2 * inverse, -dr1 * inverse, dc1 * inverse
+        offset_col, offset_row = col_min - c0, row_min - r0
+        w1_base = offset_col * w1_col + offset_row * w1_row
+        w2_base = offset_col * w2_col + offset_row * w2_row
+        z_col, z_row = w1_col * dz1 + w2_col * dz2, w1_row * dz1 + w2_row * dz2
+        z_base = z0 + offset_col * z_col + offset_row * z_row
+
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        for window_start in range(0, int(ends[-1]), batch_size):
+            window_stop = min(window_start + batch_size, int(ends[-1]))
+            first = np.searchsorted(ends, window_start, side='right')
+            last = np.searchsorted(ends, window_stop - 1, side='right') + 1
+            # the number of centres of each triangle in the window, clipped to the window at both ends
+            repeats = np.minimum(ends[first:last], window_stop) - np.maximum(starts[first:last], window_start)
+            local = np.arange(window_start, window_stop) - np.repeat(starts[first:last], repeats)
+            triangle_width = np.repeat(width[first:last], repeats)
+            local_row, local_col = np.divmod(local, triangle_width)
+
+            w1 = np.repeat(w1_base[first:last], repeats) + local_col * np.repeat(w1_col[first:last], repeats) + \
+                local_row * np.repeat(w1_row[first:last], repeats)
+            w2 = np.repeat(w2_base[first:last], repeats) + local_col * np.repeat(w2_col[first:last], repeats) + \
+                local_row * np.repeat(w2_row[first:last], repeats)
+            tolerance = 1e-9
+            inside = (w1 >= -tolerance) & (w2 >= -tolerance) & (w1 + w2 <= 1 + tolerance)
+            elevation = np.repeat(z_base[first:last], repeats) + local_col * np.repeat(z_col[first:last], repeats) + \
+                local_row * np.repeat(z_row[first:last], repeats)
+            node = (np.repeat(row_min[first:last], repeats) + local_row) * n_cols + \
+                np.repeat(col_min[first:last], repeats) + local_col
+            np.fmax.at(result, node[inside], elevation[inside])
+    return result.reshape(n_rows, n_cols)
@@ -1,20 +1,257 @@
 from pathlib import Path
+from typing import Literal, Optional, Union
 
+import numpy as np
+import omf
+import xarray as xr
 
+from omf_io.utils.decorators import requires_dependency
+from omf_io.utils.file import write_omf_element_chunked
+
+try:
+    import rasterio
+    import rasterio.shutil
+    from rasterio.enums import Resampling
+    from rasterio.windows import Window
+except ImportError:
+    rasterio = None
+
+
+@requires_dependency('rasterio', rasterio)
 def export_grid_surface_to_raster(
-        grid_surface,
+        grid_surface: xr.DataArray,
         output_file: Path,
-        format: str = "GeoTIFF",
+        format: Literal['GeoTIFF', 'COG'] = "GeoTIFF",
+        blocksize: int = 512,
+        compress: Optional[str] = 'deflate',
+        overviews: Union[None, Literal['auto'], list[int]] = None,
+        resampling: str = 'average',
+        num_threads: Union[int, str] = 'ALL_CPUS',
+        cache_size: int = 64,
         **kwargs,
-):
-    """Export a grid surface to a raster file.
+) -> Path:
+    """Export a grid surface to a tiled, compressed raster file, window by window.
 
-    ..todo:: Implement the export_grid_surface_to_raster function
+    The raster is written one dask chunk at a time (or one strip of tiles for data in memory), so the peak
+    memory is bounded by the chunk size rather than the raster size.  Compression runs on multiple threads
+    in GDAL (the NUM_THREADS option).
+
+    A Cloud-Optimized GeoTIFF can only be created by copying a complete dataset, so for format='COG' the
+    raster is first streamed to a temporary tiled GeoTIFF beside the output, which GDAL then copies into COG
+    layout with overviews, again block by block.
 
     Args:
-        grid_surface: The grid surface data.
+        grid_surface (xarray.DataArray): The grid surface data, with y and x (and optionally band) dimensions,
+            and rioxarray spatial metadata.
         output_file (Path): The output raster file path.
-        format (str): The format of the output raster file. Default is "GeoTIFF".
-        **kwargs: Additional keyword arguments for the export function.
+        format (Literal['GeoTIFF', 'COG']): The format of the output raster file. Default is "GeoTIFF".
+        blocksize (int): The tile width and height, a multiple of 16.
+        compress (str, optional): The compression, e.g. 'deflate', 'lzw' or 'zstd'.  None for no compression.
+        overviews (optional): The overview decimation factors, or 'auto' for factors of two down to a single
+            tile.  COG files always have overviews.
+        resampling (str): The overview resampling method, e.g. 'average', 'nearest' or 'bilinear'.
+        num_threads (int | str): The number of compression threads, or 'ALL_CPUS'.
+        cache_size (int): The GDAL block cache size in MB used while copying into COG layout.
+        **kwargs: Additional creation options for the GeoTIFF driver, e.g. predictor=3.
+
+    Returns:
+        Path: The output file path.
+
+    Raises:
+        ValueError: If the format is not supported, or the block size is not a multiple of 16.
+    """
+    output_file = Path(output_file)
+    if format not in ('GeoTIFF', 'COG'):
+        raise ValueError(f"Unsupported raster format: {format}")
+    if blocksize % 16:
+        raise ValueError("The block size must be a multiple of 16.")
+
+    data = grid_surface if 'band' in grid_surface.dims else grid_surface.expand_dims('band')
+    data = data.transpose('band', 'y', 'x')
+    nodata = grid_surface.rio.encoded_nodata
+    if nodata is None:
+        nodata = grid_surface.rio.nodata
+    if nodata is None and np.issubdtype(data.dtype, np.floating):
+        nodata = np.nan
+
+    profile = dict(driver='GTiff', width=data.sizes['x'], height=data.sizes['y'], count=data.sizes['band'],
+                   dtype=data.dtype, crs=grid_surface.rio.crs, transform=grid_surface.rio.transform(),
+                   nodata=nodata, tiled=True, blockxsize=blocksize, blockysize=blocksize, num_threads=num_threads,
+                   bigtiff='IF_SAFER', **kwargs)
+    if compress:
+        profile['compress'] = compress
+
+    target = output_file.with_name(output_file.stem + '.tmp.tif') if format == 'COG' else output_file
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with rasterio.open(target, 'w', **profile) as dst:
+            for window, values in _raster_windows(data, blocksize):
+                if nodata is not None and not np.isnan(nodata) and np.issubdtype(values.dtype, np.floating):
+                    values = np.where(np.isnan(values), nodata, values)
+                dst.write(values, window=window)
+            if overviews is not None and format == 'GeoTIFF':
+                factors = _overview_factors(data.sizes['y'], data.sizes['x'], blocksize) \
+                    if overviews == 'auto' else list(overviews)
+                dst.build_overviews(factors, Resampling[resampling])
+                dst.update_tags(ns='rio_overview', resampling=resampling)
+        if format == 'COG':
+            options = dict(BLOCKSIZE=blocksize, NUM_THREADS=num_threads, RESAMPLING=resampling.upper(),
+                           BIGTIFF='IF_SAFER')
+            if compress:
+                options['COMPRESS'] = compress.upper()
+            if overviews is not None and overviews != 'auto':
+                options['OVERVIEW_COUNT'] = len(overviews)
+            # bound the GDAL block cache, which otherwise grows with the raster as the overviews are built
+            with rasterio.Env(GDAL_CACHEMAX=cache_size):
+                rasterio.shutil.copy(target, output_file, driver='COG', **options)
+    finally:
+        if format == 'COG' and target.exists():
+            target.unlink()
+    return output_file
+
+
+def _raster_windows(data: xr.DataArray, blocksize: int):
+    """Yield (window, values) pairs covering a (band, y, x) raster, one dask chunk or strip of tiles at a time.
+
+    The chunks are first rechunked to whole multiples of the block size, so that every window covers whole
+    tiles and no tile is written by two windows.
+    """
+    if data.chunks is not None:
+        chunks = data.data.rechunk({axis: max(blocksize, max(data.chunks[axis]) // blocksize * blocksize)
+                                    for axis in (1, 2)})
+        row_starts = np.cumsum((0,) + chunks.chunks[1])
+        col_starts = np.cumsum((0,) + chunks.chunks[2])
+        for i in range(len(row_starts) - 1):
+            for j in range(len(col_starts) - 1):
+                block = chunks.blocks[:, i, j]
+                window = Window(col_starts[j], row_starts[i], col_starts[j + 1] - col_starts[j],
+                                row_starts[i + 1] - row_starts[i])
+                yield window, np.asarray(block.compute())
+    else:
+        values = data.values
+        for row in range(0, values.shape[1], blocksize):
+            height = min(blocksize, values.shape[1] - row)
+            yield Window(0, row, values.shape[2], height), values[:, row:row + height]
+
+
+def _overview_factors(height: int, width: int, blocksize: int) -> list[int]:
+    """Factors of two, until the overview fits in a single tile."""
+    factors = []
+    factor = 2
+    while max(height, width) / (factor // 2) > blocksize:
+        factors.append(factor)
+        factor *= 2
+    return factors
+
+
+def export_grid_surface_to_omf(grid_surface, element_name: str, output_file: Path, transform=None,
+                               attributes: Optional[dict] = None, overwrite: bool = False,
+                               strip_bytes: int = 64 * 1024 * 1024) -> Path:
+    """Export a grid surface to an OMF TensorGridSurface element, streaming the arrays chunk by chunk.
+
+    The raster cell centres become the grid nodes.  The corner, axes and spacing come from the affine
+    transform, the node elevations are written as the node offsets, and any attribute grids as numeric
+    vertex attributes.  OMF orders the nodes with u (the raster columns) varying fastest and v upwards, so
+    the rows are written as strips of dask chunks (or of rows, for arrays in memory) from the bottom of a
+    north-up raster, and only one strip is held in memory at a time.
+
+    Args:
+        grid_surface: The elevations, as an (y, x) xarray.DataArray with rioxarray spatial metadata, or a 2D
+            NumPy or dask array.
+        element_name (str): The name of the TensorGridSurface element.
+        output_file (Path): The OMF file, created if it does not exist.
+        transform (affine.Affine, optional): The affine transform of the raster.  Taken from the DataArray
+            if None.
+        attributes (dict, optional): Attribute grids of the same shape, keyed by name.
+        overwrite (bool): Whether to replace an element of the same name.
+        strip_bytes (int): The approximate size of the strips of arrays held in memory.
+
+    Returns:
+        Path: The output file.
+
+    Raises:
+        ValueError: If there is no transform, or the arrays are not 2D grids of one shape.
+    """
+    if transform is None:
+        if not isinstance(grid_surface, xr.DataArray):
+            raise ValueError("A transform is required for arrays without spatial metadata.")
+        transform = grid_surface.rio.transform()
+    grids = {None: grid_surface, **(attributes or {})}
+    grids = {name: grid.transpose('y', 'x').data if isinstance(grid, xr.DataArray) else grid
+             for name, grid in grids.items()}
+    shape = grids[None].shape
+    if len(shape) != 2 or any(grid.shape != shape for grid in grids.values()):
+        raise ValueError("The grid surface and attributes must be 2D arrays of the same shape.")
+    n_rows, n_cols = shape
+
+    # the corner node is the centre of the first cell of the first row written
+    north_up = transform.e < 0
+    axis_u = np.array([transform.a, transform.d, 0.0])
+    axis_v = -np.array([transform.b, transform.e, 0.0]) if north_up else np.array([transform.b, transform.e, 0.0])
+    corner_x, corner_y = transform * (0.5, n_rows - 0.5) if north_up else transform * (0.5, 0.5)
+    surface = omf.TensorGridSurface(name=element_name, tensor_u=[np.linalg.norm(axis_u)] * (n_cols - 1),
+                                    tensor_v=[np.linalg.norm(axis_v)] * (n_rows - 1),
+                                    axis_u=axis_u / np.linalg.norm(axis_u), axis_v=axis_v / np.linalg.norm(axis_v),
+                                    corner=[corner_x, corner_y, 0.0], offset_w=np.zeros(1))
+    surface.attributes = [omf.NumericAttribute(name=name, array=np.zeros(1), location='vertices')
+                          for name in grids if name is not None]
+
+    array_chunks = {}
+    for i, (name, grid) in enumerate(grids.items()):
+        dtype = np.dtype(grid.dtype)
+        if dtype.kind not in 'fiu':
+            raise ValueError(f"Unsupported data type for an OMF grid surface: {dtype}")
+        if name is None and dtype.kind != 'f':
+            dtype = np.dtype(np.float64)
+        path = ('offset_w',) if name is None else ('attributes', i - 1, 'array')
+        array_chunks[path] = (n_rows * n_cols, dtype, _node_strips(grid, north_up, strip_bytes))
+    return write_omf_element_chunked(surface, Path(output_file), array_chunks, overwrite=overwrite)
+
+
+def _node_strips(grid, flip: bool, strip_bytes: int):
+    """Yield strips of grid rows in OMF node order, one strip of dask chunks (or of rows) at a time."""
+    n_rows, n_cols = grid.shape
+    if hasattr(grid, 'chunks') and not isinstance(grid, np.ndarray):
+        row_starts = np.cumsum((0,) + grid.chunks[0])
+        strips = list(zip(row_starts[:-1], row_starts[1:]))
+    else:
+        rows_per_strip = max(1, strip_bytes // max(1, n_cols * grid.dtype.itemsize))
+        strips = [(start, min(start + rows_per_strip, n_rows)) for start in range(0, n_rows, rows_per_strip)]
+    for start, stop in (strips[::-1] if flip else strips):
+        strip = np.asarray(grid[start:stop])
+        yield strip[::-1] if flip else strip
+
+
+def export_grid_surface_levels(levels: list[xr.DataArray], output_path: Path, element_name: str = 'grid_surface',
+                               file_format: Literal['omf', 'tif'] = 'omf', overwrite: bool = False,
+                               **kwargs) -> list:
+    """Export the levels of a grid pyramid, named '<element_name>_lod<level>'.
+
+    Args:
+        levels (list[xarray.DataArray]): The grids of the levels.
+        output_path (Path): The OMF file for the elements, or the directory for the GeoTIFF files.
+        element_name (str): The base name of the levels.
+        file_format (Literal['omf', 'tif']): Write the levels as OMF TensorGridSurface elements or tiled
+            GeoTIFF files.
+        overwrite (bool): Whether to replace OMF elements of the same names.
+        **kwargs: Additional arguments for `export_grid_surface_to_raster`, e.g. compress.
+
+    Returns:
+        list: The element names (OMF) or file paths (GeoTIFF) of the levels.
+
+    Raises:
+        ValueError: If the file format is not supported.
     """
-    pass
+    output_path = Path(output_path)
+    names = [f"{element_name}_lod{level}" for level in range(len(levels))]
+    if file_format == 'omf':
+        for name, grid in zip(names, levels):
+            export_grid_surface_to_omf(grid, name, output_path, overwrite=overwrite)
+        return names
+    if file_format == 'tif':
+        output_path.mkdir(parents=True, exist_ok=True)
+        paths = [output_path / f"{name}.tif" for name in names]
+        for path, grid in zip(paths, levels):
+            export_grid_surface_to_raster(grid, path, **kwargs)
+        return paths
+    raise ValueError(f"Unsupported file format: {file_format}")
@@ -1,13 +1,26 @@
+from typing import TYPE_CHECKING, Literal, Optional, Union
+
+import numpy as np
+import omf
 import xarray as xr
 from pathlib import Path
 from .validation import validate_grid_surface_data
-from .importers import import_raster_as_grid_surface
-from .exporters import export_grid_surface_to_raster
+from .importers import (import_raster_as_grid_surface, import_grid_surface_from_omf, clip_raster, Chunks,
+                        grid_surface_from_array)
+from .exporters import export_grid_surface_to_raster, export_grid_surface_to_omf, export_grid_surface_levels
+from .resampling import coarsen_grid, grid_pyramid, resample_grid, sample_grid, grid_from_bounds, Reduction
+from .conversion import grid_to_mesh, rasterize_mesh
+
+if TYPE_CHECKING:
+    from omf_io.surface import SurfaceIO  # For type hinting only
 
 
 class GridSurfaceIO:
     """
     Handles the creation and consumption of grid surface (raster) objects.
+
+    The surface data may be held lazily as a dask-backed DataArray, in which case values are only read from
+    the source file when they are computed.
     """
 
     def __init__(self, surface_data: xr.DataArray):
@@ -21,27 +34,268 @@ class GridSurfaceIO:
         self.surface_data = surface_data
 
     @classmethod
-    def from_raster(cls, raster_file: Path, **kwargs):
+    def from_raster(cls, raster_file: Path, chunks: Chunks = True,
+                    bounds: Optional[tuple[float, float, float, float]] = None, band: Optional[int] = 1, **kwargs):
         """
-        Create a GridSurfaceIO instance from a raster file.
+        Create a GridSurfaceIO instance from a raster file, opened lazily.
 
         Args:
             raster_file (Path): The input raster file path.
-            **kwargs: Additional arguments for the import function.
+            chunks: The dask chunking - True for multiples of the file's tiles, 'auto', a chunk size, or a
+                mapping of dimension name to chunk size.  None reads the raster into memory eagerly.
+            bounds (tuple, optional): The region (xmin, xmax, ymin, ymax) to clip to.  Only the overlapping
+                tiles are read when the values are computed.
+            band (int, optional): The (1-based) band holding the elevations.  None keeps all bands.
+            **kwargs: Additional arguments for `rioxarray.open_rasterio`.
 
         Returns:
             GridSurfaceIO: An instance of the class.
         """
-        surface_data = import_raster_as_grid_surface(raster_file, **kwargs)
+        surface_data = import_raster_as_grid_surface(raster_file, chunks=chunks, bounds=bounds, band=band, **kwargs)
         return cls(surface_data)
 
-    def to_raster(self, output_file: Path, format: str = "GeoTIFF", **kwargs):
+    @classmethod
+    def from_omf(cls, omf_input: Union[Path, omf.Project], surface_name: str, crs: Optional[str] = None):
+        """
+        Create a GridSurfaceIO instance from an OMF TensorGridSurface.
+
+        Args:
+            omf_input (Union[Path, omf.Project]): The OMF file path or project object.
+            surface_name (str): The name of the TensorGridSurface element.
+            crs (str, optional): The coordinate reference system of the grid, which OMF does not record.
+
+        Returns:
+            GridSurfaceIO: An instance of the class.
+        """
+        return cls(import_grid_surface_from_omf(omf_input, surface_name, crs=crs))
+
+    @classmethod
+    def from_surface(cls, surface: "SurfaceIO", resolution: Optional[float] = None,
+                     bounds: Optional[tuple[float, float, float, float]] = None,
+                     like: Optional["GridSurfaceIO"] = None, crs: Optional[str] = None,
+                     batch_size: int = 1_000_000):
+        """
+        Create a GridSurfaceIO instance by rasterizing a triangulated surface.
+
+        The elevation at each cell centre is interpolated from the triangle above or below it, taking the
+        highest where triangles overlap in plan.  Cells outside the surface are NaN.
+
+        Args:
+            surface (SurfaceIO): The triangulated surface.
+            resolution (float, optional): The cell size of a north-up grid covering the bounds.
+            bounds (tuple, optional): The region (xmin, xmax, ymin, ymax) of the grid.  Defaults to the XY
+                extent of the surface.
+            like (GridSurfaceIO, optional): A surface whose grid (and crs) is used in place of the resolution.
+            crs (str, optional): The coordinate reference system of the grid.
+            batch_size (int): The approximate number of cell centres interpolated at once.
+
+        Returns:
+            GridSurfaceIO: An instance of the class.
+
+        Raises:
+            ValueError: If neither a resolution nor a grid to match is given.
+        """
+        if like is not None:
+            transform, shape = like.surface_data.rio.transform(), like.shape
+            crs = crs if crs is not None else like.surface_data.rio.crs
+        elif resolution is not None:
+            if bounds is None:
+                (xmin, ymin), (xmax, ymax) = surface.vertices[:, :2].min(axis=0), surface.vertices[:, :2].max(axis=0)
+                bounds = (xmin, xmax, ymin, ymax)
+            transform, shape = grid_from_bounds(bounds, resolution)
+        else:
+            raise ValueError("Either a resolution or a grid surface to match is required.")
+        values = rasterize_mesh(surface.vertices, surface.faces, transform, shape, batch_size=batch_size)
+        return cls(grid_surface_from_array(values, transform, crs=crs))
+
+    @property
+    def is_lazy(self) -> bool:
+        """True if the values are held as a dask array, and not yet read."""
+        return self.surface_data.chunks is not None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The number of (rows, columns) of the grid."""
+        return self.surface_data.sizes['y'], self.surface_data.sizes['x']
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """The extent (xmin, xmax, ymin, ymax) of the grid cells."""
+        xmin, ymin, xmax, ymax = self.surface_data.rio.bounds()
+        return xmin, xmax, ymin, ymax
+
+    @property
+    def resolution(self) -> tuple[float, float]:
+        """The (x, y) cell size, with y negative for north-up rasters."""
+        return self.surface_data.rio.resolution()
+
+    def clip(self, bounds: tuple[float, float, float, float]) -> "GridSurfaceIO":
+        """
+        Clip the grid surface to the cells that overlap a region.  A lazy surface stays lazy.
+
+        Args:
+            bounds (tuple): The region (xmin, xmax, ymin, ymax).
+
+        Returns:
+            GridSurfaceIO: A new instance holding the clipped surface.
+        """
+        return self.__class__(clip_raster(self.surface_data, bounds))
+
+    def load(self) -> "GridSurfaceIO":
+        """
+        Read the values of a lazy grid surface into memory.
+
+        Returns:
+            GridSurfaceIO: A new instance holding the values in memory.
+        """
+        return self.__class__(self.surface_data.compute())
+
+    def sample(self, x: np.ndarray, y: np.ndarray, method: Literal['bilinear', 'nearest'] = 'bilinear') -> np.ndarray:
+        """
+        Sample the grid surface at points.  For a lazy surface, only the chunks the points fall in are read.
+
+        Args:
+            x (np.ndarray): The x coordinates of the points.
+            y (np.ndarray): The y coordinates of the points.
+            method (Literal['bilinear', 'nearest']): The interpolation method.
+
+        Returns:
+            np.ndarray: The elevations at the points, NaN outside the grid or over nodata.
+        """
+        return sample_grid(self.surface_data, x, y, method=method)
+
+    def to_surface(self) -> "SurfaceIO":
+        """
+        Triangulate the grid surface, with a vertex at each valid cell centre and two triangles per square of
+        centres.  Nodata cells leave holes in the surface.
+
+        Returns:
+            SurfaceIO: The triangulated surface.
+        """
+        from omf_io.surface import SurfaceIO
+
+        vertices, faces = grid_to_mesh(self.surface_data.transpose('y', 'x').values,
+                                       self.surface_data.rio.transform())
+        return SurfaceIO(vertices, faces)
+
+    def coarsen(self, factor: int, method: Reduction = 'mean') -> "GridSurfaceIO":
         """
-        Prepare the grid surface data for export to a raster file.
+        Coarsen the grid surface by an integer factor, reducing blocks of cells.  A lazy surface stays lazy.
+
+        Args:
+            factor (int): The number of cells along each side of a block.
+            method (Reduction): The block reduction - 'mean', 'min', 'max' or 'nearest'.
+
+        Returns:
+            GridSurfaceIO: A new instance holding the coarsened surface.
+        """
+        return self.__class__(coarsen_grid(self.surface_data, factor, method=method))
+
+    def pyramid(self, n_levels: Optional[int] = None, factor: int = 2, method: Reduction = 'mean',
+                min_size: int = 256) -> list["GridSurfaceIO"]:
+        """
+        Build a multi-resolution pyramid of the grid surface.
+
+        Args:
+            n_levels (int, optional): The number of coarsened levels.  If None, levels are added until the
+                larger side of a level is no more than min_size cells.
+            factor (int): The coarsening from one level to the next.
+            method (Reduction): The block reduction - 'mean', 'min', 'max' or 'nearest'.
+            min_size (int): The size of the coarsest level when n_levels is None.
+
+        Returns:
+            list[GridSurfaceIO]: The levels, starting with this (full resolution) surface.
+        """
+        levels = grid_pyramid(self.surface_data, n_levels=n_levels, factor=factor, method=method,
+                              min_size=min_size)
+        return [self] + [self.__class__(level) for level in levels[1:]]
+
+    def resample(self, resolution: Optional[float] = None,
+                 bounds: Optional[tuple[float, float, float, float]] = None,
+                 like: Optional["GridSurfaceIO"] = None, method: Literal['bilinear', 'nearest'] = 'bilinear',
+                 chunks: tuple[int, int] = (1024, 1024)) -> "GridSurfaceIO":
+        """
+        Resample the grid surface onto a target grid, chunk by chunk.  A lazy surface stays lazy.
+
+        The target grid is either the grid of another surface, or a north-up grid of square cells of the
+        resolution covering the bounds.
+
+        Args:
+            resolution (float, optional): The cell size of the target grid.  Defaults to the current cell width.
+            bounds (tuple, optional): The region (xmin, xmax, ymin, ymax) of the target grid.  Defaults to the
+                current bounds.
+            like (GridSurfaceIO, optional): A surface whose grid is the target grid.
+            method (Literal['bilinear', 'nearest']): The interpolation method.
+            chunks (tuple[int, int]): The (rows, columns) of the target chunks of a lazy surface.
+
+        Returns:
+            GridSurfaceIO: A new instance holding the resampled surface.
+        """
+        if like is not None:
+            transform, shape = like.surface_data.rio.transform(), like.shape
+        else:
+            resolution = resolution if resolution is not None else abs(self.resolution[0])
+            transform, shape = grid_from_bounds(bounds if bounds is not None else self.bounds, resolution)
+        return self.__class__(resample_grid(self.surface_data, transform, shape, method=method, chunks=chunks))
+
+    def to_pyramid(self, output_path: Path, element_name: str = 'grid_surface',
+                   file_format: Literal['omf', 'tif'] = 'omf', n_levels: Optional[int] = None, factor: int = 2,
+                   method: Reduction = 'mean', overwrite: bool = False, **kwargs) -> list:
+        """
+        Build a multi-resolution pyramid and write the levels as OMF grid surfaces or GeoTIFF files.
+
+        Args:
+            output_path (Path): The OMF file for the elements, or the directory for the GeoTIFF files.
+            element_name (str): The base name of the levels, suffixed with '_lod<level>'.
+            file_format (Literal['omf', 'tif']): Write the levels as elements of one OMF file, or as tiled
+                GeoTIFF files.
+            n_levels (int, optional): The number of coarsened levels, see `pyramid`.
+            factor (int): The coarsening from one level to the next.
+            method (Reduction): The block reduction - 'mean', 'min', 'max' or 'nearest'.
+            overwrite (bool): Whether to replace OMF elements of the same names.
+            **kwargs: Additional arguments for the raster export, e.g. compress.
+
+        Returns:
+            list: The element names (OMF) or file paths (GeoTIFF) of the levels, starting with full resolution.
+        """
+        levels = self.pyramid(n_levels=n_levels, factor=factor, method=method)
+        return export_grid_surface_levels([level.surface_data for level in levels], output_path,
+                                          element_name=element_name, file_format=file_format,
+                                          overwrite=overwrite, **kwargs)
+
+    def to_omf(self, element_name: str, output_file: Path, attributes: Optional[dict] = None,
+               overwrite: bool = False) -> Path:
+        """
+        Export the grid surface to an OMF TensorGridSurface element, streaming the arrays chunk by chunk.
+
+        Args:
+            element_name (str): The name of the TensorGridSurface element.
+            output_file (Path): The OMF file, created if it does not exist.
+            attributes (dict, optional): Attribute grids of the same shape, keyed by name.
+            overwrite (bool): Whether to replace an element of the same name.
+
+        Returns:
+            Path: The output file.
+        """
+        return export_grid_surface_to_omf(self.surface_data, element_name, output_file, attributes=attributes,
+                                          overwrite=overwrite)
+
+    def to_raster(self, output_file: Path, format: Literal['GeoTIFF', 'COG'] = "GeoTIFF", blocksize: int = 512,
+                  compress: Optional[str] = 'deflate', overviews: Union[None, str, list[int]] = None,
+                  **kwargs) -> Path:
+        """
+        Export the grid surface data to a tiled, compressed raster file, window by window.
 
         Args:
             output_file (Path): The output raster file path.
-            format (str): The format of the output raster file. Default is "GeoTIFF".
-            **kwargs: Additional arguments for the export function.
+            format (Literal['GeoTIFF', 'COG']): The format of the output raster file. Default is "GeoTIFF".
+            blocksize (int): The tile width and height, a multiple of 16.
+            compress (str, optional): The compression, e.g. 'deflate', 'lzw' or 'zstd'.
+            overviews (optional): The overview decimation factors, or 'auto'.  COG files always have overviews.
+            **kwargs: Additional arguments for the export function, e.g. resampling or num_threads.
+
+        Returns:
+            Path: The output file path.
         """
-        export_grid_surface_to_raster(self.surface_data, output_file, format=format, **kwargs)
\ No newline at end of file
+        return export_grid_surface_to_raster(self.surface_data, output_file, format=format, blocksize=blocksize,
+                                             compress=compress, overviews=overviews, **kwargs)
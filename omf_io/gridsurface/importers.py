@@ -1,38 +1,161 @@
+from typing import Optional, Union
+
+import numpy as np
+import omf
 import xarray as xr
 from pathlib import Path
 
+from omf_io.utils.file import load_omf_element
+
+try:
+    import rioxarray
+except ImportError:
+    rioxarray = None
+
+# the chunking of a lazily read raster: True for multiples of the internal tiles of the file, 'auto', a chunk size
+# for every dimension, or a mapping of dimension name to chunk size
+Chunks = Union[bool, str, int, dict, None]
 
-def load_raster_with_rioxarray(raster_file: Path):
-    """Load a raster file using rioxarray.
 
-    .. todo:: Implement the load_raster_with_rioxarray function
+def load_raster_with_rioxarray(raster_file: Path, chunks: Chunks = True,
+                               bounds: Optional[tuple[float, float, float, float]] = None,
+                               band: Optional[int] = 1, masked: bool = True, **kwargs) -> xr.DataArray:
+    """Load a raster file lazily using rioxarray.
+
+    The raster is opened as a dask-backed DataArray, so no values are read until they are needed.  Clipping
+    to bounds only slices the lazy array, so computing the clipped raster reads only the overlapping chunks.
+    With chunks=True the chunks are sized by dask's chunk size setting in multiples of the internal tiles
+    (blocks) of the file, so that every chunk is read as whole tiles.
 
     Args:
         raster_file (Path): The input raster file path.
+        chunks: The dask chunking - True for multiples of the file's tiles, 'auto', a chunk size, or a mapping
+            of dimension name to chunk size.  None reads the raster into memory eagerly.
+        bounds (tuple, optional): The region (xmin, xmax, ymin, ymax) to clip to.
+        band (int, optional): The (1-based) band to select, dropping the band dimension.  None keeps all bands.
+        masked (bool): If True, the nodata value is read as NaN.
+        **kwargs: Additional keyword arguments for `rioxarray.open_rasterio`.
 
     Returns:
         xarray.DataArray: The raster data with geospatial metadata.
+
+    Raises:
+        ValueError: If the bounds do not overlap the raster.
     """
-    try:
-        import rioxarray  # Ensure rioxarray is available
-    except ImportError:
+    if rioxarray is None:
         raise ImportError("rioxarray is not installed. Install it with `pip install rioxarray`.")
 
-    # Open the raster file as an xarray.DataArray
-    raster = rioxarray.open_rasterio(raster_file)
+    # Open the raster file as an xarray.DataArray, lazily if chunked
+    raster = rioxarray.open_rasterio(raster_file, chunks=chunks, masked=masked, **kwargs)
+    if band is not None and 'band' in raster.dims:
+        raster = raster.sel(band=band, drop=True)
+    if bounds is not None:
+        raster = clip_raster(raster, bounds)
     return raster
 
 
-def import_raster_as_grid_surface(raster_file: Path, **kwargs) -> xr.DataArray:
+def clip_raster(raster: xr.DataArray, bounds: tuple[float, float, float, float]) -> xr.DataArray:
+    """Clip a raster to the cells that overlap the bounds, without reading a lazy raster.
+
+    Args:
+        raster (xarray.DataArray): The raster, with x and y coordinates at the cell centres.
+        bounds (tuple): The region (xmin, xmax, ymin, ymax).
+
+    Returns:
+        xarray.DataArray: The clipped raster.
+
+    Raises:
+        ValueError: If the bounds do not overlap the raster.
+    """
+    from rioxarray.exceptions import NoDataInBounds
+
+    xmin, xmax, ymin, ymax = bounds
+    try:
+        return raster.rio.clip_box(minx=xmin, miny=ymin, maxx=xmax, maxy=ymax)
+    except NoDataInBounds as e:
+        raise ValueError(f"The bounds {bounds} do not overlap the raster.") from e
+
+
+def import_raster_as_grid_surface(raster_file: Path, chunks: Chunks = True,
+                                  bounds: Optional[tuple[float, float, float, float]] = None,
+                                  band: Optional[int] = 1, **kwargs) -> xr.DataArray:
     """Import a raster file as a grid surface.
 
     Args:
         raster_file (Path): The input raster file path.
+        chunks: The dask chunking, see `load_raster_with_rioxarray`.  None reads the raster eagerly.
+        bounds (tuple, optional): The region (xmin, xmax, ymin, ymax) to clip to.
+        band (int, optional): The (1-based) band holding the elevations.
         **kwargs: Additional keyword arguments for rioxarray.
 
     Returns:
         xarray.DataArray: The imported grid surface data.
     """
-    raster = load_raster_with_rioxarray(raster_file)
-    # Apply any additional processing or transformations here
-    return raster
+    return load_raster_with_rioxarray(raster_file, chunks=chunks, bounds=bounds, band=band, **kwargs)
+
+
+def grid_surface_from_array(values, transform, crs=None, name: Optional[str] = None) -> xr.DataArray:
+    """Build a grid surface from a 2D array of cell values and its affine transform.
+
+    Args:
+        values: The (rows, columns) NumPy or dask array of cell values.
+        transform (affine.Affine): The affine transform of an axis-aligned grid.
+        crs (optional): The coordinate reference system.
+        name (str, optional): The name of the grid surface.
+
+    Returns:
+        xarray.DataArray: The grid surface data, with y and x coordinates at the cell centres.
+    """
+    n_rows, n_cols = values.shape
+    x = transform.c + (np.arange(n_cols) + 0.5) * transform.a
+    y = transform.f + (np.arange(n_rows) + 0.5) * transform.e
+    grid = xr.DataArray(values, coords={'y': y, 'x': x}, dims=('y', 'x'), name=name)
+    if rioxarray is not None:
+        grid = grid.rio.write_transform(transform)
+        if crs is not None:
+            grid = grid.rio.write_crs(crs)
+        if np.issubdtype(grid.dtype, np.floating):
+            grid = grid.rio.write_nodata(np.nan)
+    return grid
+
+
+def import_grid_surface_from_omf(omf_input: Union[Path, omf.Project], surface_name: str,
+                                 crs: Optional[str] = None) -> xr.DataArray:
+    """Import an OMF TensorGridSurface as a north-up grid surface.
+
+    The grid nodes become the cell centres of the raster, and the node elevations (the corner elevation plus
+    the node offsets) its values.
+
+    Args:
+        omf_input (Union[Path, omf.Project]): The OMF file path or project object.
+        surface_name (str): The name of the TensorGridSurface element.
+        crs (str, optional): The coordinate reference system of the grid, which OMF does not record.
+
+    Returns:
+        xarray.DataArray: The grid surface data, with y (descending) and x dimensions.
+
+    Raises:
+        ValueError: If the grid is rotated, or its cells are not uniform in each direction.
+    """
+    surface = load_omf_element(omf_input, surface_name, omf.TensorGridSurface)
+    if not (np.allclose(surface.axis_u, [1, 0, 0]) and np.allclose(surface.axis_v, [0, 1, 0])):
+        raise ValueError(f"The grid surface '{surface_name}' is rotated, and cannot be held as a raster.")
+    tensor_u, tensor_v = np.asarray(surface.tensor_u), np.asarray(surface.tensor_v)
+    if not (np.allclose(tensor_u, tensor_u[0]) and np.allclose(tensor_v, tensor_v[0])):
+        raise ValueError(f"The grid surface '{surface_name}' has irregular cells, and cannot be held as a raster.")
+
+    corner = np.asarray(surface.corner, dtype=np.float64)
+    x = corner[0] + np.r_[0, np.cumsum(tensor_u)]
+    y = corner[1] + np.r_[0, np.cumsum(tensor_v)]
+    if surface.offset_w is None:
+        offsets = np.zeros((len(y), len(x)))
+    else:
+        # the node offsets are ordered with u varying fastest
+        offsets = np.asarray(surface.offset_w.array, dtype=np.float64).reshape(len(y), len(x))
+    grid = xr.DataArray((corner[2] + offsets)[::-1], coords={'y': y[::-1], 'x': x}, dims=('y', 'x'),
+                        name=surface_name)
+    if rioxarray is not None:
+        grid = grid.rio.write_nodata(np.nan)
+        if crs is not None:
+            grid = grid.rio.write_crs(crs)
+    return grid
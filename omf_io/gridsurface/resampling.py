@@ -0,0 +1,322 @@
+from typing import Literal, Optional
+
+import numpy as np
+import xarray as xr
+from affine import Affine
+
+from .importers import grid_surface_from_array
+
+try:
+    import dask
+    import dask.array as da
+except ImportError:
+    dask = None
+
+Reduction = Literal['mean', 'min', 'max', 'nearest']
+
+
+def coarsen_grid(grid: xr.DataArray, factor: int, method: Reduction = 'mean') -> xr.DataArray:
+    """Coarsen a grid by an integer factor, reducing each factor x factor block of cells to one cell.
+
+    The blocks are reduced by reshaping the values to (rows, factor, columns, factor) and reducing the block
+    axes, chunk by chunk for a lazy grid, after rechunking so that every chunk holds whole blocks.  The last
+    row and column of blocks may extend past the grid, and are reduced over the cells they cover.  NaN cells
+    are ignored, so a block is only NaN if all of its cells are.
+
+    Args:
+        grid (xarray.DataArray): The (y, x) grid, with rioxarray spatial metadata.
+        factor (int): The number of cells along each side of a block.
+        method (Reduction): The block reduction - 'mean', 'min', 'max', or 'nearest' for the cell nearest the
+            block centre.
+
+    Returns:
+        xarray.DataArray: The coarsened grid, lazy if the grid is lazy.
+
+    Raises:
+        ValueError: If the factor is less than one, or the method is not supported.
+    """
+    if factor < 1:
+        raise ValueError("The coarsening factor must be at least one.")
+    if method not in ('mean', 'min', 'max', 'nearest'):
+        raise ValueError(f"Unsupported reduction method: {method}")
+    return _coarsen(grid, factor, method)
+
+
+def _coarsen(grid: xr.DataArray, factor: int, method: str) -> xr.DataArray:
+    """Coarsen a grid by a factor, with the reductions of `coarsen_grid` or the 'sum' of each block."""
+    grid = grid.transpose('y', 'x')
+    if factor == 1:
+        return grid
+    transform = grid.rio.transform() * Affine.scale(factor)
+
+    data = grid.data
+    if grid.chunks is not None:
+        # whole blocks in every chunk, so that the blocks are reduced chunk by chunk
+        data = data.rechunk(tuple(max(factor, max(chunks) // factor * factor) for chunks in data.chunks))
+        out_chunks = tuple(tuple(-(-size // factor) for size in chunks) for chunks in data.chunks)
+        values = data.map_blocks(_reduce_blocks, factor, method, chunks=out_chunks,
+                                 dtype=_reduced_dtype(data.dtype, method))
+    else:
+        values = _reduce_blocks(np.asarray(data), factor, method)
+    return _grid_like(grid, values, transform)
+
+
+def _reduced_dtype(dtype: np.dtype, method: str) -> np.dtype:
+    """The data type of reduced blocks, which is floating point if a block may be NaN."""
+    if method == 'nearest':
+        return np.dtype(dtype)
+    return np.dtype(dtype) if np.issubdtype(dtype, np.floating) else np.dtype(np.float64)
+
+
+def _reduce_blocks(values: np.ndarray, factor: int, method: str) -> np.ndarray:
+    """Reduce the factor x factor blocks of a 2D array, padding a partial last block with NaN (or zero for sums)."""
+    n_rows, n_cols = values.shape
+    if method == 'nearest':
+        rows = np.minimum(np.arange(-(-n_rows // factor)) * factor + factor // 2, n_rows - 1)
+        cols = np.minimum(np.arange(-(-n_cols // factor)) * factor + factor // 2, n_cols - 1)
+        return values[np.ix_(rows, cols)]
+
+    values = values.astype(_reduced_dtype(values.dtype, method), copy=False)
+    pad_rows, pad_cols = -n_rows % factor, -n_cols % factor
+    if pad_rows or pad_cols:
+        values = np.pad(values, ((0, pad_rows), (0, pad_cols)), constant_values=np.nan)
+    blocks = values.reshape(values.shape[0] // factor, factor, values.shape[1] // factor, factor)
+    if method == 'sum':
+        return np.where(np.isnan(blocks), 0, blocks).sum(axis=(1, 3))
+    if method == 'min':
+        return np.fmin.reduce(blocks, axis=(1, 3))
+    if method == 'max':
+        return np.fmax.reduce(blocks, axis=(1, 3))
+    valid = ~np.isnan(blocks)
+    total = np.where(valid, blocks, 0).sum(axis=(1, 3))
+    count = valid.sum(axis=(1, 3))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(count > 0, total / count, np.nan).astype(values.dtype, copy=False)
+
+
+def grid_pyramid(grid: xr.DataArray, n_levels: Optional[int] = None, factor: int = 2,
+                 method: Reduction = 'mean', min_size: int = 256) -> list[xr.DataArray]:
+    """Build a multi-resolution pyramid of a grid, coarsening by a factor from one level to the next.
+
+    Each level is coarsened from the previous level, so every base cell is reduced once rather than once per
+    level.  Chained minima and maxima are those of the base cells under each cell, and the chained nearest
+    cell is the nearest cell of the previous level.  Means are chained as the sums and counts of the valid base
+    cells under each cell, so that they are the means of the base cells, including under the partial blocks
+    at the edges.  The levels of a lazy grid are lazy, and are only read when computed or exported.
+
+    Args:
+        grid (xarray.DataArray): The (y, x) grid, with rioxarray spatial metadata.
+        n_levels (int, optional): The number of coarsened levels.  If None, levels are added until the
+            larger side of a level is no more than min_size cells.
+        factor (int): The coarsening from one level to the next.
+        method (Reduction): The block reduction, see `coarsen_grid`.
+        min_size (int): The size of the coarsest level when n_levels is None.
+
+    Returns:
+        list[xarray.DataArray]: The levels, starting with the full resolution grid.
+
+    Raises:
+        ValueError: If the factor is less than two, or the method is not supported.
+    """
+    if factor < 2:
+        raise ValueError("The pyramid factor must be at least two.")
+    if method not in ('mean', 'min', 'max', 'nearest'):
+        raise ValueError(f"Unsupported reduction method: {method}")
+    grid = grid.transpose('y', 'x')
+    levels = [grid]
+    if method == 'mean':
+        values = grid.data
+        valid = ~np.isnan(values)
+        total = _grid_like(grid, np.where(valid, values, 0).astype(np.float64), grid.rio.transform())
+        count = _grid_like(grid, valid.astype(np.float64), grid.rio.transform())
+    size = max(grid.sizes['y'], grid.sizes['x'])
+    level = 1
+    while (level <= n_levels) if n_levels is not None else (-(-size // factor ** (level - 1)) > min_size):
+        if method == 'mean':
+            total, count = _coarsen(total, factor, 'sum'), _coarsen(count, factor, 'sum')
+            values = total.data / np.where(count.data > 0, count.data, np.nan)
+            levels.append(_grid_like(grid, values.astype(_reduced_dtype(grid.dtype, method)), total.rio.transform()))
+        else:
+            levels.append(_coarsen(levels[-1], factor, method))
+        level += 1
+    return levels
+
+
+def grid_from_bounds(bounds: tuple[float, float, float, float], resolution: float) -> tuple[Affine, tuple[int, int]]:
+    """The transform and (rows, columns) of a north-up grid of square cells covering a region.
+
+    Args:
+        bounds (tuple): The region (xmin, xmax, ymin, ymax), anchored at its top left corner.
+        resolution (float): The cell size.
+
+    Returns:
+        tuple[affine.Affine, tuple[int, int]]: The transform and shape of the grid.
+    """
+    xmin, xmax, ymin, ymax = bounds
+    shape = (max(1, int(np.ceil((ymax - ymin) / resolution - 1e-9))),
+             max(1, int(np.ceil((xmax - xmin) / resolution - 1e-9))))
+    return Affine(resolution, 0, xmin, 0, -resolution, ymax), shape
+
+
+def resample_grid(grid: xr.DataArray, transform: Affine, shape: tuple[int, int],
+                  method: Literal['bilinear', 'nearest'] = 'bilinear',
+                  chunks: tuple[int, int] = (1024, 1024)) -> xr.DataArray:
+    """Resample a grid onto an arbitrary axis-aligned target grid.
+
+    Each target cell centre is interpolated from the four source cell centres around it.  The target is
+    computed one chunk at a time, reading only the window of the source that the chunk overlaps, so a lazy
+    grid is resampled lazily, chunk by chunk.  NaN source cells are left out of the interpolation, with the
+    weights of the other cells renormalised, and target cells outside the source cells are NaN.
+
+    Args:
+        grid (xarray.DataArray): The (y, x) grid, with rioxarray spatial metadata.
+        transform (affine.Affine): The affine transform of the target grid.
+        shape (tuple[int, int]): The number of (rows, columns) of the target grid.
+        method (Literal['bilinear', 'nearest']): The interpolation method.
+        chunks (tuple[int, int]): The (rows, columns) of the target chunks of a lazy grid.
+
+    Returns:
+        xarray.DataArray: The resampled grid, lazy if the grid is lazy.
+
+    Raises:
+        ValueError: If the method is not supported, or either grid is rotated.
+    """
+    if method not in ('bilinear', 'nearest'):
+        raise ValueError(f"Unsupported resampling method: {method}")
+    grid = grid.transpose('y', 'x')
+    source = grid.rio.transform()
+    if source.b or source.d or transform.b or transform.d:
+        raise ValueError("Only axis-aligned grids can be resampled.")
+    # the fractional source row and column of each target cell centre
+    rows = ((transform.f + (np.arange(shape[0]) + 0.5) * transform.e) - source.f) / source.e - 0.5
+    cols = ((transform.c + (np.arange(shape[1]) + 0.5) * transform.a) - source.c) / source.a - 0.5
+    dtype = np.result_type(grid.dtype, np.float32)
+
+    if grid.chunks is None:
+        values = _interpolate(np.asarray(grid.data), rows[:, None], cols[None, :], method)
+        values = values.astype(dtype, copy=False)
+    else:
+        blocks = []
+        for row_start in range(0, shape[0], chunks[0]):
+            block_rows = rows[row_start:row_start + chunks[0]]
+            row_window = _source_window(block_rows, grid.shape[0])
+            blocks.append([])
+            for col_start in range(0, shape[1], chunks[1]):
+                block_cols = cols[col_start:col_start + chunks[1]]
+                col_window = _source_window(block_cols, grid.shape[1])
+                window = grid.data[slice(*row_window), slice(*col_window)]
+                block = dask.delayed(_interpolate)(window, (block_rows - row_window[0])[:, None],
+                                                   (block_cols - col_window[0])[None, :], method,
+                                                   grid.shape, (row_window[0], col_window[0]))
+                blocks[-1].append(da.from_delayed(block, (len(block_rows), len(block_cols)), dtype=dtype))
+        values = da.block(blocks)
+    return _grid_like(grid, values, transform)
+
+
+def sample_grid(grid: xr.DataArray, x: np.ndarray, y: np.ndarray,
+                method: Literal['bilinear', 'nearest'] = 'bilinear') -> np.ndarray:
+    """Sample a grid at points, by interpolating between the cell centres around each point.
+
+    The fractional row and column of every point are computed from the affine transform, and all points are
+    interpolated at once.  For a lazy grid, the points are grouped by the dask chunk they fall in, and only
+    those chunks (with a one cell margin for the interpolation) are read.  NaN cells are left out of the
+    interpolation, and points outside the grid cells are NaN.
+
+    Args:
+        grid (xarray.DataArray): The (y, x) grid, with rioxarray spatial metadata.
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points.
+        method (Literal['bilinear', 'nearest']): The interpolation method.
+
+    Returns:
+        np.ndarray: The values at the points.
+
+    Raises:
+        ValueError: If the method is not supported, or the grid is rotated.
+    """
+    if method not in ('bilinear', 'nearest'):
+        raise ValueError(f"Unsupported resampling method: {method}")
+    grid = grid.transpose('y', 'x')
+    transform = grid.rio.transform()
+    if transform.b or transform.d:
+        raise ValueError("Only axis-aligned grids can be sampled.")
+    rows = (np.asarray(y, dtype=np.float64) - transform.f) / transform.e - 0.5
+    cols = (np.asarray(x, dtype=np.float64) - transform.c) / transform.a - 0.5
+    dtype = np.result_type(grid.dtype, np.float32)
+    if grid.chunks is None:
+        return _interpolate(np.asarray(grid.data), rows, cols, method).astype(dtype, copy=False)
+
+    result = np.full(len(rows), np.nan, dtype=dtype)
+    inside = np.nonzero((rows >= -0.5) & (rows < grid.shape[0] - 0.5) &
+                        (cols >= -0.5) & (cols < grid.shape[1] - 0.5))[0]
+    row_bounds, col_bounds = (np.cumsum((0,) + chunks) for chunks in grid.chunks)
+    # the chunk of the nearest cell to each point
+    row_chunk = np.searchsorted(row_bounds, np.rint(rows[inside]), side='right') - 1
+    col_chunk = np.searchsorted(col_bounds, np.rint(cols[inside]), side='right') - 1
+    chunk_ids, groups = np.unique(row_chunk * len(col_bounds) + col_chunk, return_inverse=True)
+    order = np.argsort(groups, kind='stable')
+    splits = np.cumsum(np.bincount(groups, minlength=len(chunk_ids)))[:-1]
+    windows, members = [], np.split(inside[order], splits)
+    for chunk_id in chunk_ids:
+        i, j = divmod(int(chunk_id), len(col_bounds))
+        row_window = max(0, row_bounds[i] - 1), min(grid.shape[0], row_bounds[i + 1] + 1)
+        col_window = max(0, col_bounds[j] - 1), min(grid.shape[1], col_bounds[j + 1] + 1)
+        windows.append((row_window, col_window, grid.data[slice(*row_window), slice(*col_window)]))
+    # read the chunks in one pass, so that dask can read them in parallel
+    values = dask.compute(*[window for _, _, window in windows])
+    for (row_window, col_window, _), window, points in zip(windows, values, members):
+        result[points] = _interpolate(window, rows[points] - row_window[0], cols[points] - col_window[0],
+                                      method, shape=grid.shape, offset=(row_window[0], col_window[0]))
+    return result
+
+
+def _interpolate(values: np.ndarray, rows: np.ndarray, cols: np.ndarray, method: str,
+                 shape: Optional[tuple[int, int]] = None, offset: tuple[int, int] = (0, 0)) -> np.ndarray:
+    """Interpolate a window of a grid of the shape, starting at the (row, column) offset, at fractional indices.
+
+    The rows and columns may be any arrays that broadcast together, such as a column of rows and a row of
+    columns to interpolate at every node of a target grid.
+    """
+    values = np.asarray(values, dtype=np.result_type(values.dtype, np.float32))
+    n_rows, n_cols = values.shape
+    shape = shape if shape is not None else values.shape
+    # points over the outer half of the edge cells of the grid take the edge values
+    global_rows, global_cols = rows + offset[0], cols + offset[1]
+    outside = (global_rows < -0.5) | (global_rows >= shape[0] - 0.5) | (global_cols < -0.5) | \
+        (global_cols >= shape[1] - 0.5)
+    if not n_rows or not n_cols:
+        return np.full(outside.shape, np.nan, dtype=values.dtype)
+    rows, cols = np.clip(rows, 0, n_rows - 1), np.clip(cols, 0, n_cols - 1)
+    if method == 'nearest':
+        result = values[np.rint(rows).astype(np.intp), np.rint(cols).astype(np.intp)]
+    else:
+        row0 = np.minimum(np.floor(rows).astype(np.intp), max(n_rows - 2, 0))
+        col0 = np.minimum(np.floor(cols).astype(np.intp), max(n_cols - 2, 0))
+        row1, col1 = np.minimum(row0 + 1, n_rows - 1), np.minimum(col0 + 1, n_cols - 1)
+        wr, wc = rows - row0, cols - col0
+        total = np.zeros(outside.shape, dtype=values.dtype)
+        weight = np.zeros(outside.shape, dtype=values.dtype)
+        for r, c, w in ((row0, col0, (1 - wr) * (1 - wc)), (row0, col1, (1 - wr) * wc),
+                        (row1, col0, wr * (1 - wc)), (row1, col1, wr * wc)):
+            corner = values[r, c]
+            valid = ~np.isnan(corner)
+            total += np.where(valid, corner, 0) * w
+            weight += valid * w
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = np.where(weight > 0, total / weight, np.nan)
+    return np.where(outside, np.nan, result).astype(values.dtype, copy=False)
+
+
+def _source_window(index: np.ndarray, size: int) -> tuple[int, int]:
+    """The (start, stop) of the source cells needed to interpolate at fractional indices."""
+    inside = index[(index >= -0.5) & (index < size - 0.5)]
+    if not len(inside):
+        return 0, 0
+    return max(0, int(np.floor(inside.min()))), min(size, int(np.floor(inside.max())) + 2)
+
+
+def _grid_like(grid: xr.DataArray, values, transform: Affine) -> xr.DataArray:
+    """A (y, x) grid of values on a transform, with the name and spatial reference of another grid."""
+    result = grid_surface_from_array(values, transform, crs=grid.rio.crs, name=grid.name)
+    result.attrs.update(grid.attrs)
+    return result
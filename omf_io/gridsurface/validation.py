@@ -1,11 +1,20 @@
+import xarray as xr
+
+
 def validate_grid_surface_data(surface_data):
     """Validate the grid_surface data.
 
+    Only the structure is checked, so that a lazily loaded raster is not read.
+
     Args:
         surface_data: The data representing the surface.
 
     Raises:
         ValueError: If the surface data is invalid.
     """
-    # Implement validation logic here
-    pass
\ No newline at end of file
+    if not isinstance(surface_data, xr.DataArray):
+        raise ValueError(f"The grid surface data must be an xarray.DataArray, not {type(surface_data).__name__}.")
+    if not {'x', 'y'}.issubset(surface_data.dims):
+        raise ValueError(f"The grid surface data must have 'x' and 'y' dimensions, found {surface_data.dims}.")
+    if surface_data.sizes['x'] == 0 or surface_data.sizes['y'] == 0:
+        raise ValueError("The grid surface data is empty.")
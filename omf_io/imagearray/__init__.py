@@ -0,0 +1 @@
+from .image_array import ImageArrayIO
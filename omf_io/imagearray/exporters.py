@@ -0,0 +1,112 @@
+import warnings
+from pathlib import Path
+from typing import Literal, Optional, Union
+
+import numpy as np
+
+from omf_io.imagearray.importers import open_image, image_band_count, image_strips
+from omf_io.utils.decorators import requires_dependency
+
+try:
+    import rasterio
+    import rasterio.shutil
+    from rasterio.errors import NotGeoreferencedWarning
+    from rasterio.windows import Window
+except ImportError:
+    rasterio = None
+
+ImageFormat = Literal['PNG', 'JPEG', 'GTiff']
+
+_SUFFIX_FORMATS = {'.png': 'PNG', '.jpg': 'JPEG', '.jpeg': 'JPEG', '.tif': 'GTiff', '.tiff': 'GTiff'}
+
+
+@requires_dependency('rasterio', rasterio)
+def export_image_to_file(image_data: Union[np.ndarray, str], output_file: Path, format: Optional[ImageFormat] = None,
+                         quality: int = 90, transform=None, crs=None, blocksize: int = 512, **kwargs) -> Path:
+    """Export an image to a PNG, JPEG or tiled GeoTIFF file, streaming it in strips of rows.
+
+    A GeoTIFF is written strip by strip from the source.  PNG and JPEG files can only be created by copying
+    a complete dataset, which GDAL encodes row by row, so an image file is copied directly, while an image in
+    memory, a palette image for JPEG, or an image with more bands than the format supports, is first
+    streamed to a temporary tiled GeoTIFF beside the output.  JPEG files drop any alpha band.
+
+    Args:
+        image_data (Union[np.ndarray, str]): The (rows, columns, bands) image, or the (GDAL) path of an image.
+        output_file (Path): The output file path.
+        format (ImageFormat, optional): 'PNG', 'JPEG' or 'GTiff'.  Inferred from the file suffix if None.
+        quality (int): The JPEG quality, from 1 to 100.
+        transform (affine.Affine, optional): The georeferencing of a GeoTIFF.
+        crs (optional): The coordinate reference system of a GeoTIFF.
+        blocksize (int): The number of rows streamed at once, and the GeoTIFF tile size.
+        **kwargs: Additional creation options for the GDAL driver.
+
+    Returns:
+        Path: The output file path.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    output_file = Path(output_file)
+    format = format if format is not None else _SUFFIX_FORMATS.get(output_file.suffix.lower())
+    if format not in ('PNG', 'JPEG', 'GTiff'):
+        raise ValueError(f"Unsupported image format: {format or output_file.suffix}")
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    bands = _output_bands(image_data, format)
+
+    if format == 'GTiff':
+        _write_geotiff(image_data, output_file, bands, blocksize, transform, crs, **kwargs)
+        return output_file
+    options = dict(QUALITY=quality, **kwargs) if format == 'JPEG' else dict(kwargs)
+    if isinstance(image_data, str) and bands is None:
+        with open_image(image_data) as dataset:
+            rasterio.shutil.copy(dataset, output_file, driver=format, **options)
+        return output_file
+    temporary_file = output_file.with_name(output_file.stem + '.tmp.tif')
+    try:
+        _write_geotiff(image_data, temporary_file, bands, blocksize, None, None)
+        with open_image(str(temporary_file)) as dataset:
+            rasterio.shutil.copy(dataset, output_file, driver=format, **options)
+    finally:
+        if temporary_file.exists():
+            temporary_file.unlink()
+    return output_file
+
+
+def _output_bands(image_data: Union[np.ndarray, str], format: str) -> Optional[int]:
+    """The number of bands to write, if the source must be expanded or trimmed, otherwise None."""
+    if isinstance(image_data, str):
+        with open_image(image_data) as dataset:
+            count = image_band_count(dataset)
+    else:
+        count = image_data.shape[2] if image_data.ndim == 3 else 1
+    if format == 'JPEG' and count in (2, 4):
+        # drop the alpha band
+        return count - 1
+    return None if isinstance(image_data, str) else count
+
+
+def _write_geotiff(image_data: Union[np.ndarray, str], output_file: Path, bands: Optional[int], blocksize: int,
+                   transform, crs, **kwargs):
+    """Write an image to a tiled GeoTIFF, one strip of tiles at a time."""
+    if isinstance(image_data, str):
+        with open_image(image_data) as dataset:
+            height, width, count, dtype = dataset.height, dataset.width, image_band_count(dataset), dataset.dtypes[0]
+    else:
+        height, width = image_data.shape[:2]
+        count, dtype = (image_data.shape[2] if image_data.ndim == 3 else 1), image_data.dtype
+    count = bands if bands is not None else count
+    profile = dict(driver='GTiff', width=width, height=height, count=count, dtype=dtype, tiled=True,
+                   blockxsize=blocksize, blockysize=blocksize, compress='deflate', bigtiff='IF_SAFER')
+    if transform is not None:
+        profile['transform'] = transform
+    if crs is not None:
+        profile['crs'] = crs
+    profile.update(kwargs)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', NotGeoreferencedWarning)
+        destination = rasterio.open(output_file, 'w', **profile)
+    with destination:
+        for row, values in image_strips(image_data, blocksize):
+            values = values[..., :count]
+            destination.write(values.transpose(2, 0, 1), window=Window(0, row, width, values.shape[0]))
+
@@ -0,0 +1,209 @@
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from .validation import validate_image_data
+from .importers import (find_omf_texture, omf_image_path, texture_transform, read_image_file, open_image,
+                        image_band_count, expand_palette, image_strips)
+from .exporters import export_image_to_file, ImageFormat
+
+
+class ImageArrayIO:
+    """
+    Handles the creation and consumption of images, such as the textures of OMF elements.
+
+    The image is either held in memory as a (rows, columns, bands) array, or lazily as the path of an image
+    file (or of a texture within an OMF archive), in which case regions are decoded only when they are read.
+    """
+
+    def __init__(self, image_data: Union[np.ndarray, str, Path], transform=None, crs=None):
+        """
+        Initialize the ImageArrayIO instance.
+
+        Args:
+            image_data (Union[np.ndarray, str, Path]): The (rows, columns[, bands]) image, or the path (or GDAL
+                path) of an image file, which is opened without decoding.
+            transform (affine.Affine, optional): The georeferencing of the image pixels.
+            crs (optional): The coordinate reference system of the transform.
+        """
+        if isinstance(image_data, (str, Path)):
+            image_data = str(image_data)
+            with open_image(image_data) as dataset:
+                self._shape = (dataset.height, dataset.width, image_band_count(dataset))
+                self._dtype = np.dtype(dataset.dtypes[0])
+        else:
+            validate_image_data(image_data)
+            if image_data.ndim == 2:
+                image_data = image_data[..., None]
+            self._shape, self._dtype = image_data.shape, image_data.dtype
+        self.image_data: Union[np.ndarray, str] = image_data
+        self.transform = transform
+        self.crs = crs
+
+    @classmethod
+    def from_omf(cls, omf_file: Path, image_name: str, element_name: Optional[str] = None) -> "ImageArrayIO":
+        """
+        Create an ImageArrayIO instance from a texture of an OMF file, read lazily from the archive.
+
+        Only the project JSON is read.  The PNG image is decoded from within the archive when regions are read,
+        and only as far as the last row needed.  Projected textures are georeferenced from their corner and axes.
+
+        Args:
+            omf_file (Path): The OMF file path.
+            image_name (str): The name of the texture.
+            element_name (str, optional): The name of the element the texture is mapped on.
+
+        Returns:
+            ImageArrayIO: An instance of the class.
+        """
+        texture = find_omf_texture(Path(omf_file), image_name, element_name=element_name)
+        image = cls(omf_image_path(omf_file, texture['image']['image']))
+        image.transform = texture_transform(texture, image.width, image.height)
+        return image
+
+    @classmethod
+    def from_file(cls, image_file: Path, downsample: int = 1, resampling: str = 'average') -> "ImageArrayIO":
+        """
+        Create an ImageArrayIO instance from an image file, such as PNG, JPEG or GeoTIFF.
+
+        Without downsampling the file is opened lazily.  With downsampling the image is decoded at the
+        reduced size into memory, which for tiled GeoTIFF (with overviews) and JPEG files avoids decoding the
+        full resolution image.
+
+        Args:
+            image_file (Path): The image file path.
+            downsample (int): The reduction factor in each direction.
+            resampling (str): The downsampling method, e.g. 'average' or 'nearest'.
+
+        Returns:
+            ImageArrayIO: An instance of the class.
+
+        Raises:
+            ValueError: If the downsampling factor is less than one.
+        """
+        if downsample < 1:
+            raise ValueError("The downsampling factor must be at least one.")
+        with open_image(str(image_file)) as dataset:
+            transform = dataset.transform if dataset.crs is not None or not dataset.transform.is_identity else None
+            crs = dataset.crs
+        if downsample == 1:
+            return cls(str(image_file), transform=transform, crs=crs)
+        values = read_image_file(str(image_file), downsample=downsample, resampling=resampling)
+        if transform is not None:
+            from affine import Affine
+            transform = transform * Affine.scale(downsample)
+        return cls(values, transform=transform, crs=crs)
+
+    @property
+    def is_lazy(self) -> bool:
+        """True if the image is read from a file when needed, and not held in memory."""
+        return isinstance(self.image_data, str)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """The (rows, columns, bands) of the image, with palette images expanded to RGBA."""
+        return self._shape
+
+    @property
+    def height(self) -> int:
+        """The number of rows of the image."""
+        return self._shape[0]
+
+    @property
+    def width(self) -> int:
+        """The number of columns of the image."""
+        return self._shape[1]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """The data type of the pixel values."""
+        return self._dtype
+
+    def read_region(self, row: int, col: int, height: int, width: int) -> np.ndarray:
+        """
+        Read a region of the image, decoding only as much of the file as the region needs.
+
+        Args:
+            row (int): The first row.
+            col (int): The first column.
+            height (int): The number of rows, clipped to the image.
+            width (int): The number of columns, clipped to the image.
+
+        Returns:
+            np.ndarray: The (rows, columns, bands) pixel values.
+
+        Raises:
+            ValueError: If the region starts outside the image.
+        """
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise ValueError(f"The region at ({row}, {col}) starts outside the {self.height} x {self.width} image.")
+        height, width = min(height, self.height - row), min(width, self.width - col)
+        if not self.is_lazy:
+            return self.image_data[row:row + height, col:col + width]
+        from rasterio.windows import Window
+
+        with open_image(self.image_data) as dataset:
+            values = dataset.read(window=Window(col, row, width, height))
+            return expand_palette(dataset, values.transpose(1, 2, 0))
+
+    def tiles(self, tile_size: int = 1024) -> Iterator[tuple[int, int, np.ndarray]]:
+        """
+        Iterate over the tiles of the image, from the top row of tiles down.
+
+        The image is decoded once, one strip of tile_size rows at a time, so the memory held is a strip of the
+        image rather than the whole image.
+
+        Args:
+            tile_size (int): The tile width and height.
+
+        Yields:
+            tuple[int, int, np.ndarray]: The first row and column, and the (rows, columns, bands) values, of each
+                tile.
+        """
+        for row, strip in image_strips(self.image_data, tile_size):
+            for col in range(0, self.width, tile_size):
+                yield row, col, strip[:, col:col + tile_size]
+
+    def load(self) -> "ImageArrayIO":
+        """
+        Decode a lazy image into memory.
+
+        Returns:
+            ImageArrayIO: A new instance holding the image in memory.
+        """
+        return self.__class__(self.to_numpy(), transform=self.transform, crs=self.crs)
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Return the whole image as a (rows, columns, bands) array.
+
+        Returns:
+            np.ndarray: The pixel values.
+        """
+        if not self.is_lazy:
+            return self.image_data
+        values = np.empty(self.shape, dtype=self.dtype)
+        for row, strip in image_strips(self.image_data, 1024):
+            values[row:row + len(strip)] = strip
+        return values
+
+    def to_file(self, output_file: Path, format: Optional[ImageFormat] = None, quality: int = 90,
+                blocksize: int = 512, **kwargs) -> Path:
+        """
+        Export the image to a PNG, JPEG or tiled GeoTIFF file, streaming it in strips of rows.
+
+        A GeoTIFF is georeferenced by the transform and crs of the image, if known.
+
+        Args:
+            output_file (Path): The output file path.
+            format (ImageFormat, optional): 'PNG', 'JPEG' or 'GTiff'.  Inferred from the file suffix if None.
+            quality (int): The JPEG quality, from 1 to 100.
+            blocksize (int): The number of rows streamed at once, and the GeoTIFF tile size.
+            **kwargs: Additional creation options for the GDAL driver.
+
+        Returns:
+            Path: The output file path.
+        """
+        return export_image_to_file(self.image_data, output_file, format=format, quality=quality,
+                                    transform=self.transform, crs=self.crs, blocksize=blocksize, **kwargs)
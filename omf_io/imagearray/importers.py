@@ -0,0 +1,144 @@
+import json
+import warnings
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from omf_io.utils.decorators import requires_dependency
+
+try:
+    import rasterio
+    from rasterio.enums import ColorInterp, Resampling
+    from rasterio.errors import NotGeoreferencedWarning
+    from rasterio.windows import Window
+except ImportError:
+    rasterio = None
+
+
+def find_omf_texture(omf_file: Path, image_name: str, element_name: Optional[str] = None) -> dict:
+    """Find a texture in an OMF file by name, reading only the project JSON.
+
+    Args:
+        omf_file (Path): The OMF file path.
+        image_name (str): The name of the (projected or UV mapped) texture.
+        element_name (str, optional): The name of the element the texture is mapped on, if the texture name
+            is not unique.
+
+    Returns:
+        dict: The serialized texture, whose 'image' holds the archive key of the PNG image.
+
+    Raises:
+        ValueError: If no texture of the name is found, or the name is ambiguous.
+    """
+    with zipfile.ZipFile(omf_file, mode='r') as zip_file:
+        project_json = json.loads(zip_file.read('project.json'))
+    textures = [texture for element in project_json.get('elements', [])
+                if element_name is None or element.get('name') == element_name
+                for texture in element.get('textures', []) if texture.get('name') == image_name]
+    if not textures:
+        raise ValueError(f"Texture with name '{image_name}' not found in the OMF project.")
+    if len(textures) > 1:
+        raise ValueError(f"Texture name '{image_name}' is not unique, specify the element name.")
+    return textures[0]
+
+
+def omf_image_path(omf_file: Path, image_key: str) -> str:
+    """The GDAL path of an image within an OMF archive, which is read from the archive without extraction."""
+    return f"/vsizip/{{{Path(omf_file).resolve()}}}/{image_key}"
+
+
+def texture_transform(texture: dict, width: int, height: int):
+    """The affine transform of a projected texture, from its corner and axes, or None for a UV mapped texture.
+
+    The first image row lies along the far end of axis_v, so that the image is upright when projected.
+
+    Args:
+        texture (dict): The serialized texture.
+        width (int): The image width in pixels.
+        height (int): The image height in pixels.
+
+    Returns:
+        affine.Affine: The transform of the image pixels in plan, or None.
+    """
+    if 'corner' not in texture:
+        return None
+    from affine import Affine
+
+    corner, axis_u, axis_v = (np.asarray(texture[key], dtype=np.float64) for key in ('corner', 'axis_u', 'axis_v'))
+    return Affine(axis_u[0] / width, -axis_v[0] / height, corner[0] + axis_v[0],
+                  axis_u[1] / width, -axis_v[1] / height, corner[1] + axis_v[1])
+
+
+@requires_dependency('rasterio', rasterio)
+@contextmanager
+def open_image(image_file: str):
+    """Open an image file (or GDAL path) with rasterio, without decoding it.
+
+    Images such as textures carry no georeferencing, so the warning rasterio gives for them is suppressed.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', NotGeoreferencedWarning)
+        dataset = rasterio.open(image_file)
+    with dataset:
+        yield dataset
+
+
+def image_band_count(dataset) -> int:
+    """The number of bands of the image as read, counting a palette as the four RGBA bands."""
+    return 4 if is_palette(dataset) else dataset.count
+
+
+def is_palette(dataset) -> bool:
+    """True if the image is a single band of palette indices."""
+    return dataset.count == 1 and dataset.colorinterp[0] == ColorInterp.palette
+
+
+@requires_dependency('rasterio', rasterio)
+def read_image_file(image_file: str, downsample: int = 1, resampling: str = 'average') -> np.ndarray:
+    """Read an image file into memory, optionally downsampled on read.
+
+    The image is decoded at the reduced size, so formats with internal overviews or scalable decoding (such
+    as tiled GeoTIFF and JPEG) never decode the full resolution image.
+
+    Args:
+        image_file (str): The image file path, or GDAL path.
+        downsample (int): The reduction factor in each direction.
+        resampling (str): The resampling method, e.g. 'average' or 'nearest'.
+
+    Returns:
+        np.ndarray: The (rows, columns, bands) image.
+    """
+    with open_image(image_file) as dataset:
+        shape = (dataset.count, -(-dataset.height // downsample), -(-dataset.width // downsample))
+        values = dataset.read(out_shape=shape, resampling=Resampling[resampling])
+        return expand_palette(dataset, values.transpose(1, 2, 0))
+
+
+def expand_palette(dataset, values: np.ndarray) -> np.ndarray:
+    """Expand the indices of a single band palette image to RGBA, leaving other images unchanged."""
+    if not is_palette(dataset):
+        return values
+    lookup = np.zeros((256, 4), dtype=np.uint8)
+    for index, colour in dataset.colormap(1).items():
+        lookup[index] = colour
+    return lookup[values[..., 0]]
+
+
+def image_strips(image_data: Union[np.ndarray, str], rows: int):
+    """Yield (row, values) strips of rows of an image, as (rows, columns, bands) arrays, from the top down.
+
+    Image files are read through one open dataset, so that row-sequential formats such as PNG are decoded
+    once, from start to end.
+    """
+    if not isinstance(image_data, str):
+        values = image_data if image_data.ndim == 3 else image_data[..., None]
+        for row in range(0, values.shape[0], rows):
+            yield row, values[row:row + rows]
+        return
+    with open_image(image_data) as dataset:
+        for row in range(0, dataset.height, rows):
+            window = Window(0, row, dataset.width, min(rows, dataset.height - row))
+            yield row, expand_palette(dataset, dataset.read(window=window).transpose(1, 2, 0))
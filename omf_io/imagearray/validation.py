@@ -0,0 +1,20 @@
+import numpy as np
+
+
+def validate_image_data(image_data: np.ndarray):
+    """Validate an image held in memory.
+
+    Args:
+        image_data (np.ndarray): The (rows, columns) or (rows, columns, bands) image.
+
+    Raises:
+        ValueError: If the image data is invalid.
+    """
+    if not isinstance(image_data, np.ndarray):
+        raise ValueError(f"The image data must be a NumPy array, not {type(image_data).__name__}.")
+    if image_data.ndim not in (2, 3):
+        raise ValueError(f"The image data must have 2 or 3 dimensions, found {image_data.ndim}.")
+    if image_data.size == 0:
+        raise ValueError("The image data is empty.")
+    if image_data.dtype.kind not in 'uif':
+        raise ValueError(f"Unsupported image data type: {image_data.dtype}")
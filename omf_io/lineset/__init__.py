@@ -0,0 +1 @@
+from .line_set import LineSetIO
@@ -0,0 +1,121 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+import omf
+import pandas as pd
+
+from omf_io.utils.attributes import generate_omf_attributes
+from omf_io.utils.decorators import requires_dependency
+from omf_io.utils.file import write_omf_element
+
+try:
+    import pyvista as pv
+except ImportError:
+    pv = None
+
+try:
+    import geopandas as gpd
+    import shapely
+except ImportError:
+    gpd = None
+    shapely = None
+
+if TYPE_CHECKING:
+    import geopandas as gpd  # For type hinting only
+    import pyvista as pv  # For type hinting only
+
+
+def export_lineset_to_omf(vertices: np.ndarray, segments: np.ndarray, element_name: str, output_file: Path = None,
+                          vertex_attributes: Optional[pd.DataFrame] = None,
+                          segment_attributes: Optional[pd.DataFrame] = None) -> Union[Path, omf.LineSet]:
+    """Export a line set to an OMF LineSet element.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        segments (np.ndarray): The Mx2 segment vertex indices.
+        element_name (str): The name of the LineSet element.
+        output_file (Path, optional): The OMF file to write the element to.  If None, the element is returned.
+        vertex_attributes (pandas.DataFrame, optional): Attribute columns with one row per vertex.
+        segment_attributes (pandas.DataFrame, optional): Attribute columns with one row per segment.
+
+    Returns:
+        Union[Path, omf.LineSet]: The output file if provided, else the OMF LineSet.
+    """
+    lineset = omf.LineSet(name=element_name, vertices=vertices, segments=segments)
+    attributes = []
+    if vertex_attributes is not None:
+        attributes += generate_omf_attributes(vertex_attributes, location='vertices')
+    if segment_attributes is not None:
+        attributes += generate_omf_attributes(segment_attributes, location='segments')
+    lineset.attributes = attributes
+
+    if output_file:
+        write_omf_element(lineset, output_file, overwrite=True)
+        return output_file
+    return lineset
+
+
+@requires_dependency("pyvista", pv)
+def export_lineset_to_pyvista(vertices: np.ndarray, segments: np.ndarray,
+                              vertex_attributes: Optional[pd.DataFrame] = None,
+                              segment_attributes: Optional[pd.DataFrame] = None) -> "pv.PolyData":
+    """Export a line set to a PyVista PolyData object of line cells, one cell per segment.
+
+    The vertex array, the segment array (as the connectivity of the cells) and the numeric attribute columns
+    are shared with VTK without copying, so they must not be modified while the PolyData is in use.  Other
+    attribute columns are converted to strings.
+
+    Args:
+        vertices (np.ndarray): The Nx3 float64 vertex coordinates.
+        segments (np.ndarray): The Mx2 segment vertex indices.
+        vertex_attributes (pandas.DataFrame, optional): Attribute columns with one row per vertex.
+        segment_attributes (pandas.DataFrame, optional): Attribute columns with one row per segment.
+
+    Returns:
+        pv.PolyData: The line set as PolyData.
+    """
+    polydata = pv.PolyData(vertices, lines=pv.CellArray.from_regular_cells(segments, deep=False), deep=False)
+    for attributes, data in ((vertex_attributes, polydata.point_data), (segment_attributes, polydata.cell_data)):
+        if attributes is None:
+            continue
+        for name, column in attributes.items():
+            values = column.to_numpy()
+            data.set_array(values if values.dtype.kind in 'biuf' else values.astype(str), name, deep_copy=False)
+    return polydata
+
+
+@requires_dependency("GeoPandas", gpd)
+def export_lineset_to_geopandas(vertices: np.ndarray, segments: np.ndarray,
+                                segment_attributes: Optional[pd.DataFrame] = None) -> "gpd.GeoDataFrame":
+    """Export a line set to a GeoDataFrame of 3D LineString geometries.
+
+    Runs of connected segments (where each segment starts at the end vertex of the previous segment) with the
+    same attribute values are joined into one LineString.  The geometries are built in bulk from a shapely
+    ragged array of coordinates and offsets, so no shapely object is created per segment.  Vertex attributes
+    cannot be held by the geometries, and are not exported.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        segments (np.ndarray): The Mx2 segment vertex indices.
+        segment_attributes (pandas.DataFrame, optional): Attribute columns with one row per segment.
+
+    Returns:
+        geopandas.GeoDataFrame: A GeoDataFrame with one row per LineString, and the segment attributes of its
+            first segment.
+    """
+    if segment_attributes is None:
+        segment_attributes = pd.DataFrame(index=pd.RangeIndex(len(segments)))
+    # a new line starts where a segment is not connected to the previous segment, or its attributes change
+    breaks = np.ones(len(segments), dtype=bool)
+    breaks[1:] = segments[1:, 0] != segments[:-1, 1]
+    for _, column in segment_attributes.items():
+        codes = pd.factorize(column, use_na_sentinel=False)[0]
+        breaks[1:] |= codes[1:] != codes[:-1]
+    line_starts = np.flatnonzero(breaks)
+
+    # the first vertex of each line, followed by the end vertex of each of its segments
+    vertex_indices = np.insert(segments[:, 1], line_starts, segments[line_starts, 0])
+    offsets = np.append(line_starts + np.arange(len(line_starts)), len(vertex_indices))
+    geometry = shapely.from_ragged_array(shapely.GeometryType.LINESTRING, vertices[vertex_indices], (offsets,))
+    return gpd.GeoDataFrame(segment_attributes.take(line_starts).reset_index(drop=True), geometry=geometry)
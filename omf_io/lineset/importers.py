@@ -0,0 +1,230 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+import omf
+import pandas as pd
+
+from omf_io.utils.attributes import omf_attribute_columns
+from omf_io.utils.decorators import requires_dependency
+from omf_io.utils.file import load_omf_element
+
+try:
+    import pyvista as pv
+except ImportError:
+    pv = None
+
+try:
+    import geopandas as gpd
+    import shapely
+except ImportError:
+    gpd = None
+    shapely = None
+
+if TYPE_CHECKING:
+    import geopandas as gpd  # For type hinting only
+    import pyvista as pv  # For type hinting only
+
+
+def import_lineset_from_omf(omf_input: Union[Path, omf.Project], lineset_name: str) -> dict:
+    """Import a line set from an OMF LineSet element.
+
+    Only the requested element is loaded from a file, and the vertex, segment and attribute arrays are taken
+    from the element without copying.  A LineSet without segments connects its vertices in order.
+
+    Args:
+        omf_input (Union[Path, omf.Project]): The input OMF file path or project object.
+        lineset_name (str): The name of the LineSet element.
+
+    Returns:
+        dict: A dictionary with the 'vertices' (Nx3) and 'segments' (Mx2) arrays, and the 'vertex_attributes'
+            and 'segment_attributes' DataFrames.
+
+    Raises:
+        ValueError: If the LineSet is not found, or has attributes at an unsupported location.
+    """
+    lineset = load_omf_element(omf_input, lineset_name, omf.LineSet)
+    vertices = lineset.vertices.array
+    if lineset.segments is None:
+        indices = np.arange(len(vertices) - 1)
+        segments = np.column_stack([indices, indices + 1])
+    else:
+        segments = lineset.segments.array
+    columns = {'vertices': {}, 'segments': {}}
+    for attr in lineset.attributes:
+        if attr.location not in columns:
+            raise ValueError(f"Unsupported location '{attr.location}' of attribute '{attr.name}'.")
+        columns[attr.location].update(omf_attribute_columns(attr))
+    return {'vertices': vertices, 'segments': segments,
+            'vertex_attributes': pd.DataFrame(columns['vertices']) if columns['vertices'] else None,
+            'segment_attributes': pd.DataFrame(columns['segments']) if columns['segments'] else None}
+
+
+def import_lineset_from_table(data: pd.DataFrame, line_column: Optional[str] = 'line_id',
+                              coordinate_columns: tuple[str, str, str] = ('x', 'y', 'z')) -> dict:
+    """Import a line set from a table of polyline vertices, one row per vertex.
+
+    The vertices of each line are connected in the order of the rows, by a segment between every pair of
+    consecutive rows of the same line.  The rows of a line need not be contiguous.  The segments are built
+    with array operations on the line codes, without a Python object per segment.
+
+    Args:
+        data (pandas.DataFrame): The vertex table.
+        line_column (str, optional): The column identifying the line of each vertex, kept as a segment
+            attribute.  If None (or absent), all rows form a single line.
+        coordinate_columns (tuple[str, str, str]): The x, y and z columns.
+
+    Returns:
+        dict: A dictionary with the 'vertices' (Nx3) and 'segments' (Mx2) arrays, the remaining columns as
+            'vertex_attributes', and the line of each segment as 'segment_attributes'.
+
+    Raises:
+        ValueError: If a coordinate column is missing, or a line identifier is missing.
+    """
+    missing = [column for column in coordinate_columns if column not in data.columns]
+    if missing:
+        raise ValueError(f"The coordinate columns {missing} are missing from the table.")
+    if line_column is not None and line_column in data.columns:
+        codes, lines = pd.factorize(data[line_column], sort=False)
+        if (codes < 0).any():
+            raise ValueError(f"The line column '{line_column}' has missing values.")
+        if (codes[1:] < codes[:-1]).any():
+            # the rows grouped by line, in the order of the rows within each line
+            order = np.argsort(codes, kind='stable')
+            data, codes = data.iloc[order], codes[order]
+    else:
+        line_column, codes, lines = None, np.zeros(len(data), dtype=np.intp), None
+
+    vertices = np.column_stack([data[column].to_numpy(dtype=np.float64) for column in coordinate_columns])
+    index_dtype = np.int32 if len(vertices) <= np.iinfo(np.int32).max else np.int64
+    starts = np.flatnonzero(codes[1:] == codes[:-1]).astype(index_dtype)
+    segments = np.column_stack([starts, starts + 1])
+    vertex_attributes = data.drop(columns=[*coordinate_columns] + ([line_column] if line_column else []))
+    segment_attributes = None
+    if line_column is not None:
+        segment_attributes = pd.DataFrame({line_column: lines.take(codes[starts])})
+    return {'vertices': vertices, 'segments': segments,
+            'vertex_attributes': vertex_attributes.reset_index(drop=True) if len(vertex_attributes.columns) else None,
+            'segment_attributes': segment_attributes}
+
+
+def import_lineset_from_csv(input_file: Path, line_column: Optional[str] = 'line_id',
+                            coordinate_columns: tuple[str, str, str] = ('x', 'y', 'z'), **kwargs) -> dict:
+    """Import a line set from a CSV file of polyline vertices, one row per vertex.
+
+    Args:
+        input_file (Path): The input CSV file path.
+        line_column (str, optional): The column identifying the line of each vertex.
+        coordinate_columns (tuple[str, str, str]): The x, y and z columns.
+        **kwargs: Additional arguments for `pandas.read_csv`, e.g. engine='pyarrow'.
+
+    Returns:
+        dict: The line set arrays and attributes, see `import_lineset_from_table`.
+    """
+    if line_column is not None:
+        # the line identifiers are held as categories, rather than as an object per row
+        kwargs['dtype'] = {line_column: 'category', **kwargs.get('dtype', {})}
+    return import_lineset_from_table(pd.read_csv(input_file, **kwargs), line_column=line_column,
+                                     coordinate_columns=coordinate_columns)
+
+
+def import_lineset_from_parquet(input_file: Path, line_column: Optional[str] = 'line_id',
+                                coordinate_columns: tuple[str, str, str] = ('x', 'y', 'z'),
+                                columns: Optional[list[str]] = None) -> dict:
+    """Import a line set from a Parquet file of polyline vertices, one row per vertex.
+
+    Args:
+        input_file (Path): The input Parquet file path.
+        line_column (str, optional): The column identifying the line of each vertex.
+        coordinate_columns (tuple[str, str, str]): The x, y and z columns.
+        columns (list[str], optional): The attribute columns to read, besides the line and coordinates.
+            All columns are read if None.
+
+    Returns:
+        dict: The line set arrays and attributes, see `import_lineset_from_table`.
+    """
+    if columns is not None:
+        columns = list(coordinate_columns) + ([line_column] if line_column else []) + list(columns)
+    # the line identifiers are read as a dictionary encoded (categorical) column, rather than as an object per row
+    data = pd.read_parquet(input_file, columns=columns, read_dictionary=[line_column] if line_column else None)
+    return import_lineset_from_table(data, line_column=line_column, coordinate_columns=coordinate_columns)
+
+
+@requires_dependency("pyvista", pv)
+def import_lineset_from_pyvista(polydata: "pv.PolyData") -> dict:
+    """Import a line set from the line cells of a PyVista PolyData object.
+
+    Polylines of more than two points are split into their segments.
+
+    Args:
+        polydata (pv.PolyData): The input PolyData object.
+
+    Returns:
+        dict: The line set arrays, with the point data as 'vertex_attributes' and the cell data as
+            'segment_attributes' (repeated for each segment of a polyline).
+    """
+    line_cells = polydata.GetLines()
+    offsets = pv.convert_array(line_cells.GetOffsetsArray())
+    connectivity = pv.convert_array(line_cells.GetConnectivityArray())
+    n_segments = np.maximum(np.diff(offsets) - 1, 0)
+    cells = np.repeat(np.arange(len(n_segments)), n_segments)
+    # the position in the connectivity of the first point of each segment
+    first = np.arange(n_segments.sum()) + np.repeat(offsets[:-1] - (np.cumsum(n_segments) - n_segments), n_segments)
+    segments = np.column_stack([connectivity[first], connectivity[first + 1]])
+    # the cell data of the line cells follows that of the vertex cells
+    cells += polydata.n_verts
+    vertex_columns = {name: np.asarray(polydata.point_data[name]) for name in polydata.point_data.keys()}
+    segment_columns = {name: np.asarray(polydata.cell_data[name])[cells] for name in polydata.cell_data.keys()}
+    return {'vertices': np.asarray(polydata.points, dtype=np.float64), 'segments': segments,
+            'vertex_attributes': pd.DataFrame(vertex_columns) if vertex_columns else None,
+            'segment_attributes': pd.DataFrame(segment_columns) if segment_columns else None}
+
+
+@requires_dependency("GeoPandas", gpd)
+def import_lineset_from_geopandas(gdf: "gpd.GeoDataFrame") -> dict:
+    """Import a line set from a GeoDataFrame of LineString (or MultiLineString) geometries.
+
+    The coordinates of all geometries are taken in bulk as a shapely ragged array, and each pair of
+    consecutive vertices of a line becomes a segment, so no shapely object is created per line.  The vertices
+    of each line are kept separately, without merging the vertices shared by touching lines.  Geometries
+    without z coordinates are given a z of 0.
+
+    Args:
+        gdf (geopandas.GeoDataFrame): The input GeoDataFrame with LineString or MultiLineString geometries.
+
+    Returns:
+        dict: The line set arrays, with the columns of the GeoDataFrame as 'segment_attributes' (repeated for
+            each segment of a geometry).
+
+    Raises:
+        ValueError: If the GeoDataFrame contains other geometry types.
+    """
+    if not gdf.geometry.geom_type.isin(["LineString", "MultiLineString"]).all():
+        raise ValueError("GeoDataFrame must contain only LineString or MultiLineString geometries.")
+    data = gdf.drop(columns=gdf.geometry.name).reset_index(drop=True)
+    if len(gdf) == 0:
+        return {'vertices': np.empty((0, 3)), 'segments': np.empty((0, 2), dtype=np.int32),
+                'segment_attributes': data}
+
+    geometry_type, coords, offsets = shapely.to_ragged_array(gdf.geometry.values, include_z=True)
+    if geometry_type == shapely.GeometryType.LINESTRING:
+        part_offsets, geometry_parts = offsets[0], np.arange(len(offsets[0]))
+    else:
+        part_offsets, geometry_offsets = offsets
+        geometry_parts = geometry_offsets
+    vertices = np.ascontiguousarray(coords, dtype=np.float64)
+    vertices[np.isnan(vertices[:, 2]), 2] = 0.0
+
+    # every vertex starts a segment, except the last vertex of each part
+    index_dtype = np.int32 if len(vertices) <= np.iinfo(np.int32).max else np.int64
+    is_last = np.zeros(len(vertices), dtype=bool)
+    is_last[part_offsets[1:][np.diff(part_offsets) > 0] - 1] = True
+    starts = np.flatnonzero(~is_last).astype(index_dtype)
+    segments = np.column_stack([starts, starts + 1])
+
+    # the geometry of each segment, from the parts of each geometry and the segments of each part
+    part_geometry = np.repeat(np.arange(len(geometry_parts) - 1), np.diff(geometry_parts))
+    part_segments = np.maximum(np.diff(part_offsets) - 1, 0)
+    segment_geometry = np.repeat(part_geometry, part_segments)
+    return {'vertices': vertices, 'segments': segments,
+            'segment_attributes': data.take(segment_geometry).reset_index(drop=True)}
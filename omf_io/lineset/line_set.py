@@ -0,0 +1,211 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+import omf
+import pandas as pd
+
+from .validation import validate_lineset_data
+from .importers import (import_lineset_from_omf, import_lineset_from_csv, import_lineset_from_parquet,
+                        import_lineset_from_pyvista, import_lineset_from_geopandas)
+from .exporters import export_lineset_to_omf, export_lineset_to_pyvista, export_lineset_to_geopandas
+
+if TYPE_CHECKING:
+    import geopandas as gpd  # For type hinting only
+    import pyvista as pv  # For type hinting only
+
+
+class LineSetIO:
+    """
+    Handles the creation and consumption of line set objects, such as drillhole traces, contours and toe lines.
+
+    The line set is held as an Nx3 float64 vertex array and an Mx2 integer segment array, with optional
+    per-vertex and per-segment attribute columns.
+    """
+
+    def __init__(self, vertices: np.ndarray, segments: np.ndarray, vertex_attributes: Optional[pd.DataFrame] = None,
+                 segment_attributes: Optional[pd.DataFrame] = None):
+        """
+        Initialize the LineSetIO instance.
+
+        Args:
+            vertices (np.ndarray): The Nx3 vertex coordinates.
+            segments (np.ndarray): The Mx2 segment vertex indices.  Stored as int32 unless int64 is supplied or
+                required by the vertex count.
+            vertex_attributes (pandas.DataFrame, optional): Attribute columns with one row per vertex.
+            segment_attributes (pandas.DataFrame, optional): Attribute columns with one row per segment.
+        """
+        self.vertices: np.ndarray = self._as_vertex_array(vertices)
+        self.segments: np.ndarray = self._as_segment_array(segments, len(self.vertices))
+        validate_lineset_data(self.vertices, self.segments)
+
+        self.vertex_attributes: pd.DataFrame = self._as_attributes(vertex_attributes, len(self.vertices), 'vertex')
+        self.segment_attributes: pd.DataFrame = self._as_attributes(segment_attributes, len(self.segments),
+                                                                    'segment')
+
+    @staticmethod
+    def _as_vertex_array(vertices) -> np.ndarray:
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if vertices.size == 0:
+            vertices = vertices.reshape(0, 3)
+        return np.ascontiguousarray(vertices)
+
+    @staticmethod
+    def _as_segment_array(segments, n_vertices: int) -> np.ndarray:
+        index_dtype = np.int32 if n_vertices <= np.iinfo(np.int32).max else np.int64
+        segments = np.asarray(segments)
+        if segments.size == 0:
+            segments = segments.reshape(0, 2)
+        if segments.dtype not in (np.int32, np.int64):
+            if segments.size and not np.issubdtype(segments.dtype, np.integer):
+                raise ValueError("Segment indices must be integers.")
+            segments = segments.astype(index_dtype)
+        return np.ascontiguousarray(segments)
+
+    @staticmethod
+    def _as_attributes(attributes: Optional[pd.DataFrame], length: int, location: str) -> pd.DataFrame:
+        if attributes is None:
+            return pd.DataFrame(index=pd.RangeIndex(length))
+        attributes = pd.DataFrame(attributes)
+        if len(attributes) != length:
+            raise ValueError(f"The {location} attributes have {len(attributes)} rows, expected {length}.")
+        return attributes.reset_index(drop=True)
+
+    @property
+    def n_vertices(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def n_segments(self) -> int:
+        return len(self.segments)
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the vertex and segment arrays and the attribute columns."""
+        return int(self.vertices.nbytes + self.segments.nbytes +
+                   self.vertex_attributes.memory_usage(deep=True, index=False).sum() +
+                   self.segment_attributes.memory_usage(deep=True, index=False).sum())
+
+    def segment_lengths(self) -> np.ndarray:
+        """The length of each segment."""
+        return np.linalg.norm(self.vertices[self.segments[:, 1]] - self.vertices[self.segments[:, 0]], axis=1)
+
+    @property
+    def length(self) -> float:
+        """The total length of the segments."""
+        return float(self.segment_lengths().sum())
+
+    @classmethod
+    def from_omf(cls, omf_input: Union[Path, omf.Project], lineset_name: str) -> "LineSetIO":
+        """
+        Create a LineSetIO instance from a LineSet element of an OMF file or project object.
+
+        Args:
+            omf_input (Union[Path, omf.Project]): The input OMF file path or project object.
+            lineset_name (str): The name of the LineSet element to extract.
+
+        Returns:
+            LineSetIO: An instance of the class.
+        """
+        return cls(**import_lineset_from_omf(omf_input, lineset_name))
+
+    @classmethod
+    def from_csv(cls, csv_file: Path, line_column: Optional[str] = 'line_id',
+                 coordinate_columns: tuple[str, str, str] = ('x', 'y', 'z'), **kwargs) -> "LineSetIO":
+        """
+        Create a LineSetIO instance from a CSV file of polyline vertices, one row per vertex.
+
+        Consecutive rows of the same line are connected by a segment.  The line identifier is kept as a segment
+        attribute, and the other columns as vertex attributes.
+
+        Args:
+            csv_file (Path): The input CSV file path.
+            line_column (str, optional): The column identifying the line of each vertex.  If None (or absent),
+                all rows form a single line.
+            coordinate_columns (tuple[str, str, str]): The x, y and z columns.
+            **kwargs: Additional arguments for `pandas.read_csv`.
+
+        Returns:
+            LineSetIO: An instance of the class.
+        """
+        return cls(**import_lineset_from_csv(csv_file, line_column=line_column,
+                                             coordinate_columns=coordinate_columns, **kwargs))
+
+    @classmethod
+    def from_parquet(cls, parquet_file: Path, line_column: Optional[str] = 'line_id',
+                     coordinate_columns: tuple[str, str, str] = ('x', 'y', 'z'),
+                     columns: Optional[list[str]] = None) -> "LineSetIO":
+        """
+        Create a LineSetIO instance from a Parquet file of polyline vertices, one row per vertex.
+
+        Args:
+            parquet_file (Path): The input Parquet file path.
+            line_column (str, optional): The column identifying the line of each vertex.
+            coordinate_columns (tuple[str, str, str]): The x, y and z columns.
+            columns (list[str], optional): The attribute columns to read.  All columns are read if None.
+
+        Returns:
+            LineSetIO: An instance of the class.
+        """
+        return cls(**import_lineset_from_parquet(parquet_file, line_column=line_column,
+                                                 coordinate_columns=coordinate_columns, columns=columns))
+
+    @classmethod
+    def from_pyvista(cls, polydata: "pv.PolyData") -> "LineSetIO":
+        """
+        Create a LineSetIO instance from the line cells of a PyVista PolyData object.
+
+        Args:
+            polydata (pv.PolyData): The input PolyData object.
+
+        Returns:
+            LineSetIO: An instance of the class.
+        """
+        return cls(**import_lineset_from_pyvista(polydata))
+
+    @classmethod
+    def from_geopandas(cls, gdf: "gpd.GeoDataFrame") -> "LineSetIO":
+        """
+        Create a LineSetIO instance from a GeoDataFrame.
+
+        Args:
+            gdf (geopandas.GeoDataFrame): The input GeoDataFrame with LineString or MultiLineString geometries.
+
+        Returns:
+            LineSetIO: An instance of the class, with the columns of the GeoDataFrame as segment attributes.
+        """
+        return cls(**import_lineset_from_geopandas(gdf))
+
+    def to_omf(self, element_name: str = 'line_set', output_file: Path = None) -> Union[Path, omf.LineSet]:
+        """
+        Convert the line set to an OMF LineSet, including the vertex and segment attributes.
+
+        Args:
+            element_name (str): The name of the LineSet element.
+            output_file (Path, optional): The file path to save the OMF LineSet.
+
+        Returns:
+            omf.LineSet: The OMF LineSet object (if output_file is not provided).
+        """
+        return export_lineset_to_omf(self.vertices, self.segments, element_name, output_file,
+                                     vertex_attributes=self.vertex_attributes,
+                                     segment_attributes=self.segment_attributes)
+
+    def to_pyvista(self) -> "pv.PolyData":
+        """
+        Convert the line set to a PyVista PolyData object of line cells, sharing the arrays without copying.
+
+        Returns:
+            pv.PolyData: The line set as PolyData, with the attributes as point and cell data.
+        """
+        return export_lineset_to_pyvista(self.vertices, self.segments, vertex_attributes=self.vertex_attributes,
+                                         segment_attributes=self.segment_attributes)
+
+    def to_geopandas(self) -> "gpd.GeoDataFrame":
+        """
+        Convert the line set to a GeoDataFrame, joining runs of connected segments into LineStrings.
+
+        Returns:
+            geopandas.GeoDataFrame: A GeoDataFrame with LineString geometries and the segment attributes.
+        """
+        return export_lineset_to_geopandas(self.vertices, self.segments, segment_attributes=self.segment_attributes)
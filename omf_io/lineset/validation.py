@@ -0,0 +1,19 @@
+import numpy as np
+
+
+def validate_lineset_data(vertices: np.ndarray, segments: np.ndarray):
+    """Validate the line set arrays.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        segments (np.ndarray): The Mx2 segment vertex indices.
+
+    Raises:
+        ValueError: If the arrays have the wrong shapes, or a segment refers to a missing vertex.
+    """
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise ValueError(f"Vertices must be an Nx3 array, found shape {vertices.shape}.")
+    if segments.ndim != 2 or segments.shape[1] != 2:
+        raise ValueError(f"Segments must be an Mx2 array, found shape {segments.shape}.")
+    if segments.size and (segments.min() < 0 or segments.max() >= len(vertices)):
+        raise ValueError(f"Segment indices must be between 0 and {len(vertices) - 1}.")
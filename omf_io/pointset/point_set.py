@@ -1,17 +1,22 @@
-from typing import Union
+from typing import Literal, Optional, Union
 
+import numpy as np
 import omf
 import pandas as pd
 from pathlib import Path
 
 from omf_io.pointset.importers import import_from_csv, import_from_omf
 from omf_io.pointset.exporters import export_to_csv, export_to_omf
+from omf_io.utils.geometry import classify_points
+from omf_io.utils.pandas_utils import optimize_memory
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import geopandas as gpd  # For type hinting only
     import pyvista as pv  # For type hinting only
+    from omf_io.surface import SurfaceIO  # For type hinting only
+    from omf_io.gridsurface import GridSurfaceIO  # For type hinting only
 
 
 class PointSetIO:
@@ -19,91 +24,161 @@ class PointSetIO:
     Handles the creation and consumption of PointSet objects with attributes.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, optimize: bool = False):
         """
         Initialize the PointSetIO instance.
 
         Args:
             data (pandas.DataFrame): The point set data with a MultiIndex (x, y, z) and attribute columns.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
         """
         if not isinstance(data.index, pd.MultiIndex) or data.index.names != ['x', 'y', 'z']:
             raise ValueError("Data must have a MultiIndex with levels ['x', 'y', 'z'].")
         self.data = data
+        if optimize:
+            self.optimize_memory()
 
     @classmethod
-    def from_csv(cls, file_path: Path) -> "PointSetIO":
+    def from_csv(cls, file_path: Path, optimize: bool = False) -> "PointSetIO":
         """
         Load a PointSetIO instance from a CSV file.
 
         Args:
             file_path (Path): The path to the CSV file.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
 
         Returns:
             PointSetIO: An instance of the class.
         """
 
         data = import_from_csv(file_path)
-        return cls(data)
+        return cls(data, optimize=optimize)
 
     @classmethod
-    def from_omf(cls, omf_input: Union[Path, omf.Project], pointset_name: str) -> "PointSetIO":
+    def from_omf(cls, omf_input: Union[Path, omf.Project], pointset_name: str,
+                 optimize: bool = False) -> "PointSetIO":
         """
         Create a PointSetIO instance from an OMF file or project object.
 
         Args:
             omf_input (Union[Path, omf.Project]): The input OMF file path or project object.
             pointset_name (str): The name of the PointSet element to extract.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
 
         Returns:
             PointSetIO: An instance of the class.
         """
         data = import_from_omf(omf_input, pointset_name)
-        return cls(data)
+        return cls(data, optimize=optimize)
 
     @classmethod
-    def from_geopandas(cls, gdf: "gpd.GeoDataFrame") -> "PointSetIO":
+    def from_geopandas(cls, gdf: "gpd.GeoDataFrame", optimize: bool = False) -> "PointSetIO":
         """
         Create a PointSetIO instance from a GeoDataFrame.
 
         Args:
             gdf (geopandas.GeoDataFrame): The input GeoDataFrame with Point geometries.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
 
         Returns:
             PointSetIO: An instance of the class.
         """
         from omf_io.pointset.importers import import_from_geopandas
         data = import_from_geopandas(gdf)
-        return cls(data)
+        return cls(data, optimize=optimize)
 
     @classmethod
-    def from_ply(cls, input_file: Path) -> "PointSetIO":
+    def from_ply(cls, input_file: Path, optimize: bool = False) -> "PointSetIO":
         """
         Create a PointSetIO instance from a PLY file.
 
         Args:
             input_file (Path): The input PLY file path.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
 
         Returns:
             PointSetIO: An instance of the class.
         """
         from omf_io.pointset.importers import import_from_ply
         data = import_from_ply(input_file)
-        return cls(data)
+        return cls(data, optimize=optimize)
 
     @classmethod
-    def from_pyvista(cls, polydata: "pv.PolyData") -> "PointSetIO":
+    def from_pyvista(cls, polydata: "pv.PolyData", optimize: bool = False) -> "PointSetIO":
         """
         Create a PointSetIO instance from a PyVista PolyData object.
 
         Args:
             polydata (pv.PolyData): The input PyVista PolyData object.
+            optimize (bool): If True, compact the attribute dtypes with `optimize_memory`.
 
         Returns:
             PointSetIO: An instance of the class.
         """
         from omf_io.pointset.importers import import_from_pyvista
         data = import_from_pyvista(polydata)
-        return cls(data)
+        return cls(data, optimize=optimize)
+
+    def optimize_memory(self, float_tolerance: Optional[float] = None,
+                        category_threshold: float = 0.5) -> pd.DataFrame:
+        """
+        Reduce the memory footprint of the attribute columns in place.
+
+        Integers are downcast, floats are downcast to float32 within the tolerance, and repeated strings and
+        colour tuples are converted to categoricals.
+
+        Args:
+            float_tolerance (float, optional): The maximum absolute error accepted when downcasting floats.
+                If None, floats are only downcast when rounding the float32 values to their decimal precision
+                recovers them exactly.
+            category_threshold (float): The maximum ratio of unique to total values for a categorical.
+
+        Returns:
+            pandas.DataFrame: A report indexed by column with the dtype and bytes before and after.
+        """
+        self.data, report = optimize_memory(self.data, float_tolerance=float_tolerance,
+                                            category_threshold=category_threshold)
+        return report
+
+    def classify(self, surface: "SurfaceIO", max_workers: Optional[int] = 1) -> pd.DataFrame:
+        """
+        Classify the points as above, below or inside a triangulated surface.
+
+        Args:
+            surface (SurfaceIO): The surface, e.g. topography or a pit shell.
+            max_workers (int, optional): The number of threads intersecting the points.
+
+        Returns:
+            pandas.DataFrame: The surface 'elevation' and the 'above', 'below' and 'inside' flags of each point,
+                indexed like the point data.
+        """
+        x, y, z = (self.data.index.get_level_values(level).to_numpy(dtype=float) for level in ('x', 'y', 'z'))
+        classification = classify_points(x, y, z, surface.vertices, surface.faces, max_workers=max_workers)
+        classification.index = self.data.index
+        return classification
+
+    def drape(self, grid_surface: "GridSurfaceIO", method: Literal['bilinear', 'nearest'] = 'bilinear',
+              offset: float = 0.0) -> "PointSetIO":
+        """
+        Drape the points onto a grid surface, replacing their z with the surface elevation.
+
+        All points are interpolated at once, and for a lazy surface only the tiles the points fall in are read.
+        Points outside the grid, or over nodata, keep their z.
+
+        Args:
+            grid_surface (GridSurfaceIO): The surface, e.g. the latest topography.
+            method (Literal['bilinear', 'nearest']): The interpolation method.
+            offset (float): A vertical offset added to the surface elevation, e.g. a collar height.
+
+        Returns:
+            PointSetIO: A new instance holding the draped points and the same attributes.
+        """
+        x, y, z = (self.data.index.get_level_values(level).to_numpy(dtype=float) for level in ('x', 'y', 'z'))
+        elevation = grid_surface.sample(x, y, method=method) + offset
+        z = np.where(np.isnan(elevation), z, elevation)
+        data = self.data.copy()
+        data.index = pd.MultiIndex.from_arrays([x, y, z], names=['x', 'y', 'z'])
+        return self.__class__(data)
 
     def to_csv(self, output_file: Path) -> Path:
         """
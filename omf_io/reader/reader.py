@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from ydata_profiling.controller.pandas_decorator import profile_report
 
@@ -18,27 +19,43 @@ class OMFReader(OMFIO):
             raise FileNotFoundError(f"File does not exist: {filepath}")
         super().__init__(filepath)
 
-    def export_surface_to_raster_file(self, surface_name: str, output_file: PathLike):
+    def export_surface_to_raster_file(self, surface_name: str, output_file: PathLike, crs: Optional[str] = None,
+                                      **kwargs) -> Path:
         """Convert a surface to a raster file.
 
         Example use case is converting an elevation surface to a GeoTIFF.
 
         Args:
-            surface_name (str): The name of the surface to convert.
+            surface_name (str): The name of the (TensorGridSurface) surface to convert.
             output_file (PathLike): The output raster file path.
+            crs (str, optional): The coordinate reference system of the surface, which OMF does not record.
+            **kwargs: Additional arguments for `GridSurfaceIO.to_raster`, e.g. format='COG'.
+
+        Returns:
+            Path: The output file path.
         """
-        pass
+        from omf_io.gridsurface import GridSurfaceIO
+        grid_surface = GridSurfaceIO.from_omf(self.filepath, surface_name, crs=crs)
+        return grid_surface.to_raster(Path(output_file), **kwargs)
 
-    def export_image_to_file(self, image_name: str, output_file: PathLike):
+    def export_image_to_file(self, image_name: str, output_file: PathLike, element_name: Optional[str] = None,
+                             **kwargs) -> Path:
         """Convert an image to a file.
 
         Example use case is converting an ortho-image to a jpg
 
         Args:
-            image_name (str): The name of the image to convert.
-            output_file (PathLike): The output file path.
+            image_name (str): The name of the image (texture) to convert.
+            output_file (PathLike): The output file path, with a .png, .jpg or .tif suffix.
+            element_name (str, optional): The name of the element the texture is mapped on.
+            **kwargs: Additional arguments for `ImageArrayIO.to_file`, e.g. quality.
+
+        Returns:
+            Path: The output file path.
         """
-        pass
+        from omf_io.imagearray import ImageArrayIO
+        image = ImageArrayIO.from_omf(self.filepath, image_name, element_name=element_name)
+        return image.to_file(Path(output_file), **kwargs)
 
     def export_blockmodel_to_file(self, blockmodel_name: str, output_file: PathLike):
         """Convert a blockmodel to a file.
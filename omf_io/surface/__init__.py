@@ -0,0 +1 @@
+from .surface import SurfaceIO
@@ -0,0 +1,159 @@
+from typing import Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from .measures import face_areas
+from .welding import collapse_clusters
+
+
+def decimate_surface(vertices: np.ndarray, faces: np.ndarray, target_faces: Optional[int] = None,
+                     tolerance: Optional[float] = None, method: Literal['quadric', 'mean'] = 'quadric',
+                     max_iterations: int = 4) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Simplify a triangulated surface by vertex clustering.
+
+    The vertices are binned into a uniform 3D grid and the vertices of each cell are collapsed into a single
+    vertex, placed at the mean of the cell's vertices or at the point minimising the summed squared distance
+    to the planes of the adjacent faces (the quadric error), held within the cell.  Faces that become
+    degenerate or duplicated are dropped.  All steps are vectorized.
+
+    Either a target face count or an error tolerance sets the cell size.  A vertex moves at most the cell
+    diagonal, so a tolerance gives a cell size of tolerance / sqrt(3).  For a target face count the cell
+    size is estimated from the surface area and refined over a few iterations, so the result is approximate.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        target_faces (int, optional): The approximate number of faces of the simplified surface.
+        tolerance (float, optional): The maximum distance a vertex may move.
+        method (Literal['quadric', 'mean']): How the collapsed vertex is placed in its cell.
+        max_iterations (int): The maximum number of cell size refinements when targeting a face count.
+
+    Returns:
+        tuple: The simplified vertices and faces, the cluster of each original vertex (-1 where the cluster
+            was dropped), and the index of the original face kept for each simplified face.
+
+    Raises:
+        ValueError: If neither or both of target_faces and tolerance are provided.
+    """
+    if (target_faces is None) == (tolerance is None):
+        raise ValueError("Provide one of target_faces or tolerance.")
+    origin = vertices.min(axis=0)
+    if tolerance is not None:
+        if tolerance <= 0:
+            raise ValueError("The tolerance must be positive.")
+        cell_size = tolerance / np.sqrt(3)
+        vertex_map, n_clusters = _grid_clusters(vertices, origin, cell_size)
+        new_faces, kept_clusters, kept_faces = collapse_clusters(vertex_map, faces, n_clusters)
+    else:
+        if target_faces < 1:
+            raise ValueError("The target number of faces must be positive.")
+        # a surface of area A binned into cells of size c has about A / c^2 vertices and twice as many faces
+        area = face_areas(vertices, faces).sum()
+        cell_size = np.sqrt(2 * area / target_faces) if area > 0 else float(np.ptp(vertices, axis=0).max())
+        best = None
+        for _ in range(max_iterations):
+            vertex_map, n_clusters = _grid_clusters(vertices, origin, cell_size)
+            new_faces, kept_clusters, kept_faces = collapse_clusters(vertex_map, faces, n_clusters)
+            error = abs(len(new_faces) - target_faces) / target_faces
+            if best is None or error < best[0]:
+                best = (error, cell_size, vertex_map, n_clusters, new_faces, kept_clusters, kept_faces)
+            if error < 0.1 or not len(new_faces):
+                break
+            cell_size *= np.sqrt(len(new_faces) / target_faces)
+        _, cell_size, vertex_map, n_clusters, new_faces, kept_clusters, kept_faces = best
+
+    positions = _cluster_positions(vertices, faces, vertex_map, n_clusters, method)
+    if method == 'quadric':
+        # hold each vertex within its cell, which bounds the distance it moves
+        first_vertex = np.empty(n_clusters, dtype=np.int64)
+        first_vertex[vertex_map[::-1]] = np.arange(len(vertex_map) - 1, -1, -1)
+        lower = origin + np.floor((vertices[first_vertex] - origin) / cell_size) * cell_size
+        positions = np.clip(positions, lower, lower + cell_size)
+    cluster_map = np.full(n_clusters, -1, dtype=np.int64)
+    cluster_map[kept_clusters] = np.arange(len(kept_clusters))
+    return positions[kept_clusters], new_faces, cluster_map[vertex_map], kept_faces
+
+
+def _grid_clusters(vertices: np.ndarray, origin: np.ndarray, cell_size: float) -> tuple[np.ndarray, int]:
+    """Label each vertex with its occupied grid cell, numbered in order of first occurrence."""
+    keys = np.floor((vertices - origin) / cell_size).astype(np.int64)
+    shape = keys.max(axis=0) + 1
+    if np.prod(shape.astype(float)) >= 2 ** 63:
+        raise ValueError("The cell size is too small for the extent of the surface.")
+    key = (keys[:, 0] * shape[1] + keys[:, 1]) * shape[2] + keys[:, 2]
+    codes, uniques = pd.factorize(key)
+    return codes.astype(np.int64), len(uniques)
+
+
+def _cluster_positions(vertices: np.ndarray, faces: np.ndarray, vertex_map: np.ndarray, n_clusters: int,
+                       method: Literal['quadric', 'mean'], batch_size: int = 2_000_000) -> np.ndarray:
+    """Place the collapsed vertex of each cluster, accumulating the face quadrics in batches of faces."""
+    counts = np.bincount(vertex_map, minlength=n_clusters)
+    mean = np.stack([np.bincount(vertex_map, weights=vertices[:, axis], minlength=n_clusters)
+                     for axis in range(3)], axis=1) / counts[:, np.newaxis]
+    if method == 'mean':
+        return mean
+    if method != 'quadric':
+        raise ValueError(f"Unsupported method: {method}")
+
+    # area weighted plane quadrics of the faces, summed over the clusters of their corners
+    coordinates = np.ascontiguousarray(vertices.T)
+    upper = [(i, j) for i in range(3) for j in range(i, 3)]
+    sums = np.zeros((len(upper) + 3, n_clusters))
+    for start in range(0, len(faces), batch_size):
+        # contiguous coordinate components are much faster to work on than strided columns
+        corners = np.ascontiguousarray(faces[start:start + batch_size].T)
+        (ax, ay, az), (bx, by, bz), (cx, cy, cz) = ([axis[corner] for axis in coordinates] for corner in corners)
+        ux, uy, uz, vx, vy, vz = bx - ax, by - ay, bz - az, cx - ax, cy - ay, cz - az
+        normals = [uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx]
+        lengths = np.sqrt(normals[0] ** 2 + normals[1] ** 2 + normals[2] ** 2)
+        scale = np.divide(1.0, lengths, out=np.zeros_like(lengths), where=lengths > 0)
+        normals = [component * scale for component in normals]
+        offset = -(normals[0] * ax + normals[1] * ay + normals[2] * az)
+        weight = 0.5 * lengths
+        quadrics = [weight * normals[i] * normals[j] for i, j in upper]
+        quadrics += [weight * normals[i] * offset for i in range(3)]
+        for corner in corners:
+            corner_clusters = vertex_map[corner]
+            for values, total in zip(quadrics, sums):
+                total += np.bincount(corner_clusters, weights=values, minlength=n_clusters)
+    a = np.empty((n_clusters, 3, 3))
+    for (i, j), total in zip(upper, sums):
+        a[:, i, j] = a[:, j, i] = total
+    b = sums[len(upper):].T
+
+    # minimise the quadric error plus a small pull towards the mean, which resolves flat and linear clusters
+    regularisation = 1e-3 * np.trace(a, axis1=1, axis2=2) / 3 + 1e-12
+    a += regularisation[:, np.newaxis, np.newaxis] * np.eye(3)
+    rhs = regularisation[:, np.newaxis] * mean - b
+    return np.linalg.solve(a, rhs[:, :, np.newaxis])[:, :, 0]
+
+
+def cluster_vertex_attributes(vertex_attributes: pd.DataFrame, vertex_map: np.ndarray,
+                              n_clusters: int) -> pd.DataFrame:
+    """Aggregate vertex attributes to clusters of vertices.
+
+    Numeric columns are averaged, and other columns take the value of the first vertex of each cluster.
+
+    Args:
+        vertex_attributes (pandas.DataFrame): The attributes, one row per original vertex.
+        vertex_map (np.ndarray): The cluster of each original vertex, -1 for vertices without a cluster.
+        n_clusters (int): The number of clusters.
+
+    Returns:
+        pandas.DataFrame: The attributes, one row per cluster.
+    """
+    mapped = vertex_map >= 0
+    clusters = vertex_map[mapped]
+    counts = np.bincount(clusters, minlength=n_clusters)
+    first_vertex = np.zeros(n_clusters, dtype=np.int64)
+    first_vertex[clusters[::-1]] = np.flatnonzero(mapped)[::-1]
+    columns = {}
+    for name, series in vertex_attributes.items():
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=np.float64)[mapped]
+            columns[name] = np.bincount(clusters, weights=values, minlength=n_clusters) / np.maximum(counts, 1)
+        else:
+            columns[name] = series.iloc[first_vertex].to_numpy()
+    return pd.DataFrame(columns, index=pd.RangeIndex(n_clusters))
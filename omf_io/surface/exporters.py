@@ -1,65 +1,207 @@
-import struct
+import warnings
 from pathlib import Path
+from typing import Literal, Optional, Union
 
-def export_surface_to_obj(surface_data, output_file: Path):
+import numpy as np
+import omf
+import pandas as pd
+
+from omf_io.utils.attributes import generate_omf_attributes
+from omf_io.utils.file import write_omf_element
+from .utils import ply_type_name
+
+
+def export_surface_to_obj(vertices: np.ndarray, faces: np.ndarray, output_file: Path,
+                          precision: Optional[int] = None, block_size: int = 100_000):
     """Export a triangulated surface to an OBJ file.
 
-    .. todo:: Implement the export_surface_to_obj function
+    Records are formatted a block at a time, with one format operation per block rather than per record.
+    Face indices are written 1-based, as OBJ requires.
 
     Args:
-        surface_data: The data representing the surface.
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices (0-based).
         output_file (Path): The output OBJ file path.
+        precision (int, optional): The number of decimals written for coordinates.  If None, the shortest
+            representation that round-trips is written, which is about three times slower to format.
+        block_size (int): The number of records formatted at once.
     """
+    coordinate_format = '%r' if precision is None else f'%.{int(precision)}f'
+    vertex_format = f"v {coordinate_format} {coordinate_format} {coordinate_format}\n"
     with open(output_file, 'w') as f:
-        # Write vertices
-        for vertex in surface_data['vertices']:
-            f.write(f"v {vertex[0]} {vertex[1]} {vertex[2]}\n")
-        # Write faces
-        for face in surface_data['faces']:
-            f.write(f"f {face[0]} {face[1]} {face[2]}\n")
+        for start in range(0, len(vertices), block_size):
+            block = np.asarray(vertices[start:start + block_size], dtype=np.float64)
+            f.write((vertex_format * len(block)) % tuple(block.ravel().tolist()))
+        for start in range(0, len(faces), block_size):
+            block = np.asarray(faces[start:start + block_size], dtype=np.int64) + 1
+            f.write(("f %d %d %d\n" * len(block)) % tuple(block.ravel().tolist()))
 
 
-def export_surface_to_ply_ascii(surface_data, output_file: Path):
+def export_surface_to_ply_ascii(vertices: np.ndarray, faces: np.ndarray, output_file: Path):
     """Export a triangulated surface to an ASCII PLY file.
 
     .. todo:: Implement the export_surface_to_ply_ascii function
 
     Args:
-        surface_data: The data representing the surface.
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
         output_file (Path): The output PLY file path.
     """
     with open(output_file, 'w') as f:
         f.write("ply\n")
         f.write("format ascii 1.0\n")
-        f.write(f"element vertex {len(surface_data['vertices'])}\n")
+        f.write(f"element vertex {len(vertices)}\n")
         f.write("property float x\nproperty float y\nproperty float z\n")
-        f.write(f"element face {len(surface_data['faces'])}\n")
+        f.write(f"element face {len(faces)}\n")
         f.write("property list uchar int vertex_indices\n")
         f.write("end_header\n")
-        for vertex in surface_data['vertices']:
+        for vertex in vertices:
             f.write(f"{vertex[0]} {vertex[1]} {vertex[2]}\n")
-        for face in surface_data['faces']:
+        for face in faces:
             f.write(f"3 {face[0]} {face[1]} {face[2]}\n")
 
 
-def export_surface_to_ply_binary(surface_data, output_file: Path):
+def export_surface_to_ply_binary(vertices: np.ndarray, faces: np.ndarray, output_file: Path,
+                                 vertex_attributes: Optional[pd.DataFrame] = None,
+                                 face_attributes: Optional[pd.DataFrame] = None,
+                                 coordinate_dtype: Literal['float32', 'float64'] = 'float32',
+                                 byte_order: Literal['little', 'big'] = 'little'):
     """Export a triangulated surface to a binary PLY file.
 
-    .. todo:: Implement the export_surface_to_ply_binary function
+    The vertices and faces are each packed into a structured array and written in a single buffer write.
 
     Args:
-        surface_data: The data representing the surface.
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
         output_file (Path): The output PLY file path.
+        vertex_attributes (pandas.DataFrame, optional): Columns written as additional vertex properties.
+            Categoricals are written as their codes, and columns with no PLY type are skipped with a warning.
+        face_attributes (pandas.DataFrame, optional): Columns written as additional face properties, as for
+            the vertex attributes.
+        coordinate_dtype (Literal['float32', 'float64']): The coordinate type, written as float or double.
+        byte_order (Literal['little', 'big']): The byte order of the body.
     """
+    order = {'little': '<', 'big': '>'}[byte_order]
+    index_dtype = np.int32 if len(vertices) <= np.iinfo(np.int32).max else np.uint32
+    vertex_columns = _ply_columns(vertex_attributes)
+    face_columns = _ply_columns(face_attributes)
+
+    vertex_records = np.empty(len(vertices), dtype=[(name, order + np.dtype(coordinate_dtype).str[1:])
+                                                    for name in ('x', 'y', 'z')] +
+                                                   [(name, order + values.dtype.str[1:])
+                                                    for name, values in vertex_columns.items()])
+    for axis, name in enumerate(('x', 'y', 'z')):
+        vertex_records[name] = vertices[:, axis]
+    for name, values in vertex_columns.items():
+        vertex_records[name] = values
+
+    face_records = np.empty(len(faces), dtype=[('count', 'u1')] +
+                                              [(f"v{i}", order + np.dtype(index_dtype).str[1:]) for i in range(3)] +
+                                              [(name, order + values.dtype.str[1:])
+                                               for name, values in face_columns.items()])
+    face_records['count'] = 3
+    for i in range(3):
+        face_records[f"v{i}"] = faces[:, i]
+    for name, values in face_columns.items():
+        face_records[name] = values
+
+    header = ["ply", f"format binary_{byte_order}_endian 1.0", f"element vertex {len(vertices)}"]
+    header += [f"property {ply_type_name(coordinate_dtype)} {name}" for name in ('x', 'y', 'z')]
+    header += [f"property {ply_type_name(values.dtype)} {name}" for name, values in vertex_columns.items()]
+    header += [f"element face {len(faces)}", f"property list uchar {ply_type_name(index_dtype)} vertex_indices"]
+    header += [f"property {ply_type_name(values.dtype)} {name}" for name, values in face_columns.items()]
+    header += ["end_header"]
+
     with open(output_file, 'wb') as f:
-        f.write(b"ply\n")
-        f.write(b"format binary_little_endian 1.0\n")
-        f.write(f"element vertex {len(surface_data['vertices'])}\n".encode())
-        f.write(b"property float x\nproperty float y\nproperty float z\n")
-        f.write(f"element face {len(surface_data['faces'])}\n".encode())
-        f.write(b"property list uchar int vertex_indices\n")
-        f.write(b"end_header\n")
-        for vertex in surface_data['vertices']:
-            f.write(bytearray(struct.pack('fff', *vertex)))
-        for face in surface_data['faces']:
-            f.write(bytearray(struct.pack('Biii', 3, *face)))
\ No newline at end of file
+        f.write(("\n".join(header) + "\n").encode('ascii'))
+        vertex_records.tofile(f)
+        face_records.tofile(f)
+
+
+def _ply_columns(attributes: Optional[pd.DataFrame]) -> dict[str, np.ndarray]:
+    """Convert attribute columns to arrays of a PLY compatible type.
+
+    Booleans are written as uchar, 64-bit integers as int (or uint) where the values fit, and categoricals as
+    their integer codes (-1 for missing).  Other columns with no PLY type, such as strings or colour tuples,
+    are skipped with a warning.
+    """
+    if attributes is None:
+        return {}
+    columns = {}
+    for name, series in attributes.items():
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.codes.to_numpy()
+        else:
+            values = series.to_numpy()
+        if values.dtype == bool:
+            values = values.astype(np.uint8)
+        elif values.dtype.kind in 'iu' and values.dtype.itemsize == 8:
+            for dtype in (np.int32, np.uint32):
+                if not len(values) or (values.min() >= np.iinfo(dtype).min and values.max() <= np.iinfo(dtype).max):
+                    values = values.astype(dtype)
+                    break
+        try:
+            ply_type_name(values.dtype)
+        except ValueError:
+            warnings.warn(f"The attribute '{name}' of type {values.dtype} has no PLY type, and is not written.")
+            continue
+        columns[str(name)] = values
+    return columns
+
+
+def export_surface_to_omf(vertices: np.ndarray, faces: np.ndarray, element_name: str, output_file: Path = None,
+                          vertex_attributes: Optional[pd.DataFrame] = None,
+                          face_attributes: Optional[pd.DataFrame] = None) -> Union[Path, omf.Surface]:
+    """Export a triangulated surface to an OMF Surface element.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        element_name (str): The name of the Surface element.
+        output_file (Path, optional): The OMF file to write the element to.  If None, the element is returned.
+        vertex_attributes (pandas.DataFrame, optional): Attribute columns with one row per vertex.
+        face_attributes (pandas.DataFrame, optional): Attribute columns with one row per face.
+
+    Returns:
+        Union[Path, omf.Surface]: The output file if provided, else the OMF Surface.
+    """
+    surface = omf.Surface(name=element_name, vertices=vertices, triangles=faces)
+    attributes = []
+    if vertex_attributes is not None:
+        attributes += generate_omf_attributes(vertex_attributes, location='vertices')
+    if face_attributes is not None:
+        attributes += generate_omf_attributes(face_attributes, location='faces')
+    surface.attributes = attributes
+
+    if output_file:
+        write_omf_element(surface, output_file, overwrite=True)
+        return output_file
+    return surface
+
+
+def export_surface_levels(levels: list[tuple[np.ndarray, np.ndarray]], output_path: Path,
+                          element_name: str = 'surface', file_format: Literal['omf', 'ply'] = 'omf') -> list:
+    """Export the levels of a level-of-detail pyramid, named '<element_name>_lod<level>'.
+
+    Args:
+        levels (list[tuple[np.ndarray, np.ndarray]]): The (vertices, faces) of each level.
+        output_path (Path): The OMF file for the elements, or the directory for the PLY files.
+        element_name (str): The base name of the levels.
+        file_format (Literal['omf', 'ply']): Write the levels as OMF Surface elements or binary PLY files.
+
+    Returns:
+        list: The element names (OMF) or file paths (PLY) of the levels.
+    """
+    output_path = Path(output_path)
+    names = [f"{element_name}_lod{level}" for level in range(len(levels))]
+    if file_format == 'omf':
+        for name, (vertices, faces) in zip(names, levels):
+            export_surface_to_omf(vertices, faces, name, output_file=output_path)
+        return names
+    if file_format == 'ply':
+        output_path.mkdir(parents=True, exist_ok=True)
+        paths = [output_path / f"{name}.ply" for name in names]
+        for path, (vertices, faces) in zip(paths, levels):
+            export_surface_to_ply_binary(vertices, faces, path)
+        return paths
+    raise ValueError(f"Unsupported file format: {file_format}")
@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from omf_io.utils.geometry import TriangleGrid
+
+
+@dataclass
+class CutFillReport:
+    """The cut and fill volumes between a base and a design surface, sampled on a regular XY grid.
+
+    Cut is where the design lies below the base (material removed), and fill is where it lies above.  The
+    difference grid holds design minus base elevation at the cell centres, NaN where either surface does
+    not cover the cell, with the first axis along x.  The last row and column of cells are clipped to the
+    region, and are sampled at the centres of their clipped parts.
+    """
+    cut: float
+    fill: float
+    origin: tuple[float, float]
+    cell_size: float
+    difference: np.ndarray
+
+    @property
+    def net(self) -> float:
+        """The fill minus the cut volume."""
+        return self.fill - self.cut
+
+    @property
+    def n_cells(self) -> int:
+        """The number of cells covered by both surfaces."""
+        return int(np.count_nonzero(~np.isnan(self.difference)))
+
+    def summary(self) -> dict:
+        """A JSON-serialisable summary of the report."""
+        return {'cut': self.cut, 'fill': self.fill, 'net': self.net, 'cell_size': self.cell_size,
+                'n_cells': self.n_cells, 'shape': list(self.difference.shape)}
+
+
+def face_areas(vertices: np.ndarray, faces: np.ndarray, batch_size: int = 1_000_000) -> np.ndarray:
+    """Calculate the area of each face, in batches to bound the memory of the gathered corners.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        batch_size (int): The maximum number of faces processed at once.
+
+    Returns:
+        np.ndarray: The area of each face.
+    """
+    areas = np.empty(len(faces))
+    for start in range(0, len(faces), batch_size):
+        batch = faces[start:start + batch_size]
+        a = vertices[batch[:, 0]]
+        cross = np.cross(vertices[batch[:, 1]] - a, vertices[batch[:, 2]] - a)
+        areas[start:start + batch_size] = 0.5 * np.sqrt(np.einsum('ij,ij->i', cross, cross))
+    return areas
+
+
+def enclosed_volume(vertices: np.ndarray, faces: np.ndarray, batch_size: int = 1_000_000) -> float:
+    """Calculate the signed volume enclosed by a closed triangulated surface.
+
+    The volume is the sum of the signed volumes of the tetrahedra between each face and the vertex centroid,
+    which is positive for outward facing (counter-clockwise seen from outside) triangles.  Measuring from the
+    centroid rather than the origin avoids the loss of precision of large (e.g. projected) coordinates.  The
+    result is only meaningful for a closed, consistently oriented surface.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        batch_size (int): The maximum number of faces processed at once.
+
+    Returns:
+        float: The signed enclosed volume.
+    """
+    vertices = vertices - vertices.mean(axis=0)
+    volume = 0.0
+    for start in range(0, len(faces), batch_size):
+        batch = faces[start:start + batch_size]
+        a, b, c = vertices[batch[:, 0]], vertices[batch[:, 1]], vertices[batch[:, 2]]
+        volume += np.einsum('ij,ij->', a, np.cross(b, c))
+    return float(volume / 6)
+
+
+def cut_fill(base: tuple[np.ndarray, np.ndarray], design: tuple[np.ndarray, np.ndarray], cell_size: float,
+             bounds: Optional[tuple[float, float, float, float]] = None,
+             batch_size: int = 1_000_000) -> CutFillReport:
+    """Calculate the cut and fill volumes between two triangulated surfaces.
+
+    Both surfaces are sampled by vertical projection at the centres of a regular XY grid, and the elevation
+    differences are integrated over the cells covered by both.  Each surface is binned into a triangle grid
+    once, and each cell centre is then tested against the few triangles of its bin, so the cost is linear in
+    the number of triangles plus the number of cells.  Where the region is not a whole number of cells, the
+    last row and column of cells are clipped to it, and only their area within the region is counted.
+
+    Args:
+        base (tuple[np.ndarray, np.ndarray]): The (vertices, faces) of the base surface, e.g. pre-blast.
+        design (tuple[np.ndarray, np.ndarray]): The (vertices, faces) of the design surface, e.g. post-blast.
+        cell_size (float): The sampling grid cell size.
+        bounds (tuple, optional): The region (xmin, xmax, ymin, ymax) to integrate.  Defaults to the overlap
+            of the XY extents of the surfaces.
+        batch_size (int): The maximum number of cell centres sampled at once.
+
+    Returns:
+        CutFillReport: The cut and fill volumes and the grid of elevation differences.
+
+    Raises:
+        ValueError: If the cell size is not positive, or the region is empty.
+    """
+    if cell_size <= 0:
+        raise ValueError("The cell size must be positive.")
+    if bounds is None:
+        lower = np.maximum(base[0][:, :2].min(axis=0), design[0][:, :2].min(axis=0))
+        upper = np.minimum(base[0][:, :2].max(axis=0), design[0][:, :2].max(axis=0))
+        bounds = (lower[0], upper[0], lower[1], upper[1])
+    xmin, xmax, ymin, ymax = bounds
+    shape = (int(np.ceil((xmax - xmin) / cell_size - 1e-9)), int(np.ceil((ymax - ymin) / cell_size - 1e-9)))
+    if shape[0] <= 0 or shape[1] <= 0:
+        raise ValueError("The surfaces do not overlap in plan, or the bounds are empty.")
+    # the cell edges along each axis, with the last cell clipped to the region
+    x_edges = np.minimum(xmin + np.arange(shape[0] + 1) * cell_size, xmax)
+    y_edges = np.minimum(ymin + np.arange(shape[1] + 1) * cell_size, ymax)
+    x_centres, y_centres = (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2
+
+    grids = [TriangleGrid(vertices, faces) for vertices, faces in (base, design)]
+    difference = np.empty(shape[0] * shape[1])
+    for start in range(0, len(difference), batch_size):
+        cells = np.arange(start, min(start + batch_size, len(difference)))
+        x = x_centres[cells // shape[1]]
+        y = y_centres[cells % shape[1]]
+        elevations = []
+        for grid in grids:
+            elevation = np.full(len(cells), np.nan)
+            point, _, z = grid.hits(x, y)
+            np.fmax.at(elevation, point, z)
+            elevations.append(elevation)
+        difference[cells] = elevations[1] - elevations[0]
+
+    difference = difference.reshape(shape)
+    cell_area = np.outer(np.diff(x_edges), np.diff(y_edges))
+    return CutFillReport(cut=float(-np.nansum(np.minimum(difference, 0) * cell_area)),
+                         fill=float(np.nansum(np.maximum(difference, 0) * cell_area)),
+                         origin=(float(xmin), float(ymin)), cell_size=cell_size, difference=difference)
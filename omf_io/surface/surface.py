@@ -1,38 +1,269 @@
-import xarray as xr
 from pathlib import Path
-from .validation import validate_surface_data
-from .importers import import_surface_from_obj, import_surface_from_ply_ascii, import_surface_from_ply_binary
-from .exporters import export_surface_to_obj, export_surface_to_ply_ascii, export_surface_to_ply_binary
+from typing import Literal, Optional, Union
+
+import numpy as np
+import omf
+import pandas as pd
+
+from .validation import validate_surface_data, SurfaceValidationReport
+from .welding import weld_vertices
+from .decimation import decimate_surface, cluster_vertex_attributes
+from .measures import face_areas, enclosed_volume, cut_fill, CutFillReport
+from .importers import (import_surface_from_obj, import_surface_from_ply_ascii, import_surface_from_ply_binary,
+                        import_surface_from_omf)
+from .exporters import (export_surface_to_obj, export_surface_to_ply_ascii, export_surface_to_ply_binary,
+                        export_surface_to_omf, export_surface_levels)
 
 
 class SurfaceIO:
     """
     Handles the creation and consumption of surface (wireframe) objects.
+
+    The surface is held as an Nx3 float64 vertex array and an Mx3 integer face array, with optional
+    per-vertex and per-face attribute columns.
     """
 
-    def __init__(self, surface_data: dict):
+    def __init__(self, vertices: Union[np.ndarray, dict], faces: Optional[np.ndarray] = None,
+                 vertex_attributes: Optional[pd.DataFrame] = None, face_attributes: Optional[pd.DataFrame] = None):
         """
         Initialize the SurfaceIO instance.
 
         Args:
-            surface_data (dict): The surface data containing 'vertices' and 'faces'.
+            vertices (np.ndarray): The Nx3 vertex coordinates.  For compatibility, a dictionary with 'vertices'
+                and 'faces' (e.g. lists of tuples) is also accepted in place of the arrays.
+            faces (np.ndarray): The Mx3 triangle vertex indices.  Stored as int32 unless int64 is supplied
+                or required by the vertex count.
+            vertex_attributes (pandas.DataFrame, optional): Attribute columns with one row per vertex.
+            face_attributes (pandas.DataFrame, optional): Attribute columns with one row per face.
+        """
+        if isinstance(vertices, dict):
+            surface_data = vertices
+            vertices = surface_data.get('vertices', [])
+            faces = surface_data.get('faces', []) if faces is None else faces
+            vertex_attributes = surface_data.get('vertex_attributes', vertex_attributes)
+            face_attributes = surface_data.get('face_attributes', face_attributes)
+        if faces is None:
+            raise ValueError("Faces must be provided with the vertices.")
+
+        self.vertices: np.ndarray = self._as_vertex_array(vertices)
+        self.faces: np.ndarray = self._as_face_array(faces, len(self.vertices))
+        self.validation_report: SurfaceValidationReport = validate_surface_data(self.vertices, self.faces)
+
+        self.vertex_attributes: pd.DataFrame = self._as_attributes(vertex_attributes, len(self.vertices), 'vertex')
+        self.face_attributes: pd.DataFrame = self._as_attributes(face_attributes, len(self.faces), 'face')
+
+    @staticmethod
+    def _as_vertex_array(vertices) -> np.ndarray:
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if vertices.size == 0:
+            vertices = vertices.reshape(0, 3)
+        return np.ascontiguousarray(vertices)
+
+    @staticmethod
+    def _as_face_array(faces, n_vertices: int) -> np.ndarray:
+        index_dtype = np.int32 if n_vertices <= np.iinfo(np.int32).max else np.int64
+        if not isinstance(faces, np.ndarray):
+            faces = np.asarray(faces, dtype=index_dtype)
+        if faces.size == 0:
+            faces = faces.reshape(0, 3)
+        if faces.dtype not in (np.int32, np.int64):
+            if faces.size and not np.issubdtype(faces.dtype, np.integer):
+                raise ValueError("Face indices must be integers.")
+            faces = faces.astype(index_dtype)
+        return np.ascontiguousarray(faces)
+
+    @staticmethod
+    def _as_attributes(attributes: Optional[pd.DataFrame], length: int, location: str) -> pd.DataFrame:
+        if attributes is None:
+            return pd.DataFrame(index=pd.RangeIndex(length))
+        attributes = pd.DataFrame(attributes)
+        if len(attributes) != length:
+            raise ValueError(f"The {location} attributes have {len(attributes)} rows, expected {length}.")
+        return attributes.reset_index(drop=True)
+
+    @property
+    def surface_data(self) -> dict:
+        """The vertex and face arrays as a dictionary, for compatibility with the earlier dict form."""
+        return {'vertices': self.vertices, 'faces': self.faces}
+
+    @property
+    def n_vertices(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def n_faces(self) -> int:
+        return len(self.faces)
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the vertex and face arrays and the attribute columns."""
+        return int(self.vertices.nbytes + self.faces.nbytes +
+                   self.vertex_attributes.memory_usage(deep=True, index=False).sum() +
+                   self.face_attributes.memory_usage(deep=True, index=False).sum())
+
+    def face_areas(self) -> np.ndarray:
+        """The area of each face."""
+        return face_areas(self.vertices, self.faces)
+
+    @property
+    def area(self) -> float:
+        """The total surface area."""
+        return float(self.face_areas().sum())
+
+    @property
+    def volume(self) -> float:
+        """The signed volume enclosed by the surface, positive for a closed surface with outward faces."""
+        return enclosed_volume(self.vertices, self.faces)
+
+    def cut_fill(self, design: "SurfaceIO", cell_size: float,
+                 bounds: Optional[tuple[float, float, float, float]] = None) -> CutFillReport:
+        """
+        Calculate the cut and fill volumes from this (base) surface to a design surface.
+
+        Args:
+            design (SurfaceIO): The design surface, e.g. the post-blast topography.
+            cell_size (float): The size of the XY grid cells on which both surfaces are sampled.
+            bounds (tuple, optional): The region (xmin, xmax, ymin, ymax) to integrate.  Defaults to the overlap
+                of the XY extents of the surfaces.
+
+        Returns:
+            CutFillReport: The cut (design below base) and fill (design above base) volumes, and the grid of
+                elevation differences.
+        """
+        return cut_fill((self.vertices, self.faces), (design.vertices, design.faces), cell_size, bounds=bounds)
+
+    def validate(self, area_tolerance: float = 0.0,
+                 errors: Literal['raise', 'collect'] = 'collect') -> SurfaceValidationReport:
+        """
+        Validate the surface mesh.
+
+        Args:
+            area_tolerance (float): Faces with an area at or below this value are reported as zero-area.
+            errors (Literal['raise', 'collect']): Whether to raise on invalid faces, or only report them.
+
+        Returns:
+            SurfaceValidationReport: The validation report, with offending faces as positional indices.
         """
-        validate_surface_data(surface_data)
-        self.surface_data = surface_data
+        self.validation_report = validate_surface_data(self.vertices, self.faces, area_tolerance=area_tolerance,
+                                                       errors=errors)
+        return self.validation_report
+
+    def weld(self, tolerance: float = 0.0) -> "SurfaceIO":
+        """
+        Merge coincident vertices and compact the mesh.
+
+        Vertices that snap to the same point of a grid with a spacing of the tolerance are merged, faces that
+        become degenerate or duplicated are dropped, and unreferenced vertices are removed.  Typical use is
+        a triangle soup (e.g. from STL-style sources) where every face carries its own three vertices.
+
+        Args:
+            tolerance (float): The grid spacing within which vertices are merged.  Zero merges only identical
+                vertices.
+
+        Returns:
+            SurfaceIO: A new instance holding the welded mesh, with the attributes of the kept vertices and faces.
+        """
+        vertices, faces, kept_vertices, kept_faces = weld_vertices(self.vertices, self.faces, tolerance)
+        return self.__class__(vertices, faces, vertex_attributes=self.vertex_attributes.iloc[kept_vertices],
+                              face_attributes=self.face_attributes.iloc[kept_faces])
+
+    def decimate(self, target_faces: Optional[int] = None, tolerance: Optional[float] = None,
+                 method: Literal['quadric', 'mean'] = 'quadric') -> "SurfaceIO":
+        """
+        Simplify the surface by vertex clustering.
+
+        Args:
+            target_faces (int, optional): The approximate number of faces of the simplified surface.
+            tolerance (float, optional): The maximum distance a vertex may move.  Provide either this or
+                target_faces.
+            method (Literal['quadric', 'mean']): Place each collapsed vertex at the quadric error minimum
+                within its cell, or at the mean of the cell's vertices.
+
+        Returns:
+            SurfaceIO: A new instance holding the simplified surface.  Numeric vertex attributes are averaged
+                over the collapsed vertices, and the attributes of the kept faces are carried over.
+        """
+        vertices, faces, vertex_map, kept_faces = decimate_surface(self.vertices, self.faces,
+                                                                   target_faces=target_faces, tolerance=tolerance,
+                                                                   method=method)
+        return self.__class__(vertices, faces,
+                              vertex_attributes=cluster_vertex_attributes(self.vertex_attributes, vertex_map,
+                                                                          len(vertices)),
+                              face_attributes=self.face_attributes.iloc[kept_faces])
+
+    def lod_pyramid(self, n_levels: int = 4, factor: float = 4.0,
+                    method: Literal['quadric', 'mean'] = 'quadric') -> list["SurfaceIO"]:
+        """
+        Generate a level-of-detail pyramid of successively simplified surfaces.
+
+        Each level is decimated from the previous one to about 1 / factor of its faces, so the total cost is
+        dominated by the first level.
+
+        Args:
+            n_levels (int): The number of simplified levels.
+            factor (float): The reduction in the face count from one level to the next.
+            method (Literal['quadric', 'mean']): The vertex placement of the decimation.
+
+        Returns:
+            list[SurfaceIO]: The levels, starting with this (full resolution) surface.
+        """
+        levels = [self]
+        for _ in range(n_levels):
+            target_faces = int(levels[-1].n_faces / factor)
+            if target_faces < 1:
+                break
+            levels.append(levels[-1].decimate(target_faces=target_faces, method=method))
+        return levels
+
+    def to_lod_pyramid(self, output_path: Path, element_name: str = 'surface',
+                       file_format: Literal['omf', 'ply'] = 'omf', n_levels: int = 4, factor: float = 4.0,
+                       method: Literal['quadric', 'mean'] = 'quadric') -> list:
+        """
+        Generate a level-of-detail pyramid and write the levels as OMF Surface elements or PLY files.
+
+        Args:
+            output_path (Path): The OMF file for the elements, or the directory for the PLY files.
+            element_name (str): The base name of the levels, suffixed with '_lod<level>'.
+            file_format (Literal['omf', 'ply']): Write the levels as elements of one OMF file, or as binary
+                PLY files.
+            n_levels (int): The number of simplified levels.
+            factor (float): The reduction in the face count from one level to the next.
+            method (Literal['quadric', 'mean']): The vertex placement of the decimation.
+
+        Returns:
+            list: The element names (OMF) or file paths (PLY) of the levels, starting with full resolution.
+        """
+        levels = self.lod_pyramid(n_levels=n_levels, factor=factor, method=method)
+        return export_surface_levels([(level.vertices, level.faces) for level in levels], output_path,
+                                     element_name=element_name, file_format=file_format)
+
+    @classmethod
+    def from_omf(cls, omf_input: Union[Path, omf.Project], surface_name: str):
+        """
+        Create a SurfaceIO instance from a Surface element of an OMF file or project object.
+
+        Args:
+            omf_input (Union[Path, omf.Project]): The input OMF file path or project object.
+            surface_name (str): The name of the Surface element to extract.
+
+        Returns:
+            SurfaceIO: An instance of the class.
+        """
+        return cls(**import_surface_from_omf(omf_input, surface_name))
 
     @classmethod
-    def from_obj(cls, obj_file: Path):
+    def from_obj(cls, obj_file: Path, max_workers: int = 1):
         """
         Create a SurfaceIO instance from an OBJ file.
 
         Args:
             obj_file (Path): The input OBJ file path.
+            max_workers (int): The number of processes parsing the file in parallel.
 
         Returns:
             SurfaceIO: An instance of the class.
         """
-        surface_data = import_surface_from_obj(obj_file)
-        return cls(surface_data)
+        return cls(**import_surface_from_obj(obj_file, max_workers=max_workers))
 
     @classmethod
     def from_ply_ascii(cls, ply_file: Path):
@@ -45,13 +276,12 @@ class SurfaceIO:
         Returns:
             SurfaceIO: An instance of the class.
         """
-        surface_data = import_surface_from_ply_ascii(ply_file)
-        return cls(surface_data)
+        return cls(**import_surface_from_ply_ascii(ply_file))
 
     @classmethod
     def from_ply_binary(cls, ply_file: Path):
         """
-        Create a SurfaceIO instance from a binary PLY file.
+        Create a SurfaceIO instance from a binary PLY file, with any additional properties as attributes.
 
         Args:
             ply_file (Path): The input PLY file path.
@@ -59,17 +289,32 @@ class SurfaceIO:
         Returns:
             SurfaceIO: An instance of the class.
         """
-        surface_data = import_surface_from_ply_binary(ply_file)
-        return cls(surface_data)
+        return cls(**import_surface_from_ply_binary(ply_file))
+
+    def to_omf(self, element_name: str = 'surface', output_file: Path = None) -> Union[Path, omf.Surface]:
+        """
+        Convert the surface to an OMF Surface, including the vertex and face attributes.
+
+        Args:
+            element_name (str): The name of the Surface element.
+            output_file (Path, optional): The file path to save the OMF Surface.
+
+        Returns:
+            omf.Surface: The OMF Surface object (if output_file is not provided).
+        """
+        return export_surface_to_omf(self.vertices, self.faces, element_name, output_file,
+                                     vertex_attributes=self.vertex_attributes, face_attributes=self.face_attributes)
 
-    def to_obj(self, output_file: Path):
+    def to_obj(self, output_file: Path, precision: Optional[int] = None):
         """
         Export the surface data to an OBJ file.
 
         Args:
             output_file (Path): The output OBJ file path.
+            precision (int, optional): The number of decimals written for coordinates.  If None, coordinates
+                are written exactly.
         """
-        export_surface_to_obj(self.surface_data, output_file)
+        export_surface_to_obj(self.vertices, self.faces, output_file, precision=precision)
 
     def to_ply_ascii(self, output_file: Path):
         """
@@ -78,13 +323,18 @@ class SurfaceIO:
         Args:
             output_file (Path): The output PLY file path.
         """
-        export_surface_to_ply_ascii(self.surface_data, output_file)
+        export_surface_to_ply_ascii(self.vertices, self.faces, output_file)
 
-    def to_ply_binary(self, output_file: Path):
+    def to_ply_binary(self, output_file: Path, coordinate_dtype: Literal['float32', 'float64'] = 'float32',
+                      byte_order: Literal['little', 'big'] = 'little'):
         """
-        Export the surface data to a binary PLY file.
+        Export the surface data, with its attributes, to a binary PLY file.
 
         Args:
             output_file (Path): The output PLY file path.
+            coordinate_dtype (Literal['float32', 'float64']): The coordinate type, written as float or double.
+            byte_order (Literal['little', 'big']): The byte order of the file body.
         """
-        export_surface_to_ply_binary(self.surface_data, output_file)
\ No newline at end of file
+        export_surface_to_ply_binary(self.vertices, self.faces, output_file,
+                                     vertex_attributes=self.vertex_attributes, face_attributes=self.face_attributes,
+                                     coordinate_dtype=coordinate_dtype, byte_order=byte_order)
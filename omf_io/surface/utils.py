@@ -0,0 +1,112 @@
+from typing import BinaryIO
+
+import numpy as np
+
+# PLY scalar types and their NumPy equivalents (without byte order)
+PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+
+# the PLY type names written for each NumPy kind and size
+PLY_TYPE_NAMES = {
+    'i1': 'char', 'u1': 'uchar', 'b1': 'uchar', 'i2': 'short', 'u2': 'ushort',
+    'i4': 'int', 'u4': 'uint', 'f4': 'float', 'f8': 'double',
+}
+
+BYTE_ORDERS = {'ascii': '=', 'binary_little_endian': '<', 'binary_big_endian': '>'}
+
+
+def read_ply_header(file_obj: BinaryIO) -> dict:
+    """
+    Read a PLY header, leaving the file positioned at the start of the body.
+
+    Args:
+        file_obj (BinaryIO): The PLY file, opened in binary mode.
+
+    Returns:
+        dict: The 'format', the 'byte_order' ('<', '>' or '=' for ASCII), and the 'elements' as a list of
+            dictionaries with a 'name', a 'count' and 'properties'.  Each property is a (name, type) tuple
+            for scalars, or a (name, (count_type, item_type)) tuple for lists, with NumPy type strings.
+
+    Raises:
+        ValueError: If the header is not a valid PLY header.
+    """
+    if file_obj.readline().strip() != b'ply':
+        raise ValueError("Not a PLY file.")
+    header = {'format': None, 'byte_order': None, 'elements': []}
+    while True:
+        line = file_obj.readline()
+        if not line:
+            raise ValueError("The PLY header has no end_header line.")
+        parts = line.decode('ascii').split()
+        if not parts or parts[0] in ('comment', 'obj_info'):
+            continue
+        if parts[0] == 'end_header':
+            break
+        if parts[0] == 'format':
+            if parts[1] not in BYTE_ORDERS:
+                raise ValueError(f"Unsupported PLY format: {parts[1]}")
+            header['format'], header['byte_order'] = parts[1], BYTE_ORDERS[parts[1]]
+        elif parts[0] == 'element':
+            header['elements'].append({'name': parts[1], 'count': int(parts[2]), 'properties': []})
+        elif parts[0] == 'property':
+            try:
+                if parts[1] == 'list':
+                    prop = (parts[4], (PLY_TYPES[parts[2]], PLY_TYPES[parts[3]]))
+                else:
+                    prop = (parts[2], PLY_TYPES[parts[1]])
+            except KeyError as e:
+                raise ValueError(f"Unsupported PLY property type: {e}")
+            header['elements'][-1]['properties'].append(prop)
+    if header['format'] is None:
+        raise ValueError("The PLY header has no format line.")
+    return header
+
+
+def ply_type_name(dtype: np.dtype) -> str:
+    """
+    Return the PLY type name for a NumPy dtype.
+
+    Args:
+        dtype (np.dtype): The NumPy dtype.
+
+    Returns:
+        str: The PLY type name.
+
+    Raises:
+        ValueError: If the dtype has no PLY equivalent.
+    """
+    dtype = np.dtype(dtype)
+    try:
+        return PLY_TYPE_NAMES[f"{dtype.kind}{dtype.itemsize}"]
+    except KeyError:
+        raise ValueError(f"Unsupported data type for PLY: {dtype}")
+
+
+def ply_record_dtype(properties: list[tuple], byte_order: str, list_length: int = 3) -> np.dtype:
+    """
+    Build a packed structured dtype for one element record.
+
+    List properties are expanded to a count field named '<name>_count' and list_length item fields named
+    '<name>_0', '<name>_1', ..., which is exact for records whose lists all have list_length items.
+
+    Args:
+        properties (list[tuple]): The element properties, as returned by read_ply_header.
+        byte_order (str): The byte order, '<' or '>'.
+        list_length (int): The number of items assumed for list properties.
+
+    Returns:
+        np.dtype: The structured dtype, without padding.
+    """
+    fields = []
+    for name, prop_type in properties:
+        if isinstance(prop_type, tuple):
+            count_type, item_type = prop_type
+            fields.append((f"{name}_count", byte_order + count_type))
+            fields.extend((f"{name}_{i}", byte_order + item_type) for i in range(list_length))
+        else:
+            fields.append((name, byte_order + prop_type))
+    return np.dtype(fields)
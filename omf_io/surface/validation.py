@@ -1,36 +1,140 @@
-def validate_surface_data(surface_data):
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from .measures import face_areas
+
+
+def _empty_indices() -> np.ndarray:
+    return np.zeros(0, dtype=np.int64)
+
+
+@dataclass
+class SurfaceValidationReport:
+    """The outcome of a validation of triangulated surface data.
+
+    Offending faces are reported as positional indices into the face array, and non-manifold edges as
+    Kx2 arrays of (lower, higher) vertex indices.  Zero-area faces and non-manifold edges are diagnostics,
+    and do not make the surface invalid.
+    """
+    n_vertices: int
+    n_faces: int
+    invalid_indices: np.ndarray = field(default_factory=_empty_indices)
+    duplicates: np.ndarray = field(default_factory=_empty_indices)
+    degenerate: np.ndarray = field(default_factory=_empty_indices)
+    zero_area: np.ndarray = field(default_factory=_empty_indices)
+    non_manifold_edges: np.ndarray = field(default_factory=lambda: np.zeros((0, 2), dtype=np.int64))
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no face has invalid vertex indices, or is duplicated or degenerate."""
+        return not (len(self.invalid_indices) or len(self.duplicates) or len(self.degenerate))
+
+    @property
+    def is_manifold(self) -> bool:
+        """True if no edge is shared by more than two faces."""
+        return not len(self.non_manifold_edges)
+
+    def summary(self) -> dict:
+        """A JSON-serialisable summary of the report."""
+        return {'n_vertices': self.n_vertices, 'n_faces': self.n_faces,
+                'invalid_indices': len(self.invalid_indices), 'duplicates': len(self.duplicates),
+                'degenerate': len(self.degenerate), 'zero_area': len(self.zero_area),
+                'non_manifold_edges': len(self.non_manifold_edges), 'is_valid': self.is_valid,
+                'is_manifold': self.is_manifold}
+
+
+def validate_surface_data(vertices: np.ndarray, faces: np.ndarray, area_tolerance: float = 0.0,
+                          errors: Literal['raise', 'collect'] = 'raise',
+                          batch_size: int = 1_000_000) -> SurfaceValidationReport:
     """Validate the triangulated surface data.
 
+    Faces are checked for vertex indices out of range, for duplicates (the same three vertices in any
+    order), for degenerate faces (a repeated vertex index), for zero area and for edges shared by more than
+    two faces.  The checks are vectorized: each face is sorted once, and duplicate faces and shared edges
+    are found by sorting integer keys of the sorted indices.
+
     Args:
-        surface_data (dict): A dictionary with 'vertices' and 'faces'.
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        area_tolerance (float): Faces with an area at or below this value are reported as zero-area.
+        errors (Literal['raise', 'collect']): Whether to raise on invalid faces, or only collect the
+            offending faces in the report.
+        batch_size (int): The maximum number of faces for which areas are calculated at once.
+
+    Returns:
+        SurfaceValidationReport: The validation report.
 
     Raises:
         ValueError: If the surface data is invalid.
     """
-    vertices = surface_data.get('vertices', [])
-    faces = surface_data.get('faces', [])
-
     # Check vertices
-    if not vertices:
+    if len(vertices) == 0:
         raise ValueError("The vertices list is empty.")
-    for vertex in vertices:
-        if not (isinstance(vertex, (list, tuple)) and len(vertex) == 3):
-            raise ValueError(f"Invalid vertex: {vertex}. Each vertex must be a tuple of three numbers.")
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise ValueError(f"Invalid vertices shape: {vertices.shape}. Each vertex must have three coordinates.")
 
     # Check faces
-    if not faces:
+    if len(faces) == 0:
         raise ValueError("The faces list is empty.")
-    for face in faces:
-        if not (isinstance(face, (list, tuple)) and len(face) == 3):
-            raise ValueError(f"Invalid face: {face}. Each face must have exactly three vertex indices.")
-        if any(idx < 0 or idx >= len(vertices) for idx in face):
-            raise ValueError(f"Face {face} references invalid vertex indices.")
-
-    # Check for duplicate faces
-    if len(faces) != len(set(tuple(sorted(face)) for face in faces)):
-        raise ValueError("Duplicate faces detected.")
-
-    # Check for degenerate faces
-    for face in faces:
-        if len(set(face)) < 3:
-            raise ValueError(f"Degenerate face detected: {face}.")
+    if faces.ndim != 2 or faces.shape[1] != 3:
+        raise ValueError(f"Invalid faces shape: {faces.shape}. Each face must have exactly three vertex indices.")
+
+    n_vertices, n_faces = len(vertices), len(faces)
+    invalid = ((faces < 0) | (faces >= n_vertices)).any(axis=1)
+    valid_faces = np.flatnonzero(~invalid)
+    sorted_faces = np.sort(faces[valid_faces], axis=1).astype(np.int64, copy=False)
+
+    degenerate = (sorted_faces[:, 0] == sorted_faces[:, 1]) | (sorted_faces[:, 1] == sorted_faces[:, 2])
+    duplicated = _duplicated_rows(sorted_faces, n_vertices)
+    zero_area = face_areas(vertices, faces[valid_faces], batch_size) <= area_tolerance
+    non_manifold_edges = _non_manifold_edges(sorted_faces[~degenerate & ~duplicated], n_vertices)
+
+    report = SurfaceValidationReport(n_vertices=n_vertices, n_faces=n_faces,
+                                     invalid_indices=np.flatnonzero(invalid),
+                                     duplicates=valid_faces[duplicated], degenerate=valid_faces[degenerate],
+                                     zero_area=valid_faces[zero_area & ~degenerate],
+                                     non_manifold_edges=non_manifold_edges)
+
+    if errors == 'raise' and not report.is_valid:
+        raise ValueError(f"Invalid surface: {len(report.invalid_indices)} faces with invalid vertex indices, "
+                         f"{len(report.duplicates)} duplicate and {len(report.degenerate)} degenerate faces.")
+    return report
+
+
+def _duplicated_rows(sorted_faces: np.ndarray, n_vertices: int) -> np.ndarray:
+    """Flag the repeats of sorted faces, keeping the first occurrence.
+
+    Each face is reduced to an integer key: the exact packed indices where they fit in 64 bits, else a hash.
+    Repeated keys are found with a value sort, and only the faces holding a repeated key are compared.
+    """
+    a, b, c = (sorted_faces[:, i].astype(np.uint64) for i in range(3))
+    if n_vertices < 2 ** 21:
+        keys = (a << np.uint64(42)) | (b << np.uint64(21)) | c
+    else:
+        keys = ((a * np.uint64(n_vertices) + b) * np.uint64(0x9E3779B97F4A7C15)) ^ c
+    duplicated = np.zeros(len(sorted_faces), dtype=bool)
+    repeated = _repeated_values(keys)
+    if len(repeated):
+        position = np.minimum(np.searchsorted(repeated, keys), len(repeated) - 1)
+        candidates = np.flatnonzero(repeated[position] == keys)
+        duplicated[candidates] = pd.DataFrame(sorted_faces[candidates]).duplicated(keep='first').to_numpy()
+    return duplicated
+
+
+def _repeated_values(keys: np.ndarray, min_count: int = 2) -> np.ndarray:
+    """Return the sorted unique values that occur at least min_count times."""
+    values = np.sort(keys)
+    run_starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    run_lengths = np.diff(np.r_[run_starts, len(values)])
+    return values[run_starts[run_lengths >= min_count]]
+
+
+def _non_manifold_edges(sorted_faces: np.ndarray, n_vertices: int) -> np.ndarray:
+    """Return the (lower, higher) vertex indices of the edges shared by more than two faces."""
+    lower = np.concatenate([sorted_faces[:, 0], sorted_faces[:, 1], sorted_faces[:, 0]])
+    upper = np.concatenate([sorted_faces[:, 1], sorted_faces[:, 2], sorted_faces[:, 2]])
+    shared = _repeated_values(lower * n_vertices + upper, min_count=3)
+    return np.stack([shared // n_vertices, shared % n_vertices], axis=1)
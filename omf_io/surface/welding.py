@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from .validation import _duplicated_rows
+
+
+def weld_vertices(vertices: np.ndarray, faces: np.ndarray,
+                  tolerance: float = 0.0) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Merge coincident vertices, and compact the mesh.
+
+    Vertices are snapped to a grid with a spacing of the tolerance, and the vertices that snap to the same
+    grid point are merged into the first of them.  With a tolerance of zero only identical vertices are
+    merged.  The grid keys are integers that are hashed, so the cost is linear in the number of vertices.
+    Vertices closer than the tolerance that snap to neighbouring grid points are not merged.
+
+    The faces are remapped to the merged vertices, faces that become degenerate and repeats of a face are
+    dropped, and vertices that are no longer referenced are removed.
+
+    Args:
+        vertices (np.ndarray): The Nx3 vertex coordinates.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        tolerance (float): The grid spacing within which vertices are merged.
+
+    Returns:
+        tuple: The welded vertices and faces, the index of the original vertex kept for each welded vertex,
+            and the index of the original face kept for each welded face.
+    """
+    if tolerance < 0:
+        raise ValueError("The tolerance cannot be negative.")
+    vertex_map = _vertex_clusters(vertices, tolerance)
+    n_clusters = int(vertex_map.max()) + 1 if len(vertex_map) else 0
+    # the first vertex of each cluster is kept
+    first_vertex = np.empty(n_clusters, dtype=np.int64)
+    first_vertex[vertex_map[::-1]] = np.arange(len(vertex_map) - 1, -1, -1)
+
+    faces, kept_clusters, kept_faces = collapse_clusters(vertex_map, faces, n_clusters)
+    kept_vertices = first_vertex[kept_clusters]
+    return vertices[kept_vertices], faces, kept_vertices, kept_faces
+
+
+def collapse_clusters(vertex_map: np.ndarray, faces: np.ndarray,
+                      n_clusters: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collapse the vertices of each cluster into one vertex, and compact the faces.
+
+    Args:
+        vertex_map (np.ndarray): The cluster of each vertex, in [0, n_clusters).
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        n_clusters (int): The number of clusters.
+
+    Returns:
+        tuple: The faces indexing the kept clusters, the kept clusters (those referenced by a face that is
+            neither degenerate nor a repeat, in ascending order) and the index of the original face kept for
+            each face.
+    """
+    collapsed = vertex_map[faces]
+    sorted_faces = np.sort(collapsed, axis=1)
+    degenerate = (sorted_faces[:, 0] == sorted_faces[:, 1]) | (sorted_faces[:, 1] == sorted_faces[:, 2])
+    kept_faces = np.flatnonzero(~degenerate)
+    kept_faces = kept_faces[~_duplicated_rows(sorted_faces[kept_faces], n_clusters)]
+    collapsed = collapsed[kept_faces]
+
+    # drop the clusters no longer referenced by a face, preserving their order
+    used = np.zeros(n_clusters, dtype=bool)
+    used[collapsed.ravel()] = True
+    renumber = np.cumsum(used) - 1
+    index_dtype = np.int32 if used.sum() <= np.iinfo(np.int32).max else np.int64
+    return renumber[collapsed].astype(index_dtype), np.flatnonzero(used), kept_faces
+
+
+def _vertex_clusters(vertices: np.ndarray, tolerance: float) -> np.ndarray:
+    """Label each vertex with the cluster of its grid key, numbered in order of first occurrence."""
+    if tolerance > 0:
+        keys = np.rint((vertices - vertices.min(axis=0)) / tolerance).astype(np.int64)
+        axis_codes = [keys[:, axis] for axis in range(3)]
+        axis_sizes = [int(codes.max()) + 1 if len(codes) else 1 for codes in axis_codes]
+    else:
+        factorized = [pd.factorize(vertices[:, axis]) for axis in range(3)]
+        axis_codes = [codes.astype(np.int64) for codes, _ in factorized]
+        axis_sizes = [max(len(uniques), 1) for _, uniques in factorized]
+
+    # combine the axis codes into one int64 key, re-factorizing first if the combined range would overflow
+    key, size = axis_codes[0], axis_sizes[0]
+    for codes, axis_size in zip(axis_codes[1:], axis_sizes[1:]):
+        if size * axis_size >= 2 ** 63:
+            key, uniques = pd.factorize(key)
+            size = len(uniques)
+        key, size = key * axis_size + codes, size * axis_size
+    return pd.factorize(key)[0].astype(np.int64)
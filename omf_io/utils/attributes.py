@@ -1,11 +1,14 @@
+import numpy as np
 import omf
+import pandas as pd
 
-def generate_omf_attributes(data):
+def generate_omf_attributes(data, location: str = 'vertices'):
     """
     Generate a list of OMF attributes from a DataFrame.
 
     Args:
         data (pd.DataFrame): DataFrame containing attributes and their values.
+        location (str): The element location of the attributes, e.g. 'vertices' or 'faces'.
 
     Returns:
         list: A list of OMF attributes.
@@ -16,34 +19,61 @@ def generate_omf_attributes(data):
         if attr_name.endswith('_color'):
             continue
         if f"{attr_name}_color" in data.columns:
-            # Create a CategoryColormap attribute
+            # Create a CategoryColormap attribute, with the codes of the values (in order of appearance) and the
+            # colour of the first row of each value
+            codes, categories = pd.factorize(data[attr_name])
+            first_rows = np.unique(codes, return_index=True)[1][-len(categories):] if len(categories) else []
             attributes.append(
                 omf.attribute.CategoryAttribute(
-                    array=list(range(len(data[attr_name].unique()))),
+                    name=attr_name,
+                    array=codes,
                     categories=omf.attribute.CategoryColormap(
-                        indices=list(range(len(data[attr_name].unique()))),
-                        values=list(data[attr_name].unique()),
-                        colors=data[f"{attr_name}_color"].values.tolist(),
+                        indices=list(range(len(categories))),
+                        values=list(categories),
+                        colors=[list(color) for color in data[f"{attr_name}_color"].iloc[first_rows]],
                     ),
-                    location='vertices',
+                    location=location,
                 )
             )
         elif data[attr_name].dtype == 'object' or data[attr_name].dtype.name == 'category':
             # Handle non-numeric attributes (e.g., strings) as CategoryAttribute without colors
+            codes, categories = pd.factorize(data[attr_name])
             attributes.append(
                 omf.attribute.CategoryAttribute(
-                    array=data[attr_name].values,
+                    name=attr_name,
+                    # the codes of the values, in order of appearance, as listed in the colormap
+                    array=codes,
                     categories=omf.attribute.CategoryColormap(
-                        indices=list(range(len(data[attr_name].unique()))),
-                        values=list(data[attr_name].unique())
-                    )
+                        indices=list(range(len(categories))),
+                        values=list(categories)
+                    ),
+                    location=location,
                 )
             )
         else:
             # Create a NumericAttribute for numeric cases
             attributes.append(
                 omf.attribute.NumericAttribute(
-                    array=data[attr_name].values
+                    name=attr_name,
+                    array=data[attr_name].values,
+                    location=location,
                 )
             )
-    return attributes
\ No newline at end of file
+    return attributes
+
+
+def omf_attribute_columns(attr) -> dict:
+    """Convert an OMF attribute to columns, with category colors as a '<name>_color' column of tuples."""
+    if isinstance(attr, omf.attribute.NumericAttribute):
+        return {attr.name: attr.array.array}
+    if isinstance(attr, omf.attribute.StringAttribute):
+        return {attr.name: list(attr.array.array)}
+    if isinstance(attr, omf.attribute.CategoryAttribute):
+        categories = attr.categories
+        positions = pd.Index(categories.indices).get_indexer(attr.array.array)
+        columns = {attr.name: pd.Categorical.from_codes(positions, categories=list(categories.values))}
+        if categories.colors:
+            colors = [tuple(color) for color in categories.colors]
+            columns[f"{attr.name}_color"] = pd.Categorical.from_codes(positions, categories=colors)
+        return columns
+    raise NotImplementedError(f"Attribute '{attr}' not implemented.")
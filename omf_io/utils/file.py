@@ -1,6 +1,16 @@
+import datetime
+import json
 import logging
+import os
+import shutil
+import uuid
+import zipfile
 from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
 import omf
+from omf.fileio import check_omf_version
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -49,3 +59,153 @@ def write_omf_element(element: omf.base.ProjectElement, output_file: Path, overw
     project.elements.append(element)
     omf.save(project=project, filename=str(output_file), mode='w')
     logger.info(f"OMF file written to: {output_file}")
+
+
+def load_omf_element(omf_input: Union[Path, omf.Project], element_name: str,
+                     element_type: Optional[type] = None) -> omf.base.ProjectElement:
+    """
+    Load a single element from an OMF file or project.
+
+    When reading a file, only the project JSON and the binary arrays referenced by the requested element are
+    read from the archive, so the arrays of other elements are never decompressed or decoded.
+
+    Args:
+        omf_input (Union[Path, omf.Project]): The OMF file path or project object.
+        element_name (str): The name of the element.
+        element_type (type, optional): The required OMF element class, e.g. omf.Surface.
+
+    Returns:
+        omf.base.ProjectElement: The element.
+
+    Raises:
+        TypeError: If omf_input is not a Path or an omf.Project object.
+        ValueError: If no element of the name (and type) is found.
+    """
+    element_label = element_type.__name__ if element_type is not None else 'Element'
+    if isinstance(omf_input, omf.Project):
+        elements = omf_input.elements
+    elif isinstance(omf_input, Path):
+        with zipfile.ZipFile(omf_input, mode='r') as zip_file:
+            project_json = json.loads(zip_file.read('project.json'))
+            if not check_omf_version(project_json.pop('version', None)):
+                raise ValueError(f"Unsupported OMF file version: {omf_input}")
+            project_json['elements'] = [e for e in project_json.get('elements', []) if e.get('name') == element_name]
+            binary_dict = {key: zip_file.read(key) for key in _binary_keys(project_json['elements'])}
+        elements = omf.Project.deserialize(value=project_json, binary_dict=binary_dict, trusted=True).elements
+    else:
+        raise TypeError("omf_input must be a Path or an omf.Project object.")
+
+    element = next((e for e in elements if e.name == element_name and
+                    (element_type is None or isinstance(e, element_type))), None)
+    if element is None:
+        raise ValueError(f"{element_label} with name '{element_name}' not found in the OMF project.")
+    return element
+
+
+def _binary_keys(value) -> set[str]:
+    """Collect the archive keys of the binary arrays referenced in serialized OMF JSON."""
+    keys = set()
+    if isinstance(value, dict):
+        if isinstance(value.get('array'), str) and 'data_type' in value:
+            keys.add(value['array'])
+        for item in value.values():
+            keys |= _binary_keys(item)
+    elif isinstance(value, list):
+        for item in value:
+            keys |= _binary_keys(item)
+    return keys
+
+
+def write_omf_element_chunked(element: omf.base.ProjectElement, output_file: Path,
+                              array_chunks: dict[tuple, tuple[int, np.dtype, Iterable[np.ndarray]]],
+                              overwrite: bool = False, copy_buffer_size: int = 16 * 1024 * 1024) -> Path:
+    """
+    Write an OMF element to a file, streaming its large arrays into the archive chunk by chunk.
+
+    The element is serialized with placeholder arrays, which are replaced by arrays streamed from chunk
+    iterables, so that no array is ever held in memory whole.  The archive is rewritten to a temporary file,
+    copying the entries of any existing elements in bounded buffers, and then replaces the output file.
+
+    Args:
+        element (omf.base.ProjectElement): The OMF element, holding placeholders for the streamed arrays.
+        output_file (Path): The OMF file, created if it does not exist.
+        array_chunks (dict): Maps the key path of each streamed array in the serialized element (such as
+            ('offset_w',) or ('attributes', 0, 'array')) to its (length, dtype, chunks).  The chunks are arrays
+            whose values, in order, form the 1D array.
+        overwrite (bool): Whether to replace an element of the same name.
+        copy_buffer_size (int): The buffer size used to copy the entries of existing elements.
+
+    Returns:
+        Path: The output file.
+
+    Raises:
+        FileExistsError: If an element of the name exists and overwrite is False.
+        ValueError: If a streamed array does not have its declared length.
+    """
+    output_file = Path(output_file)
+    if output_file.exists():
+        with zipfile.ZipFile(output_file, mode='r') as zip_file:
+            project_json = json.loads(zip_file.read('project.json'))
+    else:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        project_json = omf.Project(name=element.name).serialize(include_class=False)
+        project_json['version'] = omf.fileio.OMF_VERSION
+
+    existing = [e for e in project_json.get('elements', []) if e.get('name') == element.name]
+    if existing and not overwrite:
+        raise FileExistsError(f"Element '{element.name}' already exists in the project. "
+                              f"Use overwrite=True to replace it.")
+    dropped_keys = _binary_keys(existing)
+    project_json['elements'] = [e for e in project_json.get('elements', []) if e.get('name') != element.name]
+
+    # serialize the element, then point the placeholder arrays at the streamed arrays
+    binary_dict = {}
+    element_json = element.serialize(binary_dict=binary_dict, include_class=False)
+    streams = []
+    for path, (length, dtype, chunks) in array_chunks.items():
+        array_json = element_json
+        for key in path:
+            array_json = array_json[key]
+        binary_dict.pop(array_json['array'], None)
+        dtype = np.dtype(dtype)
+        array_json.update({'array': str(uuid.uuid4()), 'shape': [int(length)],
+                           'data_type': omf.attribute.DATA_TYPE_LOOKUP_TO_STRING[dtype],
+                           'size': int(length) * dtype.itemsize})
+        streams.append((array_json['array'], int(length), dtype, chunks))
+    project_json['elements'].append(element_json)
+
+    time_tuple = datetime.datetime.now(datetime.timezone.utc).timetuple()[:6]
+    temporary_file = output_file.with_name(output_file.name + '.tmp')
+    try:
+        with zipfile.ZipFile(temporary_file, mode='w', compression=zipfile.ZIP_DEFLATED,
+                             allowZip64=True) as zip_out:
+            zip_out.writestr(zipfile.ZipInfo('project.json', date_time=time_tuple),
+                             json.dumps(project_json).encode('utf-8'), compress_type=zipfile.ZIP_DEFLATED)
+            if output_file.exists():
+                with zipfile.ZipFile(output_file, mode='r') as zip_in:
+                    for info in zip_in.infolist():
+                        if info.filename == 'project.json' or info.filename in dropped_keys:
+                            continue
+                        with zip_in.open(info) as source, zip_out.open(info.filename, mode='w',
+                                                                       force_zip64=True) as target:
+                            shutil.copyfileobj(source, target, copy_buffer_size)
+            for key, value in binary_dict.items():
+                zip_out.writestr(zipfile.ZipInfo(key, date_time=time_tuple), value,
+                                 compress_type=zipfile.ZIP_DEFLATED)
+            for key, length, dtype, chunks in streams:
+                info = zipfile.ZipInfo(key, date_time=time_tuple)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                written = 0
+                with zip_out.open(info, mode='w', force_zip64=True) as target:
+                    for chunk in chunks:
+                        chunk = np.ascontiguousarray(chunk, dtype=dtype).ravel()
+                        target.write(memoryview(chunk).cast('B'))
+                        written += len(chunk)
+                if written != length:
+                    raise ValueError(f"The streamed array has {written} values, expected {length}.")
+        os.replace(temporary_file, output_file)
+    finally:
+        if temporary_file.exists():
+            temporary_file.unlink()
+    logger.info(f"OMF file written to: {output_file}")
+    return output_file
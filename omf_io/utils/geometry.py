@@ -0,0 +1,295 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def polygon_rings(polygon) -> list[np.ndarray]:
+    """Return the rings of a polygon as a list of closed Nx2 arrays.
+
+    Args:
+        polygon: An Nx2 array-like of XY vertices, or an object with `exterior` and `interiors` rings,
+            such as a shapely Polygon.  Holes are honoured for the latter.
+
+    Returns:
+        list[np.ndarray]: The closed rings.
+    """
+    if hasattr(polygon, 'exterior'):
+        rings = [polygon.exterior.coords] + [ring.coords for ring in polygon.interiors]
+    else:
+        rings = [polygon]
+    closed = []
+    for ring in rings:
+        ring = np.asarray(ring, dtype=np.float64)[:, :2]
+        if len(ring) < 3:
+            raise ValueError("A polygon ring must have at least three vertices.")
+        if not np.array_equal(ring[0], ring[-1]):
+            ring = np.vstack([ring, ring[:1]])
+        closed.append(ring)
+    return closed
+
+
+def points_in_polygon(x: np.ndarray, y: np.ndarray, polygon, n_bands: Optional[int] = None,
+                      batch_size: int = 4_000_000) -> np.ndarray:
+    """Test which points lie inside a polygon, using the crossing number rule.
+
+    The polygon edges are binned into horizontal bands so that each point is only tested against the edges
+    that span its band, and the tests within a band are vectorized.
+
+    Args:
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points.
+        polygon: An Nx2 array-like of XY vertices, or a shapely-like Polygon with holes.
+        n_bands (int, optional): The number of bands.  Defaults to about the square root of the edge count.
+        batch_size (int): The maximum number of point-edge tests evaluated at once.
+
+    Returns:
+        np.ndarray: A boolean array, True for points inside the polygon.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    rings = polygon_rings(polygon)
+    x1 = np.concatenate([ring[:-1, 0] for ring in rings])
+    y1 = np.concatenate([ring[:-1, 1] for ring in rings])
+    x2 = np.concatenate([ring[1:, 0] for ring in rings])
+    y2 = np.concatenate([ring[1:, 1] for ring in rings])
+    # horizontal edges never cross a horizontal ray
+    keep = y1 != y2
+    x1, y1, x2, y2 = x1[keep], y1[keep], x2[keep], y2[keep]
+
+    inside = np.zeros(len(x), dtype=bool)
+    if not len(x1):
+        return inside
+    ymin, ymax = min(y1.min(), y2.min()), max(y1.max(), y2.max())
+    xmin, xmax = min(x1.min(), x2.min()), max(x1.max(), x2.max())
+    candidates = np.flatnonzero((x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax))
+    if not len(candidates):
+        return inside
+
+    n_bands = n_bands or max(1, int(np.sqrt(len(x1))))
+    band_height = (ymax - ymin) / n_bands or 1.0
+    edge_lo = np.clip(((np.minimum(y1, y2) - ymin) // band_height).astype(np.int64), 0, n_bands - 1)
+    edge_hi = np.clip(((np.maximum(y1, y2) - ymin) // band_height).astype(np.int64), 0, n_bands - 1)
+    # an edge is listed once for every band it spans
+    edge_repeats = edge_hi - edge_lo + 1
+    band_edges = np.repeat(np.arange(len(x1)), edge_repeats)
+    band_of_edge = np.repeat(edge_lo, edge_repeats) + (np.arange(len(band_edges)) -
+                                                       np.repeat(np.cumsum(edge_repeats) - edge_repeats,
+                                                                 edge_repeats))
+    order = np.argsort(band_of_edge, kind='stable')
+    band_edges = band_edges[order]
+    band_start = np.searchsorted(band_of_edge[order], np.arange(n_bands + 1))
+
+    point_band = np.clip(((y[candidates] - ymin) // band_height).astype(np.int64), 0, n_bands - 1)
+    point_order = np.argsort(point_band, kind='stable')
+    point_start = np.searchsorted(point_band[point_order], np.arange(n_bands + 1))
+
+    for band in range(n_bands):
+        edges = band_edges[band_start[band]:band_start[band + 1]]
+        points = candidates[point_order[point_start[band]:point_start[band + 1]]]
+        if not len(edges) or not len(points):
+            continue
+        ex1, ey1, ex2, ey2 = x1[edges], y1[edges], x2[edges], y2[edges]
+        step = max(1, batch_size // len(edges))
+        for i in range(0, len(points), step):
+            batch = points[i:i + step]
+            px = x[batch, np.newaxis]
+            py = y[batch, np.newaxis]
+            straddles = (ey1 > py) != (ey2 > py)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x_cross = ex1 + (py - ey1) * (ex2 - ex1) / (ey2 - ey1)
+            crossings = np.count_nonzero(straddles & (px < x_cross), axis=1)
+            inside[batch] = (crossings % 2) == 1
+    return inside
+
+
+def surface_elevation(x: np.ndarray, y: np.ndarray, vertices: np.ndarray, faces: np.ndarray,
+                      cell_size: Optional[float] = None, batch_size: int = 1_000_000) -> np.ndarray:
+    """Calculate the elevation of a triangulated surface at XY locations by vertical projection.
+
+    The triangles are binned by their XY bounding boxes into a uniform grid.  Each point is then only tested
+    against the triangles in its grid cell, using vectorized barycentric coordinates.  Where triangles overlap
+    in plan (e.g. a closed shell) the highest elevation is returned.
+
+    Args:
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points.
+        vertices (np.ndarray): The Nx3 surface vertices.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        cell_size (float, optional): The acceleration grid cell size.  Defaults to about the mean
+            triangle extent.
+        batch_size (int): The maximum number of points processed at once.
+
+    Returns:
+        np.ndarray: The surface elevation at each point, NaN where the surface does not cover the point.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    elevation = np.full(len(x), np.nan)
+    grid = TriangleGrid(vertices, faces, cell_size)
+    for start in range(0, len(x), batch_size):
+        stop = min(start + batch_size, len(x))
+        point, face, z = grid.hits(x[start:stop], y[start:stop])
+        if len(point):
+            batch_elevation = elevation[start:stop]
+            np.fmax.at(batch_elevation, point, z)
+            elevation[start:stop] = batch_elevation
+    return elevation
+
+
+def classify_points(x: np.ndarray, y: np.ndarray, z: np.ndarray, vertices: np.ndarray, faces: np.ndarray,
+                    column_codes: Optional[np.ndarray] = None, cell_size: Optional[float] = None,
+                    tolerance: float = 1e-6, batch_size: int = 250_000,
+                    max_workers: Optional[int] = 1) -> pd.DataFrame:
+    """Classify points as above, below or inside a triangulated surface.
+
+    A vertical ray is cast through each XY location, and its crossings with the surface are found with the
+    triangle grid of `surface_elevation`.  A point is above or below the surface when it is above or below
+    the highest crossing, and inside it when an odd number of crossings lie above it, which is meaningful for
+    a closed shell.  Points that the surface does not cover are neither.
+
+    Points that share an XY location, such as the blocks of a block model column, can be passed as unique
+    columns with the column of each point, so that each ray is cast once.
+
+    Args:
+        x (np.ndarray): The x coordinates of the points, or of the columns if column_codes is provided.
+        y (np.ndarray): The y coordinates of the points, or of the columns if column_codes is provided.
+        z (np.ndarray): The z coordinates of the points.
+        vertices (np.ndarray): The Nx3 surface vertices.
+        faces (np.ndarray): The Mx3 triangle vertex indices.
+        column_codes (np.ndarray, optional): The position of each point in x and y.
+        cell_size (float, optional): The acceleration grid cell size.  Defaults to about the mean
+            triangle extent.
+        tolerance (float): Crossings of one ray closer than this are counted once, as where the ray passes
+            through an edge or vertex shared by several triangles.
+        batch_size (int): The maximum number of rays cast at once.
+        max_workers (int, optional): The number of threads casting batches of rays.
+
+    Returns:
+        pandas.DataFrame: One row per point, with the surface 'elevation' (the highest crossing, NaN where
+            the surface does not cover the point) and the boolean 'above', 'below' and 'inside' flags.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+    if column_codes is None:
+        if not len(x) == len(y) == len(z):
+            raise ValueError("The x, y and z coordinates must have the same length.")
+        column_codes = np.arange(len(z))
+    elif len(column_codes) != len(z):
+        raise ValueError("The column codes and z coordinates must have the same length.")
+
+    grid = TriangleGrid(vertices, faces, cell_size)
+
+    def cast(start: int) -> tuple[np.ndarray, np.ndarray]:
+        point, _, elevation = grid.hits(x[start:start + batch_size], y[start:start + batch_size])
+        return point + start, elevation
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        batches = list(executor.map(cast, range(0, len(x), batch_size)))
+    columns = np.concatenate([column for column, _ in batches] + [np.zeros(0, dtype=np.int64)])
+    crossings = np.concatenate([elevation for _, elevation in batches] + [np.zeros(0)])
+
+    # sort the crossings up each ray, and merge those within the tolerance
+    order = np.lexsort((crossings, columns))
+    columns, crossings = columns[order], crossings[order]
+    distinct = np.r_[True, (columns[1:] != columns[:-1]) | (np.diff(crossings) > tolerance)]
+    columns, crossings = columns[distinct], crossings[distinct]
+
+    # the crossings of each ray are a run of the sorted crossings (a CSR layout), so folded surfaces cost no
+    # more than the crossings they add
+    counts = np.bincount(columns, minlength=len(x))
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    elevation = np.full(len(x), np.nan)
+    covered = counts > 0
+    elevation[covered] = crossings[offsets[1:][covered] - 1]
+
+    # the crossings above each point, from a sorted search of (column, elevation) ranked as single integers
+    values, ranks = np.unique(np.concatenate([crossings, z]), return_inverse=True)
+    keys = columns.astype(np.int64) * len(values) + ranks[:len(crossings)]
+    point_keys = column_codes.astype(np.int64) * len(values) + ranks[len(crossings):]
+    n_above = offsets[column_codes + 1] - np.searchsorted(keys, point_keys, side='right')
+    inside = n_above % 2 == 1
+    point_elevation = elevation[column_codes]
+    with np.errstate(invalid='ignore'):
+        return pd.DataFrame({'elevation': point_elevation, 'above': z > point_elevation,
+                             'below': z < point_elevation, 'inside': inside})
+
+
+class TriangleGrid:
+    """A uniform XY grid of triangle references, for fast vertical projection of points onto a surface."""
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray, cell_size: Optional[float] = None):
+        """
+        Bin the triangles of a surface into a uniform XY grid.
+
+        Args:
+            vertices (np.ndarray): The Nx3 surface vertices.
+            faces (np.ndarray): The Mx3 triangle vertex indices.
+            cell_size (float, optional): The grid cell size.  Defaults to about the mean triangle extent.
+        """
+        self.vertices = np.asarray(vertices, dtype=np.float64)
+        self.faces = np.asarray(faces, dtype=np.int64)
+        corners = self.vertices[self.faces]
+        lower = corners[:, :, :2].min(axis=1)
+        upper = corners[:, :, :2].max(axis=1)
+        self.origin = lower.min(axis=0) if len(lower) else np.zeros(2)
+        extent = (upper.max(axis=0) - self.origin) if len(upper) else np.ones(2)
+        if cell_size is None:
+            mean_size = float(np.mean(upper - lower)) if len(lower) else 1.0
+            cell_size = max(mean_size, float(extent.max()) / 4096, 1e-9)
+        self.cell_size = cell_size
+        self.shape = np.maximum(np.floor(extent / cell_size).astype(np.int64) + 1, 1)
+
+        lo = np.floor((lower - self.origin) / cell_size).astype(np.int64)
+        hi = np.floor((upper - self.origin) / cell_size).astype(np.int64)
+        span = hi - lo + 1
+        counts = span[:, 0] * span[:, 1]
+        face_ids = np.repeat(np.arange(len(self.faces)), counts)
+        # enumerate the cells covered by each triangle bounding box
+        offset = np.arange(len(face_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = np.repeat(lo[:, 0], counts) + offset // np.repeat(span[:, 1], counts)
+        cy = np.repeat(lo[:, 1], counts) + offset % np.repeat(span[:, 1], counts)
+        cells = cx * self.shape[1] + cy
+        order = np.argsort(cells, kind='stable')
+        self.cell_faces = face_ids[order]
+        self.cell_start = np.searchsorted(cells[order], np.arange(self.shape[0] * self.shape[1] + 1))
+
+        # pre-computed barycentric terms for every triangle, as contiguous arrays for fast gathers
+        a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+        self._ax, self._ay, self._az = (np.ascontiguousarray(a[:, axis]) for axis in range(3))
+        self._v0x, self._v0y = b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]
+        self._v1x, self._v1y = c[:, 0] - a[:, 0], c[:, 1] - a[:, 1]
+        self._dz0, self._dz1 = b[:, 2] - a[:, 2], c[:, 2] - a[:, 2]
+        self._denominator = self._v0x * self._v1y - self._v1x * self._v0y
+
+    def candidates(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return (point, face) pairs for the triangles in the grid cell of each point."""
+        cx = np.floor((x - self.origin[0]) / self.cell_size).astype(np.int64)
+        cy = np.floor((y - self.origin[1]) / self.cell_size).astype(np.int64)
+        on_grid = (cx >= 0) & (cx < self.shape[0]) & (cy >= 0) & (cy < self.shape[1])
+        points = np.flatnonzero(on_grid)
+        cells = cx[points] * self.shape[1] + cy[points]
+        starts = self.cell_start[cells]
+        counts = self.cell_start[cells + 1] - starts
+        point_ids = np.repeat(points, counts)
+        offset = np.arange(len(point_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return point_ids, self.cell_faces[np.repeat(starts, counts) + offset]
+
+    def hits(self, x: np.ndarray, y: np.ndarray, tolerance: float = 1e-12) -> tuple[np.ndarray, np.ndarray,
+                                                                                    np.ndarray]:
+        """Return the (point, face, elevation) of every triangle that each point projects onto vertically."""
+        point, face = self.candidates(x, y)
+        denominator = self._denominator[face]
+        valid = np.abs(denominator) > tolerance
+        point, face, denominator = point[valid], face[valid], denominator[valid]
+        px = x[point] - self._ax[face]
+        py = y[point] - self._ay[face]
+        u = (px * self._v1y[face] - self._v1x[face] * py) / denominator
+        v = (self._v0x[face] * py - px * self._v0y[face]) / denominator
+        eps = 1e-9
+        inside = (u >= -eps) & (v >= -eps) & (u + v <= 1 + eps)
+        point, face, u, v = point[inside], face[inside], u[inside], v[inside]
+        z = self._az[face] + u * self._dz0[face] + v * self._dz1[face]
+        return point, face, z
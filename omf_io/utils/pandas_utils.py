@@ -1,7 +1,7 @@
 import tokenize
 from io import StringIO
 from token import STRING
-from typing import Literal
+from typing import Literal, Optional
 
 import pandas as pd
 import numpy as np
@@ -47,6 +47,104 @@ def to_numpy_integer_dtype(series: pd.Series) -> pd.Series:
     return series.astype(str(series.dtype).replace("I", "i")) if is_nullable_integer_dtype(series) else series
 
 
+def float32_rounding_decimals(values: np.ndarray, max_decimals: int = 6) -> Optional[int]:
+    """ Find the decimal precision at which rounded float32 values reproduce float64 values.
+
+    The float32 values are not equal to the float64 values: values parsed from text rarely survive a float32
+    round trip (0.1 is stored as 0.100000001).  They are rounding-equivalent, in that rounding the float32
+    values back to the decimal precision of the text recovers the float64 values exactly, with
+    `restore_float32`.
+
+    Args:
+        values: The float64 values
+        max_decimals: The maximum number of decimals considered
+
+    Returns:
+        Optional[int]: The number of decimals, or None if the rounded float32 values differ from the values.
+    """
+    finite = values[np.isfinite(values)]
+    restored = finite.astype(np.float32).astype(np.float64)
+    for decimals in range(max_decimals + 1):
+        if np.array_equal(np.round(finite, decimals), finite):
+            return decimals if np.array_equal(np.round(restored, decimals), finite) else None
+    return None
+
+
+def restore_float32(values: np.ndarray, decimals: Optional[int]) -> np.ndarray:
+    """ Restore float64 values from a float32 array created at a known decimal precision.
+
+    Args:
+        values: The float32 values
+        decimals: The decimals returned by `float32_rounding_decimals`, or None to only convert the values
+
+    Returns:
+        np.ndarray: The float64 values
+    """
+    values = values.astype(np.float64)
+    return values if decimals is None else np.round(values, decimals)
+
+
+def optimize_memory(df: pd.DataFrame, float_tolerance: Optional[float] = None,
+                    category_threshold: float = 0.5) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """ Reduce the memory footprint of a DataFrame by compacting the dtypes of its columns.
+
+    Integers are downcast to the smallest integer dtype that holds them.  Floats are downcast to float32 when
+    the error is within the tolerance, or by default when they are rounding-equivalent (see
+    `float32_rounding_decimals`), in which case the decimals are recorded by column in the
+    ``attrs['float32_decimals']`` of the DataFrame for `restore_float32`.  Repeated strings and colour tuples
+    (``_color`` columns) are converted to categoricals when the ratio of unique to total values is at or below
+    the threshold.  The index is untouched.
+
+    Args:
+        df: The DataFrame
+        float_tolerance: The maximum absolute error accepted when downcasting floats.  If None, floats are only
+            downcast when rounding the float32 values to their decimal precision recovers them exactly.
+        category_threshold: The maximum ratio of unique to total values for conversion to a categorical.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The compacted DataFrame, and a report indexed by column with the
+        dtype and bytes before and after.
+    """
+    bytes_before = df.memory_usage(deep=True, index=False)
+    dtypes_before = df.dtypes.astype(str)
+
+    df = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, CategoricalDtype):
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            df[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series) and series.dtype.itemsize > 4:
+            values = series.to_numpy(dtype=np.float64)
+            if float_tolerance is None:
+                decimals = float32_rounding_decimals(values)
+                downcast = decimals is not None
+                if downcast:
+                    df.attrs['float32_decimals'] = {**df.attrs.get('float32_decimals', {}), col: decimals}
+            else:
+                finite = np.isfinite(values)
+                error = np.abs(values[finite] - values[finite].astype(np.float32))
+                downcast = error.size == 0 or bool(error.max() <= float_tolerance)
+            if downcast:
+                df[col] = series.astype(np.float32)
+        elif series.dtype == object and len(series):
+            if str(col).endswith('_color'):
+                # colours may arrive as lists, which are not hashable
+                series = series.map(lambda c: tuple(c) if isinstance(c, list) else c)
+            try:
+                n_unique = series.nunique(dropna=False)
+            except TypeError:
+                continue
+            if n_unique / len(series) <= category_threshold:
+                df[col] = series.astype('category')
+
+    report = pd.DataFrame({'dtype_before': dtypes_before, 'dtype_after': df.dtypes.astype(str),
+                           'bytes_before': bytes_before,
+                           'bytes_after': df.memory_usage(deep=True, index=False)})
+    return df, report
+
+
 def parse_vars_from_expr(expr: str) -> list[str]:
     """ Parse variables from a pandas query expression string.
 
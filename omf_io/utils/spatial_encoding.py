@@ -86,4 +86,26 @@ def decode_dimensions(encoded: Union[np.ndarray, int]) -> Union[Tuple[np.ndarray
     dx = dx_int / 10.0
     dy = dy_int / 10.0
     dz = dz_int / 10.0
-    return dx, dy, dz
\ No newline at end of file
+    return dx, dy, dz
+
+def _spread_bits_3d(value: np.ndarray) -> np.ndarray:
+    """Spread the lower 21 bits of each value so that two zero bits separate every original bit."""
+    v = value.astype(np.uint64) & np.uint64(0x1FFFFF)
+    v = (v | (v << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return v
+
+
+def morton_encode(ix: np.ndarray, iy: np.ndarray, iz: np.ndarray) -> np.ndarray:
+    """Encode non-negative integer grid indices into 64-bit Morton (Z-order) keys.
+
+    Each index may use up to 21 bits.  Keys that are close in value are close in space, which makes
+    them suitable for spatial partitioning and sorting.
+    """
+    ix, iy, iz = (np.asarray(v) for v in (ix, iy, iz))
+    if any(np.any(v < 0) or np.any(v > 0x1FFFFF) for v in (ix, iy, iz)):
+        raise ValueError("Morton indices must be in the range [0, 2097151]")
+    return _spread_bits_3d(ix) | (_spread_bits_3d(iy) << np.uint64(1)) | (_spread_bits_3d(iz) << np.uint64(2))
@@ -1,7 +1,11 @@
+from pathlib import Path
+from typing import Optional
+
 import numpy as np
+import omf
 import pandas as pd
 
-from omf_io.base import PathLike
+from omf_io.base import OMFIO, PathLike
 from omf_io.reader import OMFReader
 
 
@@ -12,31 +16,54 @@ class OMFWriter(OMFReader):
     def __init__(self, filepath: PathLike):
         """Instantiate the OMFPandasWriter object.
 
+        Unlike the reader, the file need not exist yet, and is created by the first element written.
+
         Args:
             filepath (Path): Path to the OMF file.
         """
-        OMFReader.__init__(self, filepath)
-
+        OMFIO.__init__(self, filepath)
 
-    def write_raster_from_file(self, raster_file: PathLike, name: str, **kwargs):
+    def write_raster_from_file(self, raster_file: PathLike, name: str, overwrite: bool = False, **kwargs) -> Path:
         """Load a raster from a file into an OMF GridSurface object.
 
+        The raster is opened lazily and streamed into the OMF file one strip of chunks at a time.
+
         Args:
             raster_file (PathLike): Path to the raster file (e.g., GeoTIFF).
             name (str): The name of the raster.
-            **kwargs: Additional keyword arguments.
+            overwrite (bool): Whether to replace an element of the same name.
+            **kwargs: Additional keyword arguments for `GridSurfaceIO.from_raster`, e.g. chunks or bounds.
+
+        Returns:
+            Path: The OMF file path.
         """
-        pass
+        from omf_io.gridsurface import GridSurfaceIO
+        grid_surface = GridSurfaceIO.from_raster(Path(raster_file), **kwargs)
+        return self.write_raster_from_array(grid_surface.surface_data, name, overwrite=overwrite)
 
-    def write_raster_from_array(self, array: np.ndarray, name: str, **kwargs):
+    def write_raster_from_array(self, array: np.ndarray, name: str, transform=None, attributes: Optional[dict] = None,
+                                overwrite: bool = False, **kwargs) -> Path:
         """Load a raster from a numpy array into an OMF GridSurface object.
 
         Args:
-            array (np.ndarray): The raster as a numpy array.
+            array (np.ndarray): The raster as a numpy array, a dask array, or an xarray.DataArray with rioxarray
+                spatial metadata.
             name (str): The name of the raster.
-            **kwargs: Additional keyword arguments.
+            transform (affine.Affine, optional): The affine transform of the raster, required unless the array
+                is a DataArray with spatial metadata.
+            attributes (dict, optional): Attribute grids of the same shape, keyed by name.
+            overwrite (bool): Whether to replace an element of the same name.
+            **kwargs: Additional keyword arguments for `export_grid_surface_to_omf`.
+
+        Returns:
+            Path: The OMF file path.
         """
-        pass
+        from omf_io.gridsurface.exporters import export_grid_surface_to_omf
+        export_grid_surface_to_omf(array, name, self.filepath, transform=transform, attributes=attributes,
+                                   overwrite=overwrite, **kwargs)
+        # refresh the element listing, without reading the arrays
+        self.project = omf.load(str(self.filepath), include_binary=False)
+        return self.filepath
 
     def write_blockmodel_from_file(self, blockmodel_file: PathLike, name: str, **kwargs):
         """Load a blockmodel from a file into an OMF BlockModel object.
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -22,3 +23,20 @@ def pointset_sample_data():
         ),
     )
     return data
+
+
+@pytest.fixture
+def tiled_dem(tmp_path):
+    """A 512 x 512 tiled GeoTIFF of 128 x 128 tiles, with 10 m cells from (1000, 2000) to (6120, 7120)."""
+    import rasterio
+    from rasterio.transform import from_origin
+
+    path = tmp_path / 'dem.tif'
+    rows, cols = np.mgrid[0:512, 0:512]
+    values = (rows * 1000 + cols).astype(np.float32)
+    values[0, 0] = -9999
+    with rasterio.open(path, 'w', driver='GTiff', width=512, height=512, count=1, dtype='float32',
+                       crs='EPSG:32750', transform=from_origin(1000, 7120, 10, 10), nodata=-9999,
+                       tiled=True, blockxsize=128, blockysize=128) as dst:
+        dst.write(values, 1)
+    return path, values
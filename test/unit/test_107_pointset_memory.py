@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.pointset.point_set import PointSetIO
+from omf_io.utils.pandas_utils import restore_float32
+
+
+@pytest.fixture
+def collar_like_data():
+    n = 300
+    holeid = np.repeat(['DH001', 'DH002', 'DH003'], n // 3)
+    colors = {'DH001': (255, 0, 0), 'DH002': (0, 255, 0), 'DH003': (0, 0, 255)}
+    return pd.DataFrame(
+        {
+            "holeid": holeid,
+            "holeid_color": [colors[h] for h in holeid],
+            "depth": np.round(np.linspace(0, 500, n), 1),
+            "samples": np.arange(n, dtype=np.int64),
+        },
+        index=pd.MultiIndex.from_arrays([np.arange(n, dtype=float)] * 3, names=["x", "y", "z"]),
+    )
+
+
+def test_optimize_memory_report(collar_like_data):
+    pointset = PointSetIO(collar_like_data)
+    report = pointset.optimize_memory()
+
+    assert list(report.index) == list(collar_like_data.columns)
+    assert report.loc['holeid', 'dtype_after'] == 'category'
+    assert report.loc['holeid_color', 'dtype_after'] == 'category'
+    assert report.loc['depth', 'dtype_after'] == 'float32'
+    assert report.loc['samples', 'dtype_after'] == 'int16'
+    assert (report['bytes_after'] < report['bytes_before']).all()
+
+    # the colours remain tuples, as expected by the OMF attribute writer
+    assert pointset.data['holeid_color'].values.tolist()[0] == (255, 0, 0)
+    pointset.to_omf('collar').validate()
+
+    # the float32 depths are rounding-equivalent to the originals, at the recorded decimals
+    assert pointset.data.attrs['float32_decimals'] == {'depth': 1}
+    np.testing.assert_array_equal(restore_float32(pointset.data['depth'].to_numpy(), 1), collar_like_data['depth'])
+    assert 'float32_decimals' not in collar_like_data.attrs
+
+
+def test_optimize_memory_float_tolerance(collar_like_data):
+    collar_like_data['depth'] = collar_like_data['depth'] + 1 / 3
+    pointset = PointSetIO(collar_like_data)
+    assert pointset.optimize_memory().loc['depth', 'dtype_after'] == 'float64'
+    assert pointset.optimize_memory(float_tolerance=1e-4).loc['depth', 'dtype_after'] == 'float32'
+
+
+def test_optimize_on_import(collar_like_data, tmp_path):
+    csv_file = PointSetIO(collar_like_data).to_csv(tmp_path / 'collars.csv')
+    pointset = PointSetIO.from_csv(csv_file, optimize=True)
+    assert isinstance(pointset.data['holeid'].dtype, pd.CategoricalDtype)
+    assert pointset.data['samples'].dtype == np.int16
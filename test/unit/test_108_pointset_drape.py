@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.gridsurface import GridSurfaceIO
+from omf_io.pointset import PointSetIO
+
+
+@pytest.fixture
+def collars():
+    # three collars on the tiled dem, one over the nodata cell, and one outside the raster
+    index = pd.MultiIndex.from_arrays([[1015.0, 2307.5, 1010.0, 500.0], [7105.0, 5818.0, 7118.0, 500.0],
+                                       [0.0, 0.0, 0.0, 42.0]], names=['x', 'y', 'z'])
+    return PointSetIO(pd.DataFrame({'hole_id': ['DH1', 'DH2', 'DH3', 'DH4']}, index=index))
+
+
+@pytest.mark.parametrize('chunks', [{'x': 128, 'y': 128}, None])
+def test_drape_bilinear(tiled_dem, collars, chunks):
+    path, values = tiled_dem
+    surface = GridSurfaceIO.from_raster(path, chunks=chunks)
+    draped = collars.drape(surface)
+
+    z = draped.data.index.get_level_values('z').to_numpy()
+    # the cell centres are at x = 1005 + 10 * column and y = 7115 - 10 * row, so the rows and columns of the
+    # first two collars are (1, 1) and (129.7, 130.25)
+    assert z[0] == values[1, 1]
+    assert z[1] == pytest.approx(129.7 * 1000 + 130.25)
+    # the nodata cell is left out of the interpolation, and collars off the raster keep their z
+    assert z[2] == values[0, 1]
+    assert z[3] == 42.0
+    assert draped.data['hole_id'].tolist() == ['DH1', 'DH2', 'DH3', 'DH4']
+    np.testing.assert_array_equal(collars.data.index.get_level_values('z'), [0, 0, 0, 42])
+
+
+def test_drape_nearest_with_offset(tiled_dem, collars):
+    path, values = tiled_dem
+    draped = collars.drape(GridSurfaceIO.from_raster(path), method='nearest', offset=1.5)
+    assert draped.data.index.get_level_values('z')[1] == values[130, 130] + 1.5
+    with pytest.raises(ValueError, match="Unsupported"):
+        collars.drape(GridSurfaceIO.from_raster(path), method='cubic')
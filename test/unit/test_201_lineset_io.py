@@ -0,0 +1,89 @@
+import numpy as np
+import omf
+import pandas as pd
+import pytest
+
+from omf_io.lineset import LineSetIO
+
+
+@pytest.fixture
+def toe_lines():
+    """Two polylines, with the vertices of the lines interleaved."""
+    return pd.DataFrame({'line_id': ['A', 'B', 'A', 'B', 'A'],
+                         'x': [0.0, 10.0, 1.0, 11.0, 2.0], 'y': [0.0, 5.0, 0.0, 5.0, 1.0], 'z': [100.0] * 5,
+                         'bench': [1, 2, 1, 2, 1]})
+
+
+def test_from_csv_and_parquet(toe_lines, tmp_path):
+    toe_lines.to_csv(tmp_path / 'lines.csv', index=False)
+    toe_lines.to_parquet(tmp_path / 'lines.parquet')
+
+    for lineset in (LineSetIO.from_csv(tmp_path / 'lines.csv'), LineSetIO.from_parquet(tmp_path / 'lines.parquet')):
+        # the vertices are grouped by line, keeping their order within each line
+        np.testing.assert_array_equal(lineset.vertices[:, 0], [0, 1, 2, 10, 11])
+        np.testing.assert_array_equal(lineset.segments, [[0, 1], [1, 2], [3, 4]])
+        assert lineset.segments.dtype == np.int32
+        assert lineset.segment_attributes['line_id'].tolist() == ['A', 'A', 'B']
+        assert lineset.vertex_attributes['bench'].tolist() == [1, 1, 1, 2, 2]
+        assert lineset.length == pytest.approx(1 + np.sqrt(2) + 1)
+
+    single = LineSetIO.from_parquet(tmp_path / 'lines.parquet', line_column=None, columns=[])
+    assert single.n_segments == 4 and single.vertex_attributes.empty
+    with pytest.raises(ValueError, match="coordinate columns"):
+        LineSetIO.from_parquet(tmp_path / 'lines.parquet', coordinate_columns=('x', 'y', 'elevation'))
+
+    toe_lines.loc[4, 'line_id'] = None
+    toe_lines.to_csv(tmp_path / 'unlabelled.csv', index=False)
+    with pytest.raises(ValueError, match="'line_id' has missing values"):
+        LineSetIO.from_csv(tmp_path / 'unlabelled.csv')
+
+
+def test_omf_round_trip(toe_lines, tmp_path):
+    lineset = LineSetIO(toe_lines[['x', 'y', 'z']].to_numpy(), [[0, 2], [2, 4], [1, 3]],
+                        vertex_attributes=toe_lines[['bench']],
+                        segment_attributes=pd.DataFrame({'length_class': ['short', 'short', 'long']}))
+    element = lineset.to_omf('toes')
+    assert isinstance(element, omf.LineSet)
+    element.validate()
+
+    lineset.to_omf('toes', tmp_path / 'toes.omf')
+    result = LineSetIO.from_omf(tmp_path / 'toes.omf', 'toes')
+    np.testing.assert_array_equal(result.vertices, lineset.vertices)
+    np.testing.assert_array_equal(result.segments, lineset.segments)
+    assert result.vertex_attributes['bench'].tolist() == [1, 2, 1, 2, 1]
+    assert result.segment_attributes['length_class'].tolist() == ['short', 'short', 'long']
+
+    # a LineSet without segments connects its vertices in order
+    project = omf.Project(name='p', elements=[omf.LineSet(name='trace', vertices=lineset.vertices)])
+    np.testing.assert_array_equal(LineSetIO.from_omf(project, 'trace').segments, [[0, 1], [1, 2], [2, 3], [3, 4]])
+
+    with pytest.raises(ValueError, match="between 0 and 4"):
+        LineSetIO(lineset.vertices, [[0, 5]])
+
+
+def test_pyvista_round_trip_without_copying(toe_lines):
+    pytest.importorskip('pyvista')
+    lineset = LineSetIO(toe_lines[['x', 'y', 'z']].to_numpy(), [[0, 2], [2, 4], [1, 3]],
+                        vertex_attributes=toe_lines[['bench']],
+                        segment_attributes=pd.DataFrame({'dip': [10.0, 20.0, 30.0]}))
+    polydata = lineset.to_pyvista()
+
+    assert polydata.n_lines == 3 and polydata.n_verts == 0
+    assert np.shares_memory(polydata.points, lineset.vertices)
+    np.testing.assert_array_equal(polydata.cell_data['dip'], [10, 20, 30])
+
+    result = LineSetIO.from_pyvista(polydata)
+    np.testing.assert_array_equal(result.segments, lineset.segments)
+    assert result.vertex_attributes['bench'].tolist() == [1, 2, 1, 2, 1]
+    assert result.segment_attributes['dip'].tolist() == [10, 20, 30]
+
+
+def test_omf_round_trip_with_colours(toe_lines, tmp_path):
+    segment_attributes = pd.DataFrame({'domain': ['hw', 'fw', 'hw'],
+                                       'domain_color': [(255, 0, 0), (0, 255, 0), (255, 0, 0)]})
+    lineset = LineSetIO(toe_lines[['x', 'y', 'z']].to_numpy(), [[0, 2], [2, 4], [1, 3]],
+                        segment_attributes=segment_attributes)
+    lineset.to_omf('toes', tmp_path / 'toes.omf')
+    imported = LineSetIO.from_omf(tmp_path / 'toes.omf', 'toes')
+    assert imported.segment_attributes['domain'].tolist() == ['hw', 'fw', 'hw']
+    imported.to_omf('toes').validate()
@@ -0,0 +1,50 @@
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import LineString, MultiLineString, Point
+
+from omf_io.lineset import LineSetIO
+
+
+def test_to_geopandas_joins_connected_segments():
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 1], [3, 0, 1], [0, 5, 0], [1, 5, 0]], dtype=float)
+    segments = [[0, 1], [1, 2], [2, 3], [4, 5]]
+    lineset = LineSetIO(vertices, segments,
+                        segment_attributes=pd.DataFrame({'line_id': ['A', 'A', 'B', 'C'], 'bench': [1, 1, 1, 2]}))
+
+    gdf = lineset.to_geopandas()
+
+    assert isinstance(gdf, gpd.GeoDataFrame)
+    assert gdf['line_id'].tolist() == ['A', 'B', 'C']
+    assert gdf['bench'].tolist() == [1, 1, 2]
+    # the third segment is connected, but has a different line_id
+    assert gdf.geometry.iloc[0].equals(LineString([(0, 0, 0), (1, 0, 0), (2, 0, 1)]))
+    assert gdf.geometry.iloc[1].equals(LineString([(2, 0, 1), (3, 0, 1)]))
+    assert gdf.geometry.iloc[2].has_z
+
+    # without attributes, runs of connected segments form a line
+    assert len(LineSetIO(vertices, segments).to_geopandas()) == 2
+
+
+def test_from_geopandas():
+    gdf = gpd.GeoDataFrame({'line_id': ['A', 'B'], 'dip': [10.0, 20.0]},
+                           geometry=[LineString([(0, 0, 5), (1, 0, 5), (2, 1, 5)]),
+                                     MultiLineString([[(5, 5), (6, 6)], [(7, 7), (8, 8), (9, 9)]])],
+                           crs='EPSG:28350')
+
+    lineset = LineSetIO.from_geopandas(gdf)
+
+    assert lineset.n_vertices == 8
+    np.testing.assert_array_equal(lineset.segments, [[0, 1], [1, 2], [3, 4], [5, 6], [6, 7]])
+    assert lineset.segment_attributes['line_id'].tolist() == ['A', 'A', 'B', 'B', 'B']
+    # the 2D geometries are given a z of 0
+    np.testing.assert_array_equal(lineset.vertices[3:, 2], 0)
+
+    round_trip = lineset.to_geopandas()
+    assert round_trip.geometry.iloc[0].equals(gdf.geometry.iloc[0])
+    assert len(round_trip) == 3
+
+    with pytest.raises(ValueError, match="only LineString or MultiLineString"):
+        LineSetIO.from_geopandas(gpd.GeoDataFrame({'a': [1]}, geometry=[Point(0, 0)]))
+    assert LineSetIO.from_geopandas(gdf.iloc[:0]).n_segments == 0
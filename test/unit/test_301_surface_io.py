@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.surface import SurfaceIO
+
+
+@pytest.fixture
+def grid_mesh():
+    """A 10 x 10 vertex grid, triangulated into 162 faces."""
+    nx, ny = 10, 10
+    xx, yy = np.meshgrid(np.arange(nx, dtype=float), np.arange(ny, dtype=float), indexing='ij')
+    vertices = np.column_stack([xx.ravel(), yy.ravel(), (xx + yy).ravel()])
+    ids = np.arange(nx * ny).reshape(nx, ny)
+    a, b, c, d = ids[:-1, :-1].ravel(), ids[1:, :-1].ravel(), ids[1:, 1:].ravel(), ids[:-1, 1:].ravel()
+    faces = np.concatenate([np.column_stack([a, b, c]), np.column_stack([a, c, d])])
+    return vertices, faces
+
+
+def test_from_arrays(grid_mesh):
+    vertices, faces = grid_mesh
+    surface = SurfaceIO(vertices, faces.astype(np.int32))
+    assert surface.vertices.dtype == np.float64
+    assert surface.faces.dtype == np.int32
+    assert surface.n_vertices == 100
+    assert surface.n_faces == 162
+    # the arrays are held, not copied
+    assert np.shares_memory(surface.vertices, vertices)
+    assert surface.nbytes / surface.n_faces <= 36
+
+
+def test_from_dict_of_lists(grid_mesh):
+    vertices, faces = grid_mesh
+    surface = SurfaceIO({'vertices': [tuple(v) for v in vertices.tolist()],
+                         'faces': [tuple(f) for f in faces.tolist()]})
+    assert surface.faces.dtype == np.int32
+    np.testing.assert_array_equal(surface.vertices, vertices)
+    np.testing.assert_array_equal(surface.surface_data['faces'], faces)
+
+
+def test_attributes(grid_mesh):
+    vertices, faces = grid_mesh
+    surface = SurfaceIO(vertices, faces, vertex_attributes=pd.DataFrame({'elevation': vertices[:, 2]}),
+                        face_attributes={'zone': np.arange(len(faces)) % 3})
+    assert list(surface.vertex_attributes.columns) == ['elevation']
+    assert list(surface.face_attributes.columns) == ['zone']
+
+    with pytest.raises(ValueError, match="The face attributes have 3 rows, expected 162."):
+        SurfaceIO(vertices, faces, face_attributes=pd.DataFrame({'zone': [1, 2, 3]}))
+
+
+def test_invalid_shapes(grid_mesh):
+    vertices, faces = grid_mesh
+    with pytest.raises(ValueError, match="Invalid vertices shape"):
+        SurfaceIO(vertices[:, :2], faces)
+    with pytest.raises(ValueError, match="Invalid faces shape"):
+        SurfaceIO(vertices, faces[:, :2])
+
+
+@pytest.mark.parametrize("writer, reader", [('to_ply_ascii', 'from_ply_ascii'), ('to_ply_binary', 'from_ply_binary')])
+def test_ply_round_trip(grid_mesh, tmp_path, writer, reader):
+    vertices, faces = grid_mesh
+    surface = SurfaceIO(vertices, faces)
+    getattr(surface, writer)(tmp_path / 'surface.ply')
+    imported = getattr(SurfaceIO, reader)(tmp_path / 'surface.ply')
+    np.testing.assert_allclose(imported.vertices, vertices)
+    np.testing.assert_array_equal(imported.faces, faces)
+
+
+@pytest.mark.parametrize("coordinate_dtype, byte_order", [('float32', 'little'), ('float64', 'big')])
+def test_ply_binary_attributes(grid_mesh, tmp_path, coordinate_dtype, byte_order):
+    vertices, faces = grid_mesh
+    vertices = vertices + 0.1
+    surface = SurfaceIO(vertices, faces,
+                        vertex_attributes=pd.DataFrame({'grade': np.linspace(0, 1, len(vertices)),
+                                                        'domain': np.arange(len(vertices)) % 4}),
+                        face_attributes=pd.DataFrame({'flag': np.arange(len(faces)) % 2 == 0}))
+    surface.to_ply_binary(tmp_path / 'surface.ply', coordinate_dtype=coordinate_dtype, byte_order=byte_order)
+    with open(tmp_path / 'surface.ply', 'rb') as f:
+        assert f"format binary_{byte_order}_endian".encode() in f.read(100)
+
+    imported = SurfaceIO.from_ply_binary(tmp_path / 'surface.ply')
+    np.testing.assert_array_equal(imported.faces, faces)
+    if coordinate_dtype == 'float64':
+        np.testing.assert_array_equal(imported.vertices, vertices)
+    else:
+        np.testing.assert_allclose(imported.vertices, vertices, rtol=1e-6)
+    assert list(imported.vertex_attributes.columns) == ['grade', 'domain']
+    assert imported.vertex_attributes['domain'].dtype == np.int32
+    np.testing.assert_array_equal(imported.face_attributes['flag'], surface.face_attributes['flag'])
+
+
+def test_ply_binary_polygons(tmp_path):
+    header = b"ply\nformat binary_little_endian 1.0\nelement vertex 5\n" \
+             b"property float x\nproperty float y\nproperty float z\n" \
+             b"element face 2\nproperty list uchar int vertex_indices\nend_header\n"
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]], dtype='<f4')
+    quad = np.array([4], dtype='u1').tobytes() + np.array([0, 1, 2, 3], dtype='<i4').tobytes()
+    triangle = np.array([3], dtype='u1').tobytes() + np.array([1, 4, 2], dtype='<i4').tobytes()
+    (tmp_path / 'polygons.ply').write_bytes(header + vertices.tobytes() + quad + triangle)
+
+    imported = SurfaceIO.from_ply_binary(tmp_path / 'polygons.ply')
+    np.testing.assert_array_equal(imported.faces, [[0, 1, 2], [0, 2, 3], [1, 4, 2]])
+
+
+def test_ply_binary_interleaved_triangles_and_quads(tmp_path):
+    # triangles and quads alternate face by face, with a face property after the vertex list
+    header = b"ply\nformat binary_little_endian 1.0\nelement vertex 2002\n" \
+             b"property float x\nproperty float y\nproperty float z\n" \
+             b"element face 1000\nproperty list uchar int vertex_indices\nproperty int label\nend_header\n"
+    # a strip of two rows of vertices, with a face between each pair of columns
+    vertices = np.array([[i // 2, i % 2, 0] for i in range(2002)], dtype='<f4')
+    polygons = [[2 * i, 2 * i + 2, 2 * i + 3, 2 * i + 1] if i % 2 else [2 * i, 2 * i + 2, 2 * i + 1]
+                for i in range(1000)]
+    body = b''.join(np.array([len(polygon)], dtype='u1').tobytes() + np.array(polygon, dtype='<i4').tobytes() +
+                    np.array([i], dtype='<i4').tobytes() for i, polygon in enumerate(polygons))
+    (tmp_path / 'mixed.ply').write_bytes(header + vertices.tobytes() + body)
+
+    imported = SurfaceIO.from_ply_binary(tmp_path / 'mixed.ply')
+    expected = [[polygon[0], polygon[i], polygon[i + 1]] for polygon in polygons for i in range(1, len(polygon) - 1)]
+    np.testing.assert_array_equal(imported.faces, expected)
+    labels = [i for i, polygon in enumerate(polygons) for _ in range(len(polygon) - 2)]
+    assert imported.face_attributes['label'].tolist() == labels
+
+
+def test_ply_binary_polygon_runs_with_attributes(tmp_path):
+    # runs of quads, triangles and a pentagon, with face properties before and after the vertex list
+    header = b"ply\nformat binary_little_endian 1.0\nelement vertex 6\n" \
+             b"property float x\nproperty float y\nproperty float z\n" \
+             b"element face 5\nproperty short region\nproperty list uchar int vertex_indices\n" \
+             b"property float grade\nend_header\n"
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]], dtype='<f4')
+    polygons = [[0, 1, 2, 3], [1, 4, 5, 2], [1, 4, 2], [0, 1, 4, 5, 3], [3, 2, 1, 0]]
+    body = b''.join(np.array([region], dtype='<i2').tobytes() + np.array([len(polygon)], dtype='u1').tobytes() +
+                    np.array(polygon, dtype='<i4').tobytes() + np.array([region / 2], dtype='<f4').tobytes()
+                    for region, polygon in enumerate(polygons))
+    (tmp_path / 'runs.ply').write_bytes(header + vertices.tobytes() + body)
+
+    imported = SurfaceIO.from_ply_binary(tmp_path / 'runs.ply')
+    expected = [[polygon[0], polygon[i], polygon[i + 1]] for polygon in polygons for i in range(1, len(polygon) - 1)]
+    np.testing.assert_array_equal(imported.faces, expected)
+    regions = [region for region, polygon in enumerate(polygons) for _ in range(len(polygon) - 2)]
+    assert imported.face_attributes['region'].tolist() == regions
+    np.testing.assert_array_equal(imported.face_attributes['grade'], np.array(regions) / 2)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from omf_io.surface import SurfaceIO
+from omf_io.surface.validation import validate_surface_data
+
+
+@pytest.fixture
+def tetrahedron():
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float64)
+    faces = np.array([[0, 2, 1], [0, 1, 3], [1, 2, 3], [0, 3, 2]], dtype=np.int32)
+    return vertices, faces
+
+
+def test_valid_closed_surface(tetrahedron):
+    surface = SurfaceIO(*tetrahedron)
+    report = surface.validation_report
+    assert report.is_valid
+    assert report.is_manifold
+    assert report.summary()['n_faces'] == 4
+
+
+def test_invalid_faces_raise(tetrahedron):
+    vertices, faces = tetrahedron
+    faces = np.vstack([faces, [[2, 1, 0], [0, 0, 1], [0, 1, 9]]])
+    with pytest.raises(ValueError, match="1 faces with invalid vertex indices, 1 duplicate and 1 degenerate"):
+        SurfaceIO(vertices, faces)
+
+    report = validate_surface_data(vertices, faces, errors='collect')
+    np.testing.assert_array_equal(report.invalid_indices, [6])
+    np.testing.assert_array_equal(report.duplicates, [4])
+    np.testing.assert_array_equal(report.degenerate, [5])
+
+
+def test_zero_area_and_non_manifold(tetrahedron):
+    vertices, faces = tetrahedron
+    # a collinear vertex, and a fin sharing the edge (0, 1) with two faces of the tetrahedron
+    vertices = np.vstack([vertices, [[2, 0, 0], [0.5, -1, 0]]])
+    faces = np.vstack([faces, [[0, 1, 4], [0, 1, 5]]])
+    surface = SurfaceIO(vertices, faces)
+    report = surface.validate()
+
+    assert report.is_valid
+    np.testing.assert_array_equal(report.zero_area, [4])
+    np.testing.assert_array_equal(report.non_manifold_edges, [[0, 1]])
+    assert not report.is_manifold
+    assert len(surface.validate(area_tolerance=0.5).zero_area) == 5
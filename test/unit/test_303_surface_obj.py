@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from omf_io.surface import SurfaceIO
+from omf_io.surface.importers import import_surface_from_obj
+
+OBJ_TEXT = """# a unit square as a quad, and a triangle using relative indices
+o square
+v 0.0 0.0 0.0
+v 1.0 0.0 0.0
+vt 0.0 0.0
+v 1.0 1.0 0.5 1.0
+v 0.0 1.0 0.5
+vn 0.0 0.0 1.0
+usemtl rock
+f 1/1/1 2/1/1 3/1/1 4/1/1
+v 2.0 0.0 0.0
+f -4//1 -1//1 -3//1
+f 1 2 5
+"""
+
+
+def test_obj_syntax(tmp_path):
+    obj_file = tmp_path / 'square.obj'
+    obj_file.write_text(OBJ_TEXT)
+    surface = SurfaceIO.from_obj(obj_file)
+
+    np.testing.assert_array_equal(surface.vertices[:, 2], [0, 0, 0.5, 0.5, 0])
+    np.testing.assert_array_equal(surface.faces, [[0, 1, 2], [0, 2, 3], [1, 4, 2], [0, 1, 4]])
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_obj_chunked_round_trip(tmp_path, max_workers):
+    rng = np.random.default_rng(0)
+    vertices = rng.random((500, 3)) * 1000
+    faces = np.array([rng.permutation(500)[:3] for _ in range(800)])
+    obj_file = tmp_path / 'surface.obj'
+    SurfaceIO(vertices, faces).to_obj(obj_file)
+
+    assert obj_file.read_text().splitlines()[500] == f"f {faces[0, 0] + 1} {faces[0, 1] + 1} {faces[0, 2] + 1}"
+    imported = import_surface_from_obj(obj_file, chunk_size=4096, max_workers=max_workers)
+    np.testing.assert_array_equal(imported['vertices'], vertices)
+    np.testing.assert_array_equal(imported['faces'], faces)
+
+
+def test_obj_invalid_records(tmp_path):
+    obj_file = tmp_path / 'invalid.obj'
+    obj_file.write_text("v 0 0 0\nv 1 0 0\nf 1 2\n")
+    with pytest.raises(ValueError, match="at least three vertices"):
+        import_surface_from_obj(obj_file)
+    obj_file.write_text("v 0 0 0\nv 1 0 zero\n")
+    with pytest.raises(ValueError, match="not numbers"):
+        import_surface_from_obj(obj_file)
@@ -0,0 +1,78 @@
+import numpy as np
+import omf
+import pandas as pd
+import pytest
+
+from omf_io.surface import SurfaceIO
+
+
+@pytest.fixture
+def surface():
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 1], [0, 1, 1]], dtype=np.float64)
+    faces = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32)
+    return SurfaceIO(vertices, faces,
+                     vertex_attributes=pd.DataFrame({'elevation': vertices[:, 2]}),
+                     face_attributes=pd.DataFrame({'domain': ['north', 'south'], 'area': [0.7, 0.7]}))
+
+
+def test_to_omf(surface):
+    element = surface.to_omf('topography')
+    assert isinstance(element, omf.Surface)
+    element.validate()
+    assert [(attr.name, attr.location) for attr in element.attributes] == [
+        ('elevation', 'vertices'), ('domain', 'faces'), ('area', 'faces')]
+    np.testing.assert_array_equal(element.triangles.array, surface.faces)
+
+
+def test_omf_round_trip(surface, tmp_path):
+    omf_file = tmp_path / 'project.omf'
+    other = omf.PointSet(name='collars', vertices=np.zeros((2, 3)))
+    omf.save(omf.Project(name='project', elements=[other]), str(omf_file), mode='w')
+    surface.to_omf('topography', output_file=omf_file)
+
+    imported = SurfaceIO.from_omf(omf_file, 'topography')
+    np.testing.assert_array_equal(imported.vertices, surface.vertices)
+    np.testing.assert_array_equal(imported.faces, surface.faces)
+    np.testing.assert_array_equal(imported.vertex_attributes['elevation'], surface.vertex_attributes['elevation'])
+    assert list(imported.face_attributes['domain']) == ['north', 'south']
+
+    project = omf.load(str(omf_file))
+    from_project = SurfaceIO.from_omf(project, 'topography')
+    # the arrays are taken from the element without copying
+    assert np.shares_memory(from_project.vertices, project.elements[1].vertices.array)
+
+    with pytest.raises(ValueError, match="Surface with name 'collars' not found"):
+        SurfaceIO.from_omf(omf_file, 'collars')
+
+
+def test_omf_round_trip_with_colours(surface, tmp_path):
+    surface.vertex_attributes['rock'] = ['ox', 'fr', 'fr', 'ox']
+    surface.vertex_attributes['rock_color'] = [(255, 0, 0), (0, 0, 255), (0, 0, 255), (255, 0, 0)]
+    element = surface.to_omf('topography')
+    element.validate()
+    rock = element.attributes[1]
+    np.testing.assert_array_equal(rock.array.array, [0, 1, 1, 0])
+    assert rock.categories.colors == [(255, 0, 0), (0, 0, 255)]
+
+    surface.to_omf('topography', output_file=tmp_path / 'project.omf')
+    imported = SurfaceIO.from_omf(tmp_path / 'project.omf', 'topography')
+    assert imported.vertex_attributes['rock'].tolist() == ['ox', 'fr', 'fr', 'ox']
+    assert imported.vertex_attributes['rock_color'].tolist()[1] == (0, 0, 255)
+    imported.to_omf('topography').validate()
+
+
+def test_omf_categories_to_ply(surface, tmp_path):
+    surface.face_attributes['lithology'] = pd.Categorical(['basalt', 'shale'])
+    surface.to_omf('topography', output_file=tmp_path / 'project.omf')
+    imported = SurfaceIO.from_omf(tmp_path / 'project.omf', 'topography')
+    assert isinstance(imported.face_attributes['lithology'].dtype, pd.CategoricalDtype)
+
+    # the categories are written as their codes, and a column with no PLY type is skipped
+    imported.face_attributes['note'] = ['first', 'second']
+    with pytest.warns(UserWarning, match="'note' of type object has no PLY type"):
+        imported.to_ply_binary(tmp_path / 'surface.ply')
+    written = SurfaceIO.from_ply_binary(tmp_path / 'surface.ply')
+    for name in ('lithology', 'domain'):
+        assert written.face_attributes[name].tolist() == imported.face_attributes[name].cat.codes.tolist()
+    assert 'note' not in written.face_attributes
+    np.testing.assert_array_equal(written.face_attributes['area'], imported.face_attributes['area'])
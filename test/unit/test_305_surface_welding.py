@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.surface import SurfaceIO
+
+
+@pytest.fixture
+def triangle_soup():
+    """A 10 x 10 vertex grid of 162 faces, with each face carrying its own (slightly perturbed) vertices."""
+    nx, ny = 10, 10
+    xx, yy = np.meshgrid(np.arange(nx, dtype=float), np.arange(ny, dtype=float), indexing='ij')
+    vertices = np.column_stack([xx.ravel(), yy.ravel(), (xx + yy).ravel()]) + 0.25
+    ids = np.arange(nx * ny).reshape(nx, ny)
+    a, b, c, d = ids[:-1, :-1].ravel(), ids[1:, :-1].ravel(), ids[1:, 1:].ravel(), ids[:-1, 1:].ravel()
+    faces = np.concatenate([np.column_stack([a, b, c]), np.column_stack([a, c, d])])
+    jitter = np.random.default_rng(3).uniform(-1e-4, 1e-4, (faces.size, 3))
+    soup_vertices = vertices[faces.ravel()] + jitter
+    soup_faces = np.arange(faces.size).reshape(-1, 3)
+    return vertices, faces, soup_vertices, soup_faces
+
+
+def test_weld_triangle_soup(triangle_soup):
+    vertices, faces, soup_vertices, soup_faces = triangle_soup
+    soup = SurfaceIO(soup_vertices, soup_faces, face_attributes=pd.DataFrame({'face_id': np.arange(162)}))
+    welded = soup.weld(tolerance=0.01)
+
+    assert welded.n_vertices == 100
+    assert welded.n_faces == 162
+    assert welded.faces.dtype == np.int32
+    np.testing.assert_allclose(welded.vertices[welded.faces], vertices[faces], atol=1e-4)
+    np.testing.assert_array_equal(welded.face_attributes['face_id'], np.arange(162))
+
+
+def test_weld_exact_drops_duplicate_degenerate_and_unused():
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 0, 0], [5, 5, 5], [0, 1, 0]], dtype=float)
+    # face 1 duplicates face 0 once welded, and face 2 collapses to an edge
+    faces = np.array([[0, 1, 2], [0, 3, 5], [1, 3, 2]])
+    surface = SurfaceIO(vertices, faces, vertex_attributes=pd.DataFrame({'id': np.arange(6)}))
+    welded = surface.weld()
+
+    np.testing.assert_array_equal(welded.vertices, vertices[:3])
+    np.testing.assert_array_equal(welded.faces, [[0, 1, 2]])
+    np.testing.assert_array_equal(welded.vertex_attributes['id'], [0, 1, 2])
+
+    with pytest.raises(ValueError, match="tolerance cannot be negative"):
+        surface.weld(tolerance=-1)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.surface import SurfaceIO
+from omf_io.utils.file import load_omf_element
+
+
+@pytest.fixture
+def wavy_surface():
+    """A 101 x 101 vertex grid of 20,000 faces over a gently undulating topography."""
+    n = 101
+    xx, yy = np.meshgrid(np.linspace(0, 100, n), np.linspace(0, 100, n), indexing='ij')
+    zz = 5 * np.sin(xx / 20) * np.cos(yy / 25)
+    vertices = np.column_stack([xx.ravel(), yy.ravel(), zz.ravel()])
+    ids = np.arange(n * n).reshape(n, n)
+    a, b, c, d = ids[:-1, :-1].ravel(), ids[1:, :-1].ravel(), ids[1:, 1:].ravel(), ids[:-1, 1:].ravel()
+    faces = np.concatenate([np.column_stack([a, b, c]), np.column_stack([a, c, d])])
+    return SurfaceIO(vertices, faces, vertex_attributes=pd.DataFrame({'z': zz.ravel()}),
+                     face_attributes=pd.DataFrame({'face_id': np.arange(len(faces))}))
+
+
+def test_decimate_to_target_faces(wavy_surface):
+    decimated = wavy_surface.decimate(target_faces=2000)
+
+    assert 1600 <= decimated.n_faces <= 2400
+    assert decimated.validation_report.is_valid
+    assert decimated.vertex_attributes['z'].shape == (decimated.n_vertices,)
+    # the face attributes are carried over from the kept faces
+    assert decimated.face_attributes['face_id'].is_unique
+    # the simplified surface stays close to the original topography
+    z = 5 * np.sin(decimated.vertices[:, 0] / 20) * np.cos(decimated.vertices[:, 1] / 25)
+    assert np.abs(decimated.vertices[:, 2] - z).max() < 1.0
+
+
+@pytest.mark.parametrize('method', ['quadric', 'mean'])
+def test_decimate_within_tolerance(wavy_surface, method):
+    decimated = wavy_surface.decimate(tolerance=5.0, method=method)
+
+    assert decimated.n_faces < wavy_surface.n_faces / 4
+    # every simplified vertex lies within the tolerance of an original vertex
+    distances = np.linalg.norm(decimated.vertices[:, np.newaxis] - wavy_surface.vertices[np.newaxis], axis=2)
+    assert distances.min(axis=1).max() <= 5.0
+
+
+def test_decimate_requires_one_criterion(wavy_surface):
+    with pytest.raises(ValueError, match="Provide one of target_faces or tolerance"):
+        wavy_surface.decimate()
+    with pytest.raises(ValueError, match="Provide one of target_faces or tolerance"):
+        wavy_surface.decimate(target_faces=100, tolerance=1.0)
+
+
+def test_lod_pyramid(wavy_surface, tmp_path):
+    levels = wavy_surface.lod_pyramid(n_levels=3, factor=4.0)
+
+    assert len(levels) == 4
+    assert levels[0] is wavy_surface
+    assert all(coarse.n_faces < fine.n_faces for fine, coarse in zip(levels, levels[1:]))
+
+    names = wavy_surface.to_lod_pyramid(tmp_path / 'lod.omf', element_name='topo', n_levels=2)
+    assert names == ['topo_lod0', 'topo_lod1', 'topo_lod2']
+    level_1 = load_omf_element(tmp_path / 'lod.omf', 'topo_lod1')
+    assert len(level_1.triangles.array) == levels[1].n_faces
+
+    paths = wavy_surface.to_lod_pyramid(tmp_path / 'lod', file_format='ply', n_levels=1)
+    assert [path.name for path in paths] == ['surface_lod0.ply', 'surface_lod1.ply']
+    assert SurfaceIO.from_ply_binary(paths[1]).n_faces == levels[1].n_faces
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from omf_io.surface import SurfaceIO
+
+
+@pytest.fixture
+def unit_cube():
+    """A closed unit cube offset to large coordinates, with outward faces."""
+    vertices = np.array([[(corner >> i) & 1 for i in range(3)] for corner in range(8)], dtype=float)
+    faces = np.array([[0, 2, 1], [1, 2, 3], [4, 5, 6], [5, 7, 6], [0, 1, 4], [1, 5, 4],
+                      [2, 6, 3], [3, 6, 7], [0, 4, 2], [2, 4, 6], [1, 3, 5], [3, 7, 5]])
+    return SurfaceIO(vertices + [500_000.0, 7_000_000.0, 300.0], faces)
+
+
+def _plane(z_of_x, n=11, extent=100.0):
+    """A square n x n vertex grid over (0, extent) with elevations from a function of x."""
+    xx, yy = np.meshgrid(np.linspace(0, extent, n), np.linspace(0, extent, n), indexing='ij')
+    vertices = np.column_stack([xx.ravel(), yy.ravel(), z_of_x(xx.ravel())])
+    ids = np.arange(n * n).reshape(n, n)
+    a, b, c, d = ids[:-1, :-1].ravel(), ids[1:, :-1].ravel(), ids[1:, 1:].ravel(), ids[:-1, 1:].ravel()
+    return SurfaceIO(vertices, np.concatenate([np.column_stack([a, b, c]), np.column_stack([a, c, d])]))
+
+
+def test_area_and_volume(unit_cube):
+    np.testing.assert_allclose(unit_cube.face_areas(), 0.5)
+    assert unit_cube.area == pytest.approx(6.0)
+    assert unit_cube.volume == pytest.approx(1.0, abs=1e-9)
+
+    flipped = SurfaceIO(unit_cube.vertices, unit_cube.faces[:, ::-1])
+    assert flipped.volume == pytest.approx(-1.0, abs=1e-9)
+
+
+def test_cut_fill_between_planes():
+    pre_blast = _plane(lambda x: np.full_like(x, 10.0))
+    # the design lies below the base for x < 50 and above it beyond
+    post_blast = _plane(lambda x: 10 + (x - 50) / 10)
+    report = pre_blast.cut_fill(post_blast, cell_size=1.0)
+
+    assert report.difference.shape == (100, 100)
+    assert report.n_cells == 10_000
+    assert report.cut == pytest.approx(12_500)
+    assert report.fill == pytest.approx(12_500)
+    assert report.net == pytest.approx(0, abs=1e-6)
+    assert report.summary()['n_cells'] == 10_000
+
+
+def test_cut_fill_bounds_and_coverage():
+    pre_blast = _plane(lambda x: np.full_like(x, 10.0))
+    post_blast = _plane(lambda x: np.full_like(x, 8.0))
+    # the region extends beyond the surfaces, which do not cover the outer cells
+    report = pre_blast.cut_fill(post_blast, cell_size=10.0, bounds=(50, 150, 0, 100))
+
+    assert report.difference.shape == (10, 10)
+    assert report.n_cells == 50
+    assert report.cut == pytest.approx(2 * 50 * 100)
+    assert report.fill == 0
+
+    # a region of 9.5 cells: the last column of cells is clipped to it
+    report = pre_blast.cut_fill(post_blast, cell_size=10.0, bounds=(0, 95, 0, 100))
+    assert report.difference.shape == (10, 10)
+    assert report.cut == pytest.approx(2 * 95 * 100)
+
+    with pytest.raises(ValueError, match="cell size must be positive"):
+        pre_blast.cut_fill(post_blast, cell_size=0)
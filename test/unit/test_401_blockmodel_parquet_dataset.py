@@ -0,0 +1,68 @@
+import json
+
+import pandas as pd
+import pytest
+
+from omf_io.blockmodel.block_model import BlockModelIO
+from omf_io.blockmodel.exporters import DATASET_METADATA_FILE
+from omf_io.utils.pandas_utils import create_test_blockmodel
+
+
+@pytest.fixture
+def regular_block_data():
+    return create_test_blockmodel(shape=(20, 20, 10), block_size=(10, 10, 5), corner=(0, 0, 0))
+
+
+@pytest.mark.parametrize("partition_by, kwargs, expected_partitions", [
+    ('bench', {}, 10),
+    ('bench', {'bench_height': 10}, 5),
+    ('tile', {'tile_size': 100}, 4),
+    ('bench_tile', {'tile_size': 100, 'bench_height': 25}, 8),
+    ('morton', {'n_partitions': 6}, 6),
+])
+def test_parquet_dataset_round_trip(regular_block_data, tmp_path, partition_by, kwargs, expected_partitions):
+    bm = BlockModelIO(regular_block_data, 'regular')
+    output_dir = bm.to_parquet_dataset(tmp_path / 'dataset', partition_by=partition_by, **kwargs)
+
+    assert len(list(output_dir.glob('part-*.parquet'))) == expected_partitions
+    with open(output_dir / DATASET_METADATA_FILE) as f:
+        metadata = json.load(f)
+    assert metadata['index'] == ['x', 'y', 'z']
+    assert sum(p['rows'] for p in metadata['partitions']) == len(regular_block_data)
+
+    imported = BlockModelIO.from_parquet_dataset(output_dir, 'regular')
+    pd.testing.assert_frame_equal(imported.block_data.sort_index(), regular_block_data.sort_index())
+
+
+def test_parquet_dataset_bounds_query(regular_block_data, tmp_path):
+    bm = BlockModelIO(regular_block_data, 'regular')
+    output_dir = bm.to_parquet_dataset(tmp_path / 'dataset', partition_by='tile', tile_size=50)
+
+    bounds = (20, 80, 100, 140, 10, 30)
+    imported = BlockModelIO.from_parquet_dataset(output_dir, 'regular', bounds=bounds, columns=['depth'])
+
+    x, y, z = (regular_block_data.index.get_level_values(level) for level in ['x', 'y', 'z'])
+    expected = regular_block_data.loc[(x >= 20) & (x <= 80) & (y >= 100) & (y <= 140) & (z >= 10) & (z <= 30),
+                                      ['depth']]
+    pd.testing.assert_frame_equal(imported.block_data.sort_index(), expected.sort_index())
+
+
+def test_parquet_dataset_tensor_index(tmp_path):
+    block_data = create_test_blockmodel(shape=(5, 5, 5), block_size=(10, 10, 5), corner=(0, 0, 0), is_tensor=True)
+    output_dir = BlockModelIO(block_data, 'tensor').to_parquet_dataset(tmp_path / 'dataset', partition_by='morton',
+                                                                       n_partitions=3)
+    imported = BlockModelIO.from_parquet_dataset(output_dir, 'tensor')
+    assert imported.block_data.index.names == ['x', 'y', 'z', 'dx', 'dy', 'dz']
+    pd.testing.assert_frame_equal(imported.block_data.sort_index(), block_data.sort_index())
+
+
+def test_parquet_dataset_tile_requires_tile_size(regular_block_data, tmp_path):
+    with pytest.raises(ValueError, match="tile_size is required"):
+        BlockModelIO(regular_block_data, 'regular').to_parquet_dataset(tmp_path / 'dataset', partition_by='tile')
+
+
+def test_to_parquet_keeps_index(regular_block_data, tmp_path):
+    bm = BlockModelIO(regular_block_data, 'regular')
+    bm.to_parquet(tmp_path / 'model.parquet')
+    imported = BlockModelIO.from_parquet(tmp_path / 'model.parquet', 'regular')
+    pd.testing.assert_frame_equal(imported.block_data, regular_block_data)
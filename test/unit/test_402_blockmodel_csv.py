@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.blockmodel.block_model import BlockModelIO
+from omf_io.blockmodel.importers import import_block_model_from_csv
+from omf_io.utils.pandas_utils import create_test_blockmodel, float32_rounding_decimals
+
+
+@pytest.fixture
+def block_model_csv(tmp_path):
+    n = 1000
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame({
+        'x': np.repeat(np.arange(10) * 10 + 5., 100),
+        'y': np.tile(np.repeat(np.arange(10) * 10 + 5., 10), 10),
+        'z': np.tile(np.arange(10) * 5 + 2.5, 100),
+        'cu': np.round(rng.random(n) * 3, 3),
+        'density': 2.5 + rng.integers(0, 8, n) / 8,
+        'rock': rng.choice(['oxide', 'transition', 'fresh'], n),
+        'block_id': np.arange(n),
+    })
+    csv_file = tmp_path / 'block_model.csv'
+    data.to_csv(csv_file, index=False)
+    return csv_file, data.set_index(['x', 'y', 'z'])
+
+
+def test_import_compacts_dtypes(block_model_csv):
+    csv_file, expected = block_model_csv
+    block_data = import_block_model_from_csv(csv_file, chunksize=300, sample_size=200)
+
+    assert block_data.index.names == ['x', 'y', 'z']
+    # eighths are exact in float32, while decimals such as 0.1 are not
+    assert block_data['density'].dtype == np.float32
+    assert block_data['cu'].dtype == np.float64
+    assert block_data['block_id'].dtype == np.int32
+    assert isinstance(block_data['rock'].dtype, pd.CategoricalDtype)
+
+    for col in ('cu', 'density'):
+        np.testing.assert_array_equal(block_data[col].to_numpy(dtype=np.float64), expected[col].to_numpy())
+    np.testing.assert_array_equal(block_data['rock'].astype(str).to_numpy(), expected['rock'].to_numpy())
+    pd.testing.assert_index_equal(block_data.index, expected.index)
+
+
+def test_import_promotes_when_later_chunk_does_not_fit(tmp_path):
+    data = pd.DataFrame({'x': [1., 2., 3., 4.], 'y': [1., 1., 1., 1.], 'z': [1., 1., 1., 1.],
+                         'grade': [0.5, 0.25, 1 / 3, 0.75],
+                         'count': [1, 2, 3, 2 ** 40],
+                         'flag': ['a', 'a', 'a', 'a']})
+    csv_file = tmp_path / 'promote.csv'
+    data.to_csv(csv_file, index=False)
+
+    block_data = import_block_model_from_csv(csv_file, chunksize=2, sample_size=2)
+
+    assert block_data['grade'].dtype == np.float64
+    assert block_data['count'].dtype == np.int64
+    np.testing.assert_array_equal(block_data['grade'].to_numpy(), pd.read_csv(csv_file)['grade'].to_numpy())
+    np.testing.assert_array_equal(block_data['count'].to_numpy(), data['count'].to_numpy())
+
+
+def test_import_promotes_integers_combined_with_floats_to_float64(tmp_path):
+    data = pd.DataFrame({'x': [1., 2., 3., 4.], 'y': [1., 1., 1., 1.], 'z': [1., 1., 1., 1.],
+                         'tonnes': ['16777217', '33554433', '0.5', '1.25']})
+    csv_file = tmp_path / 'mixed.csv'
+    data.to_csv(csv_file, index=False)
+
+    block_data = import_block_model_from_csv(csv_file, chunksize=2, sample_size=2)
+
+    # integers above 2**24 are not exact in float32
+    assert block_data['tonnes'].dtype == np.float64
+    np.testing.assert_array_equal(block_data['tonnes'].to_numpy(), [16777217, 33554433, 0.5, 1.25])
+
+
+def test_csv_round_trip_keeps_the_values(block_model_csv, tmp_path):
+    csv_file, expected = block_model_csv
+    block_data = import_block_model_from_csv(csv_file, chunksize=300, sample_size=200)
+    BlockModelIO(block_data, 'regular').to_csv(tmp_path / 'exported.csv')
+
+    exported = pd.read_csv(tmp_path / 'exported.csv').set_index(['x', 'y', 'z'])
+    pd.testing.assert_frame_equal(exported, expected)
+
+
+def test_import_missing_index_columns(tmp_path):
+    csv_file = tmp_path / 'no_index.csv'
+    pd.DataFrame({'a': [1], 'b': [2]}).to_csv(csv_file, index=False)
+    with pytest.raises(ValueError, match="CSV file must contain the index columns"):
+        import_block_model_from_csv(csv_file)
+
+
+def test_csv_round_trip_tensor(tmp_path):
+    block_data = create_test_blockmodel(shape=(4, 4, 4), block_size=(10., 10., 5.), corner=(0, 0, 0), is_tensor=True)
+    csv_file = tmp_path / 'tensor.csv'
+    BlockModelIO(block_data, 'tensor').to_csv(csv_file)
+
+    imported = BlockModelIO.from_csv(csv_file, 'tensor')
+    assert imported.block_data.index.names == ['x', 'y', 'z', 'dx', 'dy', 'dz']
+    pd.testing.assert_frame_equal(imported.block_data, block_data, check_dtype=False)
+
+
+def test_float32_rounding_decimals():
+    assert float32_rounding_decimals(np.array([0.1, 0.25, np.nan])) == 2
+    assert float32_rounding_decimals(np.array([1.0, 2.0])) == 0
+    assert float32_rounding_decimals(np.array([1234567.891])) is None
+    assert float32_rounding_decimals(np.array([1 / 3])) is None
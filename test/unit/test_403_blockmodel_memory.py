@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from omf_io.blockmodel.block_model import BlockModelIO
+from omf_io.utils.pandas_utils import create_test_blockmodel
+
+
+def test_optimize_memory():
+    block_data = create_test_blockmodel(shape=(10, 10, 10), block_size=(10, 10, 5), corner=(0, 0, 0))
+    block_data['rock'] = np.where(block_data['depth'] > 20, 'fresh', 'oxide')
+    bm = BlockModelIO(block_data, 'regular')
+
+    report = bm.optimize_memory()
+
+    assert report.loc['c_style_xyz', 'dtype_after'] == 'int16'
+    assert report.loc['depth', 'dtype_after'] == 'float32'
+    assert report.loc['rock', 'dtype_after'] == 'category'
+    assert report['bytes_after'].sum() < report['bytes_before'].sum()
+    pd.testing.assert_index_equal(bm.block_data.index, block_data.index)
+    np.testing.assert_array_equal(bm.block_data['depth'].to_numpy(), block_data['depth'].to_numpy())
+
+
+def test_optimize_on_construction():
+    block_data = create_test_blockmodel(shape=(4, 4, 4), block_size=(10, 10, 5), corner=(0, 0, 0))
+    bm = BlockModelIO(block_data, 'regular', optimize=True)
+    assert bm.block_data['f_style_zyx'].dtype == np.int8
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.blockmodel.block_model import BlockModelIO
+from omf_io.blockmodel.validation import validate_block_model_data
+from omf_io.utils.pandas_utils import create_test_blockmodel
+
+
+@pytest.fixture
+def regular_block_data():
+    return create_test_blockmodel(shape=(10, 8, 6), block_size=(10, 10, 5), corner=(100, 200, 300))
+
+
+def test_regular_model_is_valid(regular_block_data):
+    bm = BlockModelIO(regular_block_data, 'regular')
+    report = bm.validation_report
+    assert report.is_valid
+    assert report.shape == (10, 8, 6)
+    assert report.block_size == (10, 10, 5)
+    assert report.origin == (100, 200, 300)
+    assert report.missing_fraction == 0.0
+
+
+def test_regular_model_missing_fraction(regular_block_data):
+    # every fifth block still spans the full grid
+    report = validate_block_model_data(regular_block_data.iloc[::5], 'regular', block_size=(10, 10, 5))
+    assert report.is_valid
+    assert report.shape == (10, 8, 6)
+    assert report.missing_fraction == pytest.approx(0.8)
+
+
+def test_regular_model_duplicates_and_off_grid(regular_block_data):
+    off_grid = regular_block_data.iloc[[0]].rename(index={105.0: 107.0}, level='x')
+    block_data = pd.concat([regular_block_data, regular_block_data.iloc[[3, 4]], off_grid])
+
+    with pytest.raises(ValueError, match="2 duplicate"):
+        BlockModelIO(block_data, 'regular')
+
+    report = validate_block_model_data(block_data, 'regular', errors='collect')
+    n = len(regular_block_data)
+    np.testing.assert_array_equal(report.duplicates, [n, n + 1])
+    np.testing.assert_array_equal(report.off_grid, [n + 2])
+    assert report.summary()['is_valid'] is False
+
+
+def test_tensor_model_is_valid():
+    block_data = create_test_blockmodel(shape=(5, 5, 5), block_size=(10., 10., 5.), corner=(0, 0, 0), is_tensor=True)
+    report = BlockModelIO(block_data, 'tensor').validation_report
+    assert report.is_valid
+    assert report.shape == (5, 5, 5)
+
+
+def test_tensor_model_overlaps():
+    # two sub-blocks split a parent block in x, a third block overlaps both, and a fourth is off the base grid
+    block_data = pd.DataFrame({'x': [2.5, 7.5, 5.0, 16.0], 'y': [5.] * 4, 'z': [2.5] * 4,
+                               'dx': [5., 5., 10., 10.], 'dy': [10.] * 4, 'dz': [5.] * 4,
+                               'grade': [1., 2., 3., 4.]}).set_index(['x', 'y', 'z', 'dx', 'dy', 'dz'])
+    report = validate_block_model_data(block_data, 'tensor', errors='collect')
+    np.testing.assert_array_equal(report.overlaps, [0, 1, 2])
+    np.testing.assert_array_equal(report.off_grid, [3])
+    assert len(report.duplicates) == 0
+
+
+@pytest.mark.parametrize('model_type', ['regular', 'tensor'])
+def test_validate_sliced_frame(model_type):
+    block_data = create_test_blockmodel(shape=(5, 5, 5), block_size=(10., 10., 5.), corner=(0, 0, 0),
+                                        is_tensor=model_type == 'tensor')
+    sliced = block_data.iloc[:2]
+    report = validate_block_model_data(sliced, model_type)
+    expected = validate_block_model_data(sliced.reset_index().set_index(list(sliced.index.names)), model_type)
+    assert report.shape == expected.shape == (1, 1, 2)
+    assert report.origin == expected.origin
+    assert report.missing_fraction == expected.missing_fraction == 0
+
+
+def test_missing_index_levels():
+    with pytest.raises(ValueError, match="must have a MultiIndex"):
+        validate_block_model_data(pd.DataFrame({'x': [1.0]}), 'regular')
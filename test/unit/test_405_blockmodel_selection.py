@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+from omf_io.blockmodel.block_model import BlockModelIO
+from omf_io.surface.surface import SurfaceIO
+from omf_io.utils.geometry import points_in_polygon, surface_elevation
+from omf_io.utils.pandas_utils import create_test_blockmodel
+
+
+@pytest.fixture
+def block_model():
+    return BlockModelIO(create_test_blockmodel(shape=(20, 20, 10), block_size=(10, 10, 5), corner=(0, 0, 0)),
+                        'regular')
+
+
+def _coords(bm):
+    return [bm.block_data.index.get_level_values(level).to_numpy() for level in ('x', 'y', 'z')]
+
+
+def test_select_bounds(block_model):
+    selection = block_model.select(bounds=(40, 100, 0, 30, 10, 20))
+    x, y, z = _coords(block_model)
+    expected = block_model.block_data[(x >= 40) & (x <= 100) & (y <= 30) & (z >= 10) & (z <= 20)]
+    assert selection.block_data.index.equals(expected.index)
+
+
+def test_select_bounds_unsorted(block_model):
+    shuffled = BlockModelIO(block_model.block_data.sample(frac=1, random_state=1), 'regular')
+    selection = shuffled.select(bounds=(40, 100, 0, 30, 10, 20))
+    assert len(selection.block_data) == 6 * 3 * 2
+
+
+def test_select_nothing(block_model):
+    selection = block_model.select(bounds=(1000, 2000, 0, 30, 10, 20))
+    assert selection.block_data.empty
+    assert list(selection.block_data.columns) == list(block_model.block_data.columns)
+    assert selection.validation_report.is_valid
+    assert selection.validation_report.n_blocks == 0
+    assert selection.validation_report.missing_fraction == 1.0
+
+
+def test_select_keeps_the_grid(block_model):
+    selection = block_model.select(bounds=(0, 100, 0, 200, 0, 50))
+    assert selection.validation_report.shape == block_model.validation_report.shape
+    assert selection.validation_report.missing_fraction == pytest.approx(0.5)
+
+
+def test_select_polygon(block_model):
+    polygon = Polygon([(0, 0), (200, 0), (0, 200)], holes=[[(10, 10), (50, 10), (10, 50)]])
+    selection = block_model.select(polygon=polygon)
+    x, y, _ = _coords(selection)
+    assert np.all(x + y < 200)
+    assert not np.any((x > 10) & (y > 10) & (x + y < 60))
+    assert len(selection.block_data) == 10 * (190 - 6)
+
+
+def test_select_below_surface(block_model):
+    # a plane dipping in x, from z=40 at x=0 to z=20 at x=200
+    surface = SurfaceIO(vertices=np.array([(0, 0, 40), (200, 0, 20), (200, 200, 20), (0, 200, 40)], dtype=float),
+                        faces=np.array([(0, 1, 2), (0, 2, 3)]))
+    selection = block_model.select(below=surface, bounds=(0, 200, 0, 100, 0, 50))
+    x, y, z = _coords(selection)
+    assert np.all(z < 40 - x / 10)
+    assert np.all(y <= 100)
+    x, y, z = _coords(block_model)
+    assert len(selection.block_data) == np.count_nonzero((z < 40 - x / 10) & (y <= 100))
+
+
+def test_points_in_polygon_matches_shapely():
+    rng = np.random.default_rng(0)
+    polygon = Polygon([(0, 0), (10, 2), (8, 9), (3, 6), (1, 10)])
+    x, y = rng.uniform(-1, 11, 2000), rng.uniform(-1, 11, 2000)
+    import shapely
+    expected = shapely.contains_xy(polygon, x, y)
+    np.testing.assert_array_equal(points_in_polygon(x, y, polygon, n_bands=3), expected)
+
+
+def test_surface_elevation_outside_is_nan():
+    vertices = np.array([[0, 0, 1], [1, 0, 2], [0, 1, 3]], dtype=float)
+    elevation = surface_elevation(np.array([0.25, 2.0]), np.array([0.25, 2.0]), vertices, np.array([[0, 1, 2]]))
+    assert elevation[0] == pytest.approx(1 + 0.25 + 0.5)
+    assert np.isnan(elevation[1])
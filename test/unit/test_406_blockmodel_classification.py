@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.blockmodel.block_model import BlockModelIO
+from omf_io.pointset.point_set import PointSetIO
+from omf_io.surface.surface import SurfaceIO
+from omf_io.utils.geometry import classify_points
+from omf_io.utils.pandas_utils import create_test_blockmodel
+
+
+@pytest.fixture
+def block_model():
+    return BlockModelIO(create_test_blockmodel(shape=(20, 20, 10), block_size=(10, 10, 5), corner=(0, 0, 0)),
+                        'regular')
+
+
+@pytest.fixture
+def box_shell():
+    """A closed box shell spanning (52, 148) in x and y and (12, 38) in z, with outward faces."""
+    lo, hi = np.array([52.0, 52.0, 12.0]), np.array([148.0, 148.0, 38.0])
+    vertices = np.array([[hi[i] if (corner >> i) & 1 else lo[i] for i in range(3)] for corner in range(8)])
+    faces = np.array([[0, 2, 1], [1, 2, 3], [4, 5, 6], [5, 7, 6], [0, 1, 4], [1, 5, 4],
+                      [2, 6, 3], [3, 6, 7], [0, 4, 2], [2, 4, 6], [1, 3, 5], [3, 7, 5]])
+    return SurfaceIO(vertices, faces)
+
+
+def test_classify_blocks_against_topography(block_model):
+    # a plane dipping in x, from z=40 at x=0 to z=20 at x=200, covering half of the model in y
+    topography = SurfaceIO(vertices=np.array([(0, 0, 40), (200, 0, 20), (200, 100, 20), (0, 100, 40)],
+                                             dtype=float), faces=np.array([(0, 1, 2), (0, 2, 3)]))
+    classification = block_model.classify(topography)
+
+    assert classification.index.equals(block_model.block_data.index)
+    x, y, z = (block_model.block_data.index.get_level_values(level).to_numpy() for level in ('x', 'y', 'z'))
+    covered = y <= 100
+    np.testing.assert_allclose(classification['elevation'][covered], 40 - x[covered] / 10)
+    assert classification['elevation'][~covered].isna().all()
+    np.testing.assert_array_equal(classification['below'], covered & (z < 40 - x / 10))
+    np.testing.assert_array_equal(classification['above'], covered & (z > 40 - x / 10))
+    # the selection agrees with the classification
+    assert len(block_model.select(below=topography).block_data) == classification['below'].sum()
+
+
+def test_classify_blocks_inside_shell(block_model, box_shell):
+    classification = block_model.classify(box_shell, max_workers=2)
+
+    x, y, z = (block_model.block_data.index.get_level_values(level).to_numpy() for level in ('x', 'y', 'z'))
+    expected = (x > 52) & (x < 148) & (y > 52) & (y < 148) & (z > 12) & (z < 38)
+    np.testing.assert_array_equal(classification['inside'], expected)
+    # the elevation is that of the top of the shell
+    assert (classification['elevation'].dropna() == 38).all()
+
+
+def test_classify_points_through_shared_edges(box_shell):
+    # rays through the diagonal edges and corners of the top and bottom faces cross the shell twice
+    x = np.array([100.0, 52.0, 148.0, 100.0, 40.0])
+    y = np.array([100.0, 52.0, 148.0, 100.0, 100.0])
+    z = np.array([20.0, 20.0, 20.0, 50.0, 20.0])
+    classification = classify_points(x, y, z, box_shell.vertices, box_shell.faces)
+
+    np.testing.assert_array_equal(classification['inside'], [True, True, True, False, False])
+    np.testing.assert_array_equal(classification['above'], [False, False, False, True, False])
+    np.testing.assert_array_equal(classification['below'], [True, True, True, False, False])
+
+
+def test_classify_point_set(box_shell):
+    rng = np.random.default_rng(4)
+    coordinates = rng.uniform(0, 200, (1000, 3)) * [1, 1, 0.25]
+    data = pd.DataFrame({'grade': rng.random(1000)},
+                        index=pd.MultiIndex.from_arrays(coordinates.T, names=['x', 'y', 'z']))
+    classification = PointSetIO(data).classify(box_shell, max_workers=2)
+
+    x, y, z = coordinates.T
+    expected = (x > 52) & (x < 148) & (y > 52) & (y < 148) & (z > 12) & (z < 38)
+    assert classification.index.equals(data.index)
+    np.testing.assert_array_equal(classification['inside'], expected)
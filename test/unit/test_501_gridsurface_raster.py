@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from omf_io.gridsurface import GridSurfaceIO
+
+
+def test_from_raster_is_lazy(tiled_dem):
+    path, values = tiled_dem
+    surface = GridSurfaceIO.from_raster(path)
+
+    assert surface.is_lazy
+    assert surface.shape == (512, 512)
+    assert surface.surface_data.dims == ('y', 'x')
+    # the chunks are whole tiles of the file
+    assert all(size % 128 == 0 for sizes in surface.surface_data.chunks for size in sizes)
+    assert surface.bounds == (1000, 6120, 2000, 7120)
+    assert surface.resolution == (10, -10)
+
+    loaded = surface.load()
+    assert not loaded.is_lazy
+    assert np.isnan(loaded.surface_data.values[0, 0])
+    np.testing.assert_array_equal(loaded.surface_data.values.ravel()[1:], values.ravel()[1:])
+
+
+def test_from_raster_bounds_reads_overlapping_tiles(tiled_dem):
+    path, values = tiled_dem
+    # a window across the first and second rows of tiles, within the second column of tiles
+    surface = GridSurfaceIO.from_raster(path, chunks={'x': 128, 'y': 128}, bounds=(2300, 2500, 5800, 5900))
+
+    assert surface.is_lazy
+    assert surface.surface_data.chunks == ((6, 4), (20,))
+    assert surface.bounds == (2300, 2500, 5800, 5900)
+    np.testing.assert_array_equal(surface.load().surface_data.values, values[122:132, 130:150])
+
+
+def test_from_raster_eager_and_chunk_sizes(tiled_dem):
+    path, _ = tiled_dem
+    assert not GridSurfaceIO.from_raster(path, chunks=None).is_lazy
+    assert GridSurfaceIO.from_raster(path, chunks={'x': 256, 'y': 64}).surface_data.chunks == ((64,) * 8, (256,) * 2)
+
+    with pytest.raises(ValueError, match="do not overlap"):
+        GridSurfaceIO.from_raster(path, bounds=(0, 100, 0, 100))
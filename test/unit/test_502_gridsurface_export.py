@@ -0,0 +1,78 @@
+import numpy as np
+import omf
+import pytest
+import rasterio
+
+from omf_io.gridsurface import GridSurfaceIO
+from omf_io.gridsurface.exporters import _raster_windows
+from omf_io.writer import OMFWriter
+
+
+def test_to_raster_tiled_compressed(tiled_dem, tmp_path):
+    path, values = tiled_dem
+    surface = GridSurfaceIO.from_raster(path, chunks={'x': 200, 'y': 100})
+    output = surface.to_raster(tmp_path / 'out.tif', blocksize=64, compress='zstd', overviews='auto')
+
+    with rasterio.open(output) as src:
+        assert src.profile['tiled']
+        assert src.block_shapes == [(64, 64)]
+        assert src.compression.name == 'zstd'
+        assert src.overviews(1) == [2, 4, 8]
+        assert src.crs.to_epsg() == 32750
+        assert src.transform == rasterio.transform.from_origin(1000, 7120, 10, 10)
+        assert src.nodata == -9999
+        written = src.read(1)
+    np.testing.assert_array_equal(written, values)
+
+
+def test_raster_windows_cover_whole_tiles(tiled_dem):
+    path, _ = tiled_dem
+    surface = GridSurfaceIO.from_raster(path, chunks={'x': 200, 'y': 100})
+    data = surface.surface_data.expand_dims('band')
+    windows = [window for window, _ in _raster_windows(data, 128)]
+    assert {(window.row_off, window.col_off) for window in windows} == \
+        {(row, col) for row in range(0, 512, 128) for col in range(0, 512, 128)}
+    assert all(window.height == 128 and window.width == 128 for window in windows)
+
+
+def test_to_raster_in_memory_masked_nodata(tiled_dem, tmp_path):
+    path, values = tiled_dem
+    surface = GridSurfaceIO.from_raster(path, chunks=None, bounds=(1000, 1640, 6480, 7120))
+    assert np.isnan(surface.surface_data.values[0, 0])
+    output = surface.to_raster(tmp_path / 'out.tif', blocksize=32)
+
+    with rasterio.open(output) as src:
+        assert src.shape == (64, 64)
+        np.testing.assert_array_equal(src.read(1), values[:64, :64])
+
+
+def test_to_cog(tiled_dem, tmp_path):
+    path, values = tiled_dem
+    output = GridSurfaceIO.from_raster(path).to_raster(tmp_path / 'out.tif', format='COG', blocksize=128)
+
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith('out')] == ['out.tif']
+    with rasterio.open(output) as src:
+        assert src.tags(ns='IMAGE_STRUCTURE')['LAYOUT'] == 'COG'
+        assert src.block_shapes == [(128, 128)]
+        assert src.overviews(1) == [2, 4]
+        np.testing.assert_array_equal(src.read(1), values)
+
+
+def test_reader_exports_omf_grid_surface(tmp_path):
+    # a 4 x 3 node grid with 10 m cells, nodes ordered with u fastest
+    offsets = np.arange(12, dtype=float)
+    grid = omf.TensorGridSurface(name='topo', tensor_u=[10.0] * 3, tensor_v=[10.0] * 2, offset_w=offsets,
+                                 corner=[500.0, 600.0, 100.0])
+    omf_file = tmp_path / 'grid.omf'
+    omf.save(omf.Project(name='project', elements=[grid]), str(omf_file))
+
+    output = OMFWriter(omf_file).export_surface_to_raster_file('topo', tmp_path / 'topo.tif', crs='EPSG:32750',
+                                                               blocksize=16)
+    with rasterio.open(output) as src:
+        assert src.shape == (3, 4)
+        # the nodes are the centres of the cells
+        assert src.bounds == (495, 595, 535, 625)
+        np.testing.assert_array_equal(src.read(1), 100 + offsets.reshape(3, 4)[::-1])
+
+    with pytest.raises(ValueError, match="not found"):
+        GridSurfaceIO.from_omf(omf_file, 'missing')
@@ -0,0 +1,57 @@
+import numpy as np
+import omf
+import pytest
+from affine import Affine
+
+from omf_io.gridsurface import GridSurfaceIO
+from omf_io.utils.file import load_omf_element
+from omf_io.writer import OMFWriter
+
+
+def test_write_raster_from_file(tiled_dem, tmp_path):
+    path, values = tiled_dem
+    omf_file = tmp_path / 'project.omf'
+    # an existing element is kept when the grid is added
+    points = omf.PointSet(name='collars', vertices=np.arange(9, dtype=float).reshape(3, 3))
+    omf.save(omf.Project(name='project', elements=[points]), str(omf_file))
+
+    writer = OMFWriter(omf_file)
+    writer.write_raster_from_file(path, 'dem', chunks={'x': 128, 'y': 96})
+    assert writer.element_types == {'collars': 'PointSet', 'dem': 'TensorGridSurface'}
+
+    project = omf.load(str(omf_file))
+    project.validate()
+    grid = project.elements[1]
+    assert grid.corner.tolist() == [1005.0, 2005.0, 0.0]
+    assert grid.tensor_u == [10.0] * 511
+    assert grid.offset_w.array.dtype == np.float32
+    np.testing.assert_array_equal(project.elements[0].vertices.array, points.vertices.array)
+
+    surface = GridSurfaceIO.from_omf(omf_file, 'dem')
+    assert surface.bounds == (1000, 6120, 2000, 7120)
+    assert np.isnan(surface.surface_data.values[0, 0])
+    np.testing.assert_array_equal(surface.surface_data.values.ravel()[1:], values.ravel()[1:])
+
+
+def test_write_raster_from_array_with_attributes(tmp_path):
+    elevation = np.arange(12, dtype=float).reshape(3, 4)
+    grade = np.arange(12, dtype=np.int32).reshape(3, 4) * 10
+    omf_file = tmp_path / 'new.omf'
+    writer = OMFWriter(omf_file)
+    writer.write_raster_from_array(elevation, 'topo', transform=Affine(5, 0, 100, 0, -5, 215),
+                                   attributes={'grade': grade})
+
+    grid = load_omf_element(omf_file, 'topo', omf.TensorGridSurface)
+    grid.validate()
+    assert grid.corner.tolist() == [102.5, 202.5, 0.0]
+    # the nodes run from the bottom row upwards, with u varying fastest
+    np.testing.assert_array_equal(grid.offset_w.array, elevation[::-1].ravel())
+    assert grid.attributes[0].name == 'grade'
+    np.testing.assert_array_equal(grid.attributes[0].array.array, grade[::-1].ravel())
+
+    with pytest.raises(FileExistsError, match="already exists"):
+        writer.write_raster_from_array(elevation, 'topo', transform=Affine(5, 0, 100, 0, -5, 215))
+    writer.write_raster_from_array(elevation + 1, 'topo', transform=Affine(5, 0, 100, 0, -5, 215), overwrite=True)
+    assert load_omf_element(omf_file, 'topo').attributes == []
+    with pytest.raises(ValueError, match="transform is required"):
+        writer.write_raster_from_array(elevation, 'other')
@@ -0,0 +1,93 @@
+import numpy as np
+import omf
+import pytest
+from affine import Affine
+
+from omf_io.gridsurface import GridSurfaceIO
+from omf_io.gridsurface.importers import grid_surface_from_array
+from omf_io.gridsurface.resampling import coarsen_grid, grid_pyramid
+
+
+def test_coarsen_reduces_blocks_lazily(tiled_dem):
+    path, values = tiled_dem
+    surface = GridSurfaceIO.from_raster(path, chunks={'x': 100, 'y': 100})
+    coarse = surface.coarsen(3)
+
+    assert coarse.is_lazy
+    assert coarse.shape == (171, 171)
+    assert coarse.resolution == (30, -30)
+    # the last blocks extend past the grid
+    assert coarse.bounds == (1000, 6130, 1990, 7120)
+    mean = coarse.load().surface_data.values
+    eager = GridSurfaceIO.from_raster(path, chunks=None).coarsen(3).surface_data.values
+    np.testing.assert_array_equal(mean, eager)
+    # the nodata cell is left out of the first block
+    assert mean[0, 0] == np.mean(values[:3, :3].ravel()[1:])
+    assert mean[-1, -1] == values[510:, 510:].mean()
+
+    assert surface.coarsen(4, 'min').load().surface_data.values[0, 1] == values[0, 4]
+    assert surface.coarsen(4, 'max').load().surface_data.values[0, 1] == values[3, 7]
+    assert surface.coarsen(4, 'nearest').load().surface_data.values[0, 1] == values[2, 6]
+    with pytest.raises(ValueError, match="Unsupported reduction"):
+        surface.coarsen(2, 'median')
+
+
+def test_pyramid_levels_and_export(tiled_dem, tmp_path):
+    path, _ = tiled_dem
+    surface = GridSurfaceIO.from_raster(path)
+    assert [level.shape for level in surface.pyramid(min_size=128)] == [(512, 512), (256, 256), (128, 128)]
+    assert [level.shape for level in surface.pyramid(n_levels=3, factor=4)] == [(512, 512), (128, 128), (32, 32),
+                                                                               (8, 8)]
+
+    names = surface.to_pyramid(tmp_path / 'pyramid.omf', element_name='dem', n_levels=2)
+    assert names == ['dem_lod0', 'dem_lod1', 'dem_lod2']
+    project = omf.load(str(tmp_path / 'pyramid.omf'))
+    assert [len(e.offset_w.array) for e in project.elements] == [512 ** 2, 256 ** 2, 128 ** 2]
+
+    paths = surface.to_pyramid(tmp_path / 'tiles', file_format='tif', n_levels=1, blocksize=128)
+    assert [p.name for p in paths] == ['grid_surface_lod0.tif', 'grid_surface_lod1.tif']
+    assert GridSurfaceIO.from_raster(paths[1]).resolution == (20, -20)
+
+
+@pytest.mark.parametrize('chunks', [None, (16, 16)])
+def test_pyramid_chains_levels_exactly(chunks):
+    # partial blocks at the edges, and NaN cells, so the chained means are weighted by the valid cells
+    rng = np.random.default_rng(0)
+    values = rng.random((50, 37))
+    values[rng.random(values.shape) < 0.3] = np.nan
+    grid = grid_surface_from_array(values, Affine(2, 0, 0, 0, -2, 100))
+    if chunks is not None:
+        grid = grid.chunk(chunks)
+
+    for method in ('mean', 'min', 'max'):
+        levels = grid_pyramid(grid, n_levels=3, factor=2, method=method)
+        for level, coarse in enumerate(levels[1:], start=1):
+            direct = coarsen_grid(grid, 2 ** level, method=method)
+            assert coarse.rio.transform() == direct.rio.transform()
+            np.testing.assert_allclose(coarse.values, direct.values, rtol=1e-12)
+
+
+def test_resample_bilinear_chunk_by_chunk(tiled_dem):
+    path, values = tiled_dem
+    surface = GridSurfaceIO.from_raster(path, chunks={'x': 128, 'y': 128})
+    fine = surface.resample(resolution=5, chunks=(300, 300))
+
+    assert fine.is_lazy
+    assert fine.surface_data.chunks == ((300, 300, 300, 124), (300, 300, 300, 124))
+    assert fine.bounds == surface.bounds
+    resampled = fine.load().surface_data.values
+    # the values are linear in the rows and columns, away from the nodata cell
+    np.testing.assert_allclose(resampled[500:502, 500:502], [[249999.75, 250000.25], [250499.75, 250500.25]])
+    # the outer half of the edge cells take the edge values
+    assert resampled[-1, -1] == values[-1, -1] and resampled[-1, 2] == values[-1, 0] + 0.75
+    # the nodata cell is left out of the interpolation
+    assert np.isnan(resampled[0, 0]) and resampled[0, 1] == 1
+
+    same = surface.resample(method='nearest').load().surface_data.values
+    np.testing.assert_array_equal(same.ravel()[1:], values.ravel()[1:])
+    shifted = surface.resample(bounds=(900, 1100, 7000, 7200)).load().surface_data.values
+    assert np.isnan(shifted[:8]).all() and np.isnan(shifted[:, :10]).all()
+    np.testing.assert_allclose(shifted[9:, 11:], values[1:12, 1:10])
+
+    like = GridSurfaceIO.from_raster(path).coarsen(2)
+    assert surface.resample(like=like).shape == like.shape
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from affine import Affine
+
+from omf_io.gridsurface import GridSurfaceIO
+from omf_io.gridsurface.importers import grid_surface_from_array
+from omf_io.surface import SurfaceIO
+
+
+@pytest.fixture
+def small_grid():
+    values = np.arange(20, dtype=float).reshape(4, 5)
+    values[1, 1] = np.nan
+    return GridSurfaceIO(grid_surface_from_array(values, Affine(10, 0, 100, 0, -10, 240), crs='EPSG:32750'))
+
+
+def test_grid_to_surface_skips_nodata(small_grid):
+    surface = small_grid.to_surface()
+
+    assert surface.vertices.shape == (19, 3)
+    # two triangles for each of the 12 squares, less the six around the nodata cell
+    assert surface.faces.shape == (18, 3)
+    assert surface.validation_report.is_manifold
+    np.testing.assert_array_equal(surface.vertices[:2], [[105, 235, 0], [115, 235, 1]])
+    corners = surface.vertices[surface.faces]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    assert (normals[:, 2] > 0).all()
+
+
+def test_surface_to_grid_round_trip(small_grid):
+    grid = GridSurfaceIO.from_surface(small_grid.to_surface(), like=small_grid)
+
+    assert grid.surface_data.rio.crs == small_grid.surface_data.rio.crs
+    np.testing.assert_array_equal(grid.surface_data.values, small_grid.surface_data.values)
+
+
+def test_rasterize_interpolates_triangles():
+    # a plane z = x + 2y over the unit square, split into two triangles
+    vertices = np.array([[0, 0, 0], [1, 0, 1], [1, 1, 3], [0, 1, 2]], dtype=float)
+    surface = SurfaceIO(vertices, np.array([[0, 1, 2], [0, 2, 3]]))
+    grid = GridSurfaceIO.from_surface(surface, resolution=0.25, bounds=(-0.5, 1.5, 0, 1))
+
+    assert grid.shape == (4, 8)
+    x, y = np.meshgrid(grid.surface_data.x, grid.surface_data.y)
+    expected = np.where((x > 0) & (x < 1), x + 2 * y, np.nan)
+    np.testing.assert_allclose(grid.surface_data.values, expected)
+
+    # overlapping triangles keep the highest elevation
+    lifted = SurfaceIO(np.vstack([vertices, vertices + [0, 0, 10]]), np.array([[0, 1, 2], [4, 5, 6]]))
+    top = GridSurfaceIO.from_surface(lifted, resolution=0.25, batch_size=3).surface_data.values
+    assert np.nanmin(top) > 10
+
+    with pytest.raises(ValueError, match="resolution"):
+        GridSurfaceIO.from_surface(surface)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.drillhole import DrillholeIO
+from omf_io.lineset import LineSetIO
+from omf_io.pointset import PointSetIO
+
+RADIUS = 100.0
+ARC_LENGTH = RADIUS * np.pi / 2
+
+
+@pytest.fixture
+def drillholes():
+    """Hole A curves from vertical to horizontal (east) on a circle, B is inclined and C is unsurveyed."""
+    collar = pd.DataFrame({'hole_id': ['A', 'B', 'C'], 'x': [0.0, 10.0, 20.0], 'y': [0.0, 0.0, 0.0],
+                           'z': [0.0, 5.0, 0.0], 'max_depth': [ARC_LENGTH, 50.0, np.nan]})
+    survey = pd.DataFrame({'hole_id': ['A', 'B', 'A'], 'depth': [ARC_LENGTH, 10.0, 0.0],
+                           'azimuth': [90.0, 0.0, 90.0], 'dip': [0.0, -30.0, -90.0]})
+    intervals = pd.DataFrame({'hole_id': ['A', 'C', 'C'], 'from': [0.0, 0.0, 10.0], 'to': [ARC_LENGTH, 10.0, 30.0],
+                              'cu': [0.5, 1.0, 2.0]})
+    return DrillholeIO(collar, survey, intervals)
+
+
+def test_desurvey(drillholes):
+    stations = drillholes.desurvey()
+    assert stations['hole_id'].tolist() == ['A', 'A', 'B', 'B', 'C']
+    np.testing.assert_allclose(stations[['x', 'y', 'z']].iloc[1], [RADIUS, 0, -RADIUS], atol=1e-9)
+    # the collar station of B takes the orientation of its first survey
+    np.testing.assert_allclose(stations[['x', 'y', 'z']].iloc[3], [10, 10 * np.cos(np.pi / 6), 0], atol=1e-9)
+
+    # minimum curvature follows the circle between the stations, tangential the direction of the upper station
+    angle = np.pi / 4
+    np.testing.assert_allclose(drillholes.locate(['A'], [ARC_LENGTH / 2]),
+                               [[RADIUS * (1 - np.cos(angle)), 0, -RADIUS * np.sin(angle)]], atol=1e-9)
+    np.testing.assert_allclose(drillholes.locate(['A', 'B'], [ARC_LENGTH, 50.0], method='tangential'),
+                               [[0, 0, -ARC_LENGTH], [10, 50 * np.cos(np.pi / 6), -20]], atol=1e-9)
+    np.testing.assert_array_equal(drillholes.end_depths(), [ARC_LENGTH, 50, 30])
+
+    with pytest.raises(ValueError, match="without a collar"):
+        drillholes.locate(['D'], [1.0])
+    with pytest.raises(ValueError, match="Unsupported desurvey method"):
+        drillholes.desurvey(method='balanced')
+
+
+def test_to_pointset_and_lineset(drillholes):
+    pointset = drillholes.to_pointset()
+    assert isinstance(pointset, PointSetIO)
+    assert pointset.data['cu'].tolist() == [0.5, 1.0, 2.0]
+    np.testing.assert_allclose(pointset.data.index.to_frame().to_numpy(),
+                               [[RADIUS * (1 - np.cos(np.pi / 4)), 0, -RADIUS * np.sin(np.pi / 4)],
+                                [20, 0, -5], [20, 0, -20]], atol=1e-9)
+
+    traces = drillholes.to_lineset(step=10)
+    assert isinstance(traces, LineSetIO)
+    assert traces.segment_attributes['hole_id'].value_counts().to_dict() == {'A': 16, 'B': 5, 'C': 3}
+    # the densified trace of A is close to the length of the arc
+    a_length = traces.segment_lengths()[traces.segment_attributes['hole_id'] == 'A'].sum()
+    assert a_length == pytest.approx(ARC_LENGTH, rel=1e-3)
+    assert traces.vertex_attributes['depth'].max() == pytest.approx(ARC_LENGTH)
+
+    # A from its collar to its end station, B through its survey station to its end, and C straight down
+    assert drillholes.to_lineset().n_segments == 1 + 2 + 1
+
+
+def test_validation_and_csv(drillholes, tmp_path):
+    drillholes.collar.to_csv(tmp_path / 'collar.csv', index=False)
+    drillholes.survey.to_csv(tmp_path / 'survey.csv', index=False)
+    loaded = DrillholeIO.from_csv(tmp_path / 'collar.csv', tmp_path / 'survey.csv')
+    assert loaded.intervals is None
+    pd.testing.assert_frame_equal(loaded.desurvey(), drillholes.desurvey())
+
+    survey = drillholes.survey.assign(dip=[0.0, -30.0, -95.0])
+    with pytest.raises(ValueError, match="dips must be between"):
+        DrillholeIO(drillholes.collar, survey)
+    # a missing survey value would otherwise shift the stations of every later hole
+    survey = drillholes.survey.assign(azimuth=[90.0, np.nan, 90.0])
+    with pytest.raises(ValueError, match=r"missing values in the columns \['azimuth'\]"):
+        DrillholeIO(drillholes.collar, survey)
+    with pytest.raises(ValueError, match="without a collar"):
+        DrillholeIO(drillholes.collar, intervals=pd.DataFrame({'hole_id': ['Z'], 'from': [0.0], 'to': [1.0]}))
+    with pytest.raises(ValueError, match="greater than their 'from'"):
+        DrillholeIO(drillholes.collar, intervals=pd.DataFrame({'hole_id': ['A'], 'from': [2.0], 'to': [1.0]}))
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from omf_io.drillhole import DrillholeIO
+
+
+@pytest.fixture
+def drillholes():
+    """Two vertical holes collared at 100 m, with uneven intervals, a missing grade and a lithology."""
+    collar = pd.DataFrame({'hole_id': ['A', 'B'], 'x': [0.0, 10.0], 'y': [0.0, 0.0], 'z': [100.0, 100.0]})
+    intervals = pd.DataFrame({'hole_id': ['B', 'A', 'A', 'A', 'B'], 'from': [3.0, 0.0, 1.5, 4.0, 2.0],
+                              'to': [7.0, 1.5, 4.0, 5.0, 3.0], 'cu': [6.0, 1.0, 2.0, np.nan, 5.0],
+                              'density': [2.7, 2.0, 3.0, 2.5, 2.7],
+                              'lith': pd.Categorical(['ox', 'ox', 'fr', 'fr', 'ox'])})
+    return DrillholeIO(collar, intervals=intervals)
+
+
+def test_composite_by_length(drillholes):
+    composites = drillholes.composite(length=2).intervals
+
+    assert composites.columns.tolist() == ['hole_id', 'from', 'to', 'coverage', 'cu', 'density', 'lith']
+    assert composites['hole_id'].tolist() == ['A', 'A', 'A', 'B', 'B', 'B']
+    np.testing.assert_array_equal(composites['from'], [0, 2, 4, 2, 4, 6])
+    np.testing.assert_array_equal(composites['coverage'], [2, 2, 1, 2, 2, 1])
+    # length weighted, with the missing grade excluded
+    np.testing.assert_allclose(composites['cu'], [(1 * 1.5 + 2 * 0.5) / 2, 2, np.nan, 5.5, 6, 6])
+    assert composites['lith'].tolist() == ['ox', 'fr', 'fr', 'ox', 'ox', 'ox']
+
+    assert len(drillholes.composite(length=2, min_coverage=0.6).intervals) == 4
+    with pytest.raises(ValueError, match="either a composite length or a bench height"):
+        drillholes.composite(length=2, bench_height=5)
+
+
+def test_composite_weights_and_proportions(drillholes):
+    composites = drillholes.composite(length=2, agg_dict={'cu': 'density'}, cat_treatment='proportions',
+                                      proportions_as_columns=True).intervals
+
+    assert composites.columns.tolist() == ['hole_id', 'from', 'to', 'coverage', 'cu', 'density', 'lith_fr',
+                                           'lith_ox']
+    # weighted by length times density
+    assert composites['cu'].iloc[0] == pytest.approx((1 * 2.0 * 1.5 + 2 * 3.0 * 0.5) / (2.0 * 1.5 + 3.0 * 0.5))
+    # columns outside agg_dict are summed, in proportion to the overlap of each interval
+    assert composites['density'].iloc[0] == pytest.approx(2.0 + 3.0 * 0.5 / 2.5)
+    np.testing.assert_allclose(composites['lith_ox'], [0.75, 0, 0, 1, 1, 1])
+
+    as_dicts = drillholes.composite(length=2, cat_treatment='proportions').intervals['lith']
+    assert as_dicts.iloc[0] == {'fr': 0.25, 'ox': 0.75}
+    with pytest.raises(ValueError, match="'lith' of the aggregation is missing or not numeric"):
+        drillholes.composite(length=2, agg_dict={'lith': None})
+
+
+def test_composite_by_bench(drillholes):
+    # the holes are vertical from 100 m, so benches of 2.5 m from 0 m are 2.5 m long down the holes
+    composites = drillholes.composite(bench_height=2.5)
+
+    assert composites.intervals['hole_id'].tolist() == ['A', 'A', 'B', 'B']
+    np.testing.assert_array_equal(composites.intervals['from'], [0, 2.5, 2.5, 5])
+    # the last bench of B is cut short by the end of the hole
+    np.testing.assert_array_equal(composites.intervals['to'], [2.5, 5, 5, 7])
+    np.testing.assert_allclose(composites.intervals['cu'], [1.4, 2, 5.8, 6])
+
+    # the composites are desurveyed like any intervals
+    midpoints = composites.to_pointset().data.index.to_frame().to_numpy()
+    np.testing.assert_allclose(midpoints[:, 2], [98.75, 96.25, 96.25, 94])
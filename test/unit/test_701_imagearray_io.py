@@ -0,0 +1,74 @@
+import io
+
+import numpy as np
+import omf
+import pytest
+
+from omf_io.imagearray import ImageArrayIO
+from omf_io.reader import OMFReader
+
+
+@pytest.fixture
+def textured_omf(tmp_path):
+    """An OMF file with a 300 x 400 RGB orthophoto projected on a surface, and the image."""
+    rows, cols = np.mgrid[0:300, 0:400]
+    values = np.stack([rows % 256, cols % 256, (rows + cols) % 256], axis=-1).astype(np.uint8)
+    png_file = ImageArrayIO(values).to_file(tmp_path / 'ortho.png')
+    texture = omf.ProjectedTexture(name='ortho', corner=[1000, 2000, 0], axis_u=[400, 0, 0], axis_v=[0, 600, 0],
+                                   image=omf.texture.Image(io.BytesIO(png_file.read_bytes())))
+    surface = omf.Surface(name='topo', vertices=np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=float),
+                          triangles=np.array([[0, 1, 2]]), textures=[texture])
+    omf_file = tmp_path / 'textured.omf'
+    omf.save(omf.Project(name='project', elements=[surface]), str(omf_file))
+    return omf_file, values
+
+
+def test_from_omf_is_lazy(textured_omf):
+    omf_file, values = textured_omf
+    image = ImageArrayIO.from_omf(omf_file, 'ortho')
+
+    assert image.is_lazy
+    assert image.shape == (300, 400, 3)
+    # the first row lies along the far end of axis_v
+    assert image.transform * (0, 0) == (1000, 2600)
+    assert image.transform * (400, 300) == (1400, 2000)
+    np.testing.assert_array_equal(image.read_region(250, 380, 100, 100), values[250:, 380:])
+    tiles = list(image.tiles(128))
+    assert [(row, col) for row, col, _ in tiles[:4]] == [(0, 0), (0, 128), (0, 256), (0, 384)]
+    assert len(tiles) == 12
+    np.testing.assert_array_equal(tiles[-1][2], values[256:, 384:])
+    np.testing.assert_array_equal(image.load().to_numpy(), values)
+
+    with pytest.raises(ValueError, match="not found"):
+        ImageArrayIO.from_omf(omf_file, 'ortho', element_name='other')
+    with pytest.raises(ValueError, match="outside"):
+        image.read_region(300, 0, 1, 1)
+
+
+@pytest.mark.parametrize('suffix', ['.png', '.jpg', '.tif'])
+def test_export_and_import(textured_omf, tmp_path, suffix):
+    omf_file, values = textured_omf
+    output_file = OMFReader(omf_file).export_image_to_file('ortho', tmp_path / f'export{suffix}', blocksize=64)
+
+    image = ImageArrayIO.from_file(output_file)
+    assert image.shape == (300, 400, 3)
+    if suffix == '.jpg':
+        assert np.abs(image.to_numpy().astype(int) - values).mean() < 8
+    else:
+        np.testing.assert_array_equal(image.to_numpy(), values)
+    if suffix == '.tif':
+        assert image.transform * (0, 0) == (1000, 2600)
+
+    downsampled = ImageArrayIO.from_file(output_file, downsample=4)
+    assert not downsampled.is_lazy
+    assert downsampled.shape == (75, 100, 3)
+
+
+def test_alpha_dropped_for_jpeg(tmp_path):
+    values = np.zeros((20, 30, 4), dtype=np.uint8)
+    ImageArrayIO(values).to_file(tmp_path / 'rgba.png')
+    assert ImageArrayIO.from_file(tmp_path / 'rgba.png').shape == (20, 30, 4)
+    ImageArrayIO.from_file(tmp_path / 'rgba.png').to_file(tmp_path / 'rgb.jpg')
+    assert ImageArrayIO.from_file(tmp_path / 'rgb.jpg').shape == (20, 30, 3)
+    with pytest.raises(ValueError, match="Unsupported image format"):
+        ImageArrayIO(values).to_file(tmp_path / 'image.bmp')